@@ -2,12 +2,42 @@
 from flask import Flask, jsonify
 from flask_cors import CORS
 import os
+import logging
+import threading
 from dotenv import load_dotenv
 from pathlib import Path
 
 from config import config_by_name
 from app.routes import recommendations_bp
 from app.models import DataManager
+from app.utils.responses import OrjsonProvider
+
+try:
+    from flask_compress import Compress
+except ImportError:  # Flask-Compress es opcional: sin él las respuestas van sin comprimir
+    Compress = None
+
+logger = logging.getLogger(__name__)
+
+
+def _configure_logging():
+    """Attach a stderr handler to the 'app' logger unless the host already configured logging"""
+    app_logger = logging.getLogger('app')
+    if app_logger.level == logging.NOTSET:
+        app_logger.setLevel(logging.INFO)
+    if app_logger.handlers or logging.getLogger().handlers:
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    app_logger.addHandler(handler)
+
+
+def _warm_data():
+    try:
+        DataManager().warm_up()
+        logger.info("Data fields warmed up")
+    except Exception:
+        logger.exception("Error warming up data fields")
 
 
 def create_app(config_name=None):
@@ -34,22 +64,49 @@ def create_app(config_name=None):
         # Fallback to default search
         load_dotenv()
 
+    _configure_logging()
+
     # Create Flask app
     app = Flask(__name__)
     app.config.from_object(config)
+    if OrjsonProvider is not None:
+        app.json = OrjsonProvider(app)
     
     # Initialize CORS
     CORS(app, resources={r"/api/*": {"origins": config.CORS_ORIGINS}})
     
-    # Load data on startup
+    if Compress is not None:
+        Compress(app)
+    
+    # Solo verificamos el archivo al arrancar; la carga real ocurre una vez por
+    # worker (post-fork) en la primera petición
     try:
-        data_manager = DataManager()
-        if not data_manager.is_ready():
-            print("⚠️ Warning: Data not loaded properly on startup")
+        if DataManager.check_available():
+            logger.info("Data file available; it will be loaded on first request")
         else:
-            print("✓ Data loaded successfully on startup")
-    except Exception as e:
-        print(f"⚠️ Error loading data on startup: {e}")
+            logger.warning("Data file missing or Git LFS pointer; load will be attempted on first request")
+    except Exception:
+        logger.exception("Error checking data on startup")
+
+    data_init_lock = threading.Lock()
+    data_init_state = {'done': False}
+
+    @app.before_request
+    def init_data_once():
+        if data_init_state['done']:
+            return
+        with data_init_lock:
+            if data_init_state['done']:
+                return
+            try:
+                DataManager().ensure_loaded()
+                logger.info("Data loaded successfully")
+                # Los campos se cargan en segundo plano: la primera petición (p. ej. el
+                # frontend) no espera por datos que no usa
+                threading.Thread(target=_warm_data, name='data-warm-up', daemon=True).start()
+            except Exception:
+                logger.exception("Error loading data")
+            data_init_state['done'] = True
     
     # Register blueprints
     app.register_blueprint(recommendations_bp)
@@ -1,83 +1,477 @@
 """Data loader module - Manages loading and caching of processed data"""
+import io
 import os
+import re
+import sys
+import csv
+import hashlib
+import json
+import logging
+import mmap
 import pickle
+import stat
+import struct
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 import pandas as pd
 import numpy as np
+from scipy import sparse
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    from config import Config
+except ImportError:
+    # Importado fuera de la raíz del proyecto: solo quedan DATA_DIR/DATA_URL del entorno
+    Config = None
+
+# httpx solo se necesita si hay que descargar datos; se importa una vez al primer uso
+_httpx = None
+
+
+def _get_httpx():
+    global _httpx
+    if _httpx is None:
+        try:
+            import httpx
+        except Exception as ie:
+            raise RuntimeError(
+                "No se pudo importar httpx para descargar los datos. Instala dependencias con 'pip install -r requirements.txt' o instala httpx ('pip install httpx')."
+            ) from ie
+        _httpx = httpx
+    return _httpx
+
+
+# zstandard solo se necesita para el artefacto comprimido (datos_procesados.pkl.zst)
+_zstd = None
+
+
+def _get_zstd():
+    global _zstd
+    if _zstd is None:
+        try:
+            import zstandard
+        except Exception as ie:
+            raise RuntimeError(
+                "El archivo de datos está comprimido con zstd pero no se pudo importar zstandard. Instálalo con 'pip install zstandard'."
+            ) from ie
+        _zstd = zstandard
+    return _zstd
+
+
+# Formato de artefacto "out-of-band" (pickle protocolo 5):
+#   [magic][uint32 n][uint64 tamaño_header][uint64 tamaños x n][header][padding][buffers alineados]
+# Los buffers de numpy/pandas quedan fuera del header y se reconstruyen sobre un mmap
+OOB_MAGIC = b'PRYSR-OOB1\n'
+_OOB_ALIGN = 64
+
+# Frame zstd (artefacto generado con scripts/convert_pickle.py --zstd)
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Punteros Git LFS y API batch (https://github.com/git-lfs/git-lfs/blob/main/docs/api/batch.md)
+LFS_POINTER_PREFIX = b'version https://git-lfs.github.com/spec/v1'
+_LFS_MEDIA_TYPE = 'application/vnd.git-lfs+json'
+_LFS_OID_RE = re.compile(r'^oid sha256:([0-9a-f]{64})$', re.M)
+_LFS_SIZE_RE = re.compile(r'^size (\d+)$', re.M)
+_GIT_REMOTE_URL_RE = re.compile(r'^\s*url\s*=\s*(\S+)\s*$')
+
+# Descarga por rangos: solo compensa para archivos grandes
+_DOWNLOAD_WORKERS = 8
+_RANGED_MIN_BYTES = 8 << 20
+
+
+def _align(offset: int) -> int:
+    return (offset + _OOB_ALIGN - 1) // _OOB_ALIGN * _OOB_ALIGN
+
+
+def dump_oob_pickle(obj: Any, dest_path: Path) -> None:
+    """Write obj with pickle protocol 5, storing large buffers out-of-band after the header"""
+    buffers: List[pickle.PickleBuffer] = []
+    header = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    raws = [b.raw() for b in buffers]
+    table = struct.pack(f'<IQ{len(raws)}Q', len(raws), len(header), *[r.nbytes for r in raws])
+    with open(dest_path, 'wb') as out:
+        out.write(OOB_MAGIC)
+        out.write(table)
+        out.write(header)
+        pos = len(OOB_MAGIC) + len(table) + len(header)
+        for raw in raws:
+            pad = _align(pos) - pos
+            out.write(b'\0' * pad)
+            out.write(raw)
+            pos += pad + raw.nbytes
+
+
+def _load_oob_pickle(mm: mmap.mmap) -> Any:
+    """Rebuild an out-of-band pickle whose buffers are zero-copy slices of mm"""
+    pos = len(OOB_MAGIC)
+    count, header_len = struct.unpack_from('<IQ', mm, pos)
+    pos += struct.calcsize('<IQ')
+    sizes = struct.unpack_from(f'<{count}Q', mm, pos)
+    pos += 8 * count
+    view = memoryview(mm)
+    header = view[pos:pos + header_len]
+    pos += header_len
+    slices = []
+    for size in sizes:
+        pos = _align(pos)
+        slices.append(view[pos:pos + size])
+        pos += size
+    return pickle.loads(header, buffers=slices)
+
+
+# Artefactos por campo (directorio generado con scripts/split_pickle.py)
+BUNDLE_FILES = {
+    'habilidades': 'habilidades.json',
+    'grupos_bge_ngram': 'grupos_bge_ngram.json',
+    'tfidf_epn_69d': 'tfidf_epn_69d.feather',
+    'tfidf_epn_69d_sparse': 'tfidf_epn_69d.npz',
+    'tfidf_epn_69d_labels': 'tfidf_epn_69d_labels.json',
+    'tfidf_emb_df': 'tfidf_emb_df.feather',
+    'ofertas_por_carrera': 'ofertas_por_carrera.json',
+}
+
+
+# Nombres del artefacto dentro de un directorio, en orden de preferencia
+DATA_FILE_NAMES = ('datos_procesados.pkl.zst', 'datos_procesados.pkl')
+
+
+def _is_bundle_dir(path: Path) -> bool:
+    return path.is_dir() and (path / BUNDLE_FILES['habilidades']).exists()
+
+
+def _dir_entries(directory: Path) -> Dict[str, os.DirEntry]:
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
+
+def _resolve_explicit_path(p: Path) -> Optional[Path]:
+    """DATA_DIR-style path: a data file, a bundle dir, or a dir holding one of DATA_FILE_NAMES"""
+    try:
+        st = p.stat()
+    except (OSError, ValueError):
+        return None
+    if not stat.S_ISDIR(st.st_mode):
+        return p
+    names = _dir_entries(p)
+    if BUNDLE_FILES['habilidades'] in names:
+        return p
+    for name in DATA_FILE_NAMES:
+        if name in names:
+            return p / name
+    return None
+
+
+class _BundleData:
+    """Dict-like view over a per-field artifact directory; each field is read on first access"""
+
+    def __init__(self, bundle_dir: Path):
+        self._dir = bundle_dir
+        self._cache: Dict[str, Any] = {}
+
+    def _read_field(self, key: str) -> Any:
+        path = self._dir / BUNDLE_FILES[key]
+        if not path.exists() and path.suffix == '.feather':
+            # Directorios generados antes del cambio a Feather
+            path = path.with_suffix('.parquet')
+        if not path.exists():
+            return None
+        if path.suffix == '.json':
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        if path.suffix == '.npz':
+            return sparse.load_npz(path)
+        if path.suffix == '.feather':
+            import pyarrow.feather as feather
+            # Feather sin comprimir + split_blocks: las columnas numéricas quedan sobre el mmap
+            table = feather.read_table(path, memory_map=True)
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+        return pd.read_parquet(path, memory_map=True)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in BUNDLE_FILES:
+            return default
+        if key not in self._cache:
+            self._cache[key] = self._read_field(key)
+        value = self._cache[key]
+        return default if value is None else value
+
+    def keys(self):
+        return BUNDLE_FILES.keys()
+
+    def __getitem__(self, key: str) -> Any:
+        return self.get(key)
+
+
+def _compact_frame(df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+    """float32 values and categorical axes for a label-indexed TF-IDF DataFrame"""
+    if df is None:
+        return None
+    if len(df.columns) and all(np.issubdtype(dt, np.floating) for dt in df.dtypes):
+        df = df.astype(np.float32, copy=False)
+    else:
+        df = df.copy(deep=False)
+    df.index = pd.CategoricalIndex(df.index)
+    df.columns = pd.CategoricalIndex(df.columns)
+    return df
+
+
+def _parse_lfs_pointer(path: Path) -> Optional[tuple]:
+    """(oid, size) of a Git LFS pointer file, or None if path is not one"""
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(200)
+    except OSError:
+        return None
+    if not head.startswith(LFS_POINTER_PREFIX):
+        return None
+    text = head.decode('ascii', 'ignore')
+    oid, size = _LFS_OID_RE.search(text), _LFS_SIZE_RE.search(text)
+    if not oid or not size:
+        return None
+    return oid.group(1), int(size.group(1))
+
+
+def _lfs_endpoint(repo_root: Path) -> Optional[str]:
+    """LFS server URL: LFS_URL / Config.LFS_URL, else derived from remote 'origin' in .git/config"""
+    url = os.environ.get('LFS_URL') or getattr(Config, 'LFS_URL', None)
+    if url:
+        return str(url).rstrip('/')
+    try:
+        lines = (repo_root / '.git' / 'config').read_text(encoding='utf-8').splitlines()
+    except OSError:
+        return None
+    in_origin = False
+    remote = None
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith('['):
+            in_origin = stripped == '[remote "origin"]'
+            continue
+        m = _GIT_REMOTE_URL_RE.match(line) if in_origin else None
+        if m:
+            remote = m.group(1)
+            break
+    if not remote:
+        return None
+    # git@host:owner/repo.git y ssh://git@host/owner/repo.git -> https://host/owner/repo.git
+    if remote.startswith('git@'):
+        host, _, repo_path = remote[len('git@'):].partition(':')
+        remote = f'https://{host}/{repo_path}'
+    elif remote.startswith('ssh://'):
+        remote = 'https://' + remote[len('ssh://'):].split('@', 1)[-1]
+    elif not remote.startswith(('https://', 'http://')):
+        return None
+    remote = remote.rstrip('/')
+    if not remote.endswith('.git'):
+        remote += '.git'
+    return remote + '/info/lfs'
+
+
+def _validated_marker(pkl_path: Path) -> Path:
+    # Junto a las cachés de la app y no al lado de los datos, que pueden estar en solo lectura
+    name = hashlib.blake2b(str(pkl_path.resolve()).encode('utf-8'), digest_size=8).hexdigest()
+    return PRECOMPUTED_DIR / 'validated' / f'{name}.ok'
+
+
+def _file_stamp(pkl_path: Path) -> str:
+    st = pkl_path.stat()
+    return f'{st.st_mtime_ns}:{st.st_size}'
+
+
+def _is_validated(pkl_path: Path) -> bool:
+    """True if a previous load left a marker matching the file's current mtime and size"""
+    try:
+        return _validated_marker(pkl_path).read_text().strip() == _file_stamp(pkl_path)
+    except OSError:
+        return False
+
+
+def _mark_validated(pkl_path: Path) -> None:
+    try:
+        marker = _validated_marker(pkl_path)
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.write_text(_file_stamp(pkl_path))
+    except OSError:
+        # Sin caché escribible: se vuelve a verificar en el próximo arranque
+        pass
+
+
+def _advise_sequential(fd: int) -> None:
+    """Hint the kernel that the whole file is about to be read front to back"""
+    # posix_fadvise no existe en macOS/Windows; es solo una pista, los fallos se ignoran
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+
+
+class _SafeReader:
+    """File wrapper that serves large unpickler reads in bounded chunks.
+
+    Mirrors CPython's SAFE_BUF_SIZE approach: a huge BINBYTES/FRAME length is
+    never allocated up front, memory grows only with the bytes actually read.
+    """
+
+    SAFE_BUF_SIZE = 1 << 20
+
+    def __init__(self, f):
+        self._f = f
+
+    def read(self, n: int = -1):
+        if n is None or n < 0 or n <= self.SAFE_BUF_SIZE:
+            return self._f.read(n)
+        buf = bytearray()
+        while len(buf) < n:
+            chunk = self._f.read(min(n - len(buf), self.SAFE_BUF_SIZE))
+            if not chunk:
+                break
+            buf += chunk
+        return buf
+
+    def readinto(self, b) -> int:
+        view = memoryview(b).cast('B')
+        total = 0
+        while total < len(view):
+            got = self._f.readinto(view[total:total + self.SAFE_BUF_SIZE])
+            if not got:
+                break
+            total += got
+        return total
+
+    def readline(self, size: int = -1):
+        return self._f.readline(size)
 
 
 class DataManager:
     """Manages loading and caching of all processed data"""
     
     _instance = None  # Singleton pattern
+    _instance_lock = threading.Lock()
+    _load_lock = threading.Lock()
     _datos_procesados = None
     _is_loaded = False
+    _mmap = None  # Mantiene vivo el mmap del que dependen los arrays zero-copy
+    _offer_bundles: Dict[str, Optional[tuple]] = {}
+    _offer_bundles_lock = threading.Lock()
+    # Campos que usan los endpoints de recomendación (tfidf_emb_df no se precarga)
+    WARM_FIELDS = ('habilidades', 'grupos_bge_ngram', 'tfidf_epn_69d_sparse')
     
     def __new__(cls):
+        # Double-checked locking: sin coste de lock una vez creada la instancia
         if cls._instance is None:
-            cls._instance = super(DataManager, cls).__new__(cls)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = super(DataManager, cls).__new__(cls)
         return cls._instance
     
     def __init__(self):
-        """Initialize data manager"""
-        if not self._is_loaded:
-            self._load_data()
-            self._is_loaded = True
-    
+        """Initialize data manager (data is loaded lazily on first access)"""
+        pass
+
+    @classmethod
+    def _find_data_path(cls) -> Optional[Path]:
+        """Resolve the data file from DATA_DIR, Config.DATA_DIR, app/ or project root"""
+        # Candidate paths (env > config > app > project root)
+        env_path = Path(str(os.environ.get('DATA_DIR', ''))) if os.environ.get('DATA_DIR') else None
+        config_path = Path(Config.DATA_DIR) if hasattr(Config, 'DATA_DIR') else None
+
+        # Rutas explícitas: un solo stat cada una
+        for p in [env_path, config_path]:
+            if p:
+                found = _resolve_explicit_path(p)
+                if found is not None:
+                    return found
+
+        # app/ y la raíz se listan una vez con scandir en lugar de un stat por candidato
+        app_dir = Path(__file__).parent.parent
+        app_names = _dir_entries(app_dir)
+        bundle = app_names.get('datos_procesados')
+        if bundle is not None and bundle.is_dir() and _is_bundle_dir(Path(bundle.path)):
+            return Path(bundle.path)
+        for name in DATA_FILE_NAMES:
+            if name in app_names:
+                return app_dir / name
+        if 'datos_procesados.pkl' in _dir_entries(app_dir.parent):
+            return app_dir.parent / 'datos_procesados.pkl'
+        return None
+
+    @classmethod
+    def check_available(cls) -> bool:
+        """Cheap startup check: the data file exists and is not a Git LFS pointer"""
+        pkl_path = cls._find_data_path()
+        if pkl_path is None:
+            return False
+        if pkl_path.is_dir() or _is_validated(pkl_path):
+            return True
+        try:
+            with open(pkl_path, 'rb') as fb:
+                return not fb.read(64).startswith(b'version https://git-lfs.github.com/spec/v1')
+        except OSError:
+            return False
+
+    def ensure_loaded(self) -> None:
+        """Load the data on first use (only one thread performs the load)"""
+        if self._is_loaded:
+            return
+        with self._load_lock:
+            if not self._is_loaded:
+                self._load_data()
+
+    def warm_up(self, fields: tuple = WARM_FIELDS) -> None:
+        """Load the given fields in parallel; with a per-field bundle each one reads its own file"""
+        self.ensure_loaded()
+        with ThreadPoolExecutor(max_workers=len(fields)) as pool:
+            list(pool.map(lambda name: getattr(self, name), fields))
+        # Derivada de habilidades + grupos_bge_ngram, necesaria en cada vectorización
+        self.group_membership
+
     def _load_data(self) -> None:
         """Load all processed data from pickle file with robust path and LFS/remote fallback"""
         try:
-            # Candidate paths (env > config > app > project root)
-            from config import Config  # local import to avoid cycles
-            env_path = Path(str(os.environ.get('DATA_DIR', ''))) if os.environ.get('DATA_DIR') else None
-            config_path = Path(Config.DATA_DIR) if hasattr(Config, 'DATA_DIR') else None
             app_dir = Path(__file__).parent.parent
-            app_path = app_dir / 'datos_procesados.pkl'
-            root_path = app_dir.parent / 'datos_procesados.pkl'
-
-            # Si DATA_DIR apunta a un directorio, unimos el nombre por defecto
-            norm_candidates = []
-            for p in [env_path, config_path, app_path, root_path]:
-                if not p:
-                    continue
-                try:
-                    if p.exists() and p.is_dir():
-                        norm_candidates.append(p / 'datos_procesados.pkl')
-                    else:
-                        norm_candidates.append(p)
-                except Exception:
-                    # Si falla exists() porque p es inválido, lo omitimos
-                    continue
-
-            candidates = [p for p in norm_candidates if p]
-            pkl_path = None
-            for p in candidates:
-                if p.exists():
-                    pkl_path = p
-                    break
+            pkl_path = self._find_data_path()
 
             if pkl_path is None:
                 # Si no existe el archivo pero tenemos DATA_URL, intentamos descargarlo al app_dir
                 data_url = os.environ.get('DATA_URL') or getattr(Config, 'DATA_URL', None)
                 if data_url:
                     pkl_path = app_dir / 'datos_procesados.pkl'
-                    print(f"Archivo de datos no encontrado. Descargando desde DATA_URL hacia {pkl_path}...")
+                    logger.info("Archivo de datos no encontrado. Descargando desde DATA_URL hacia %s...", pkl_path)
                     self._download_data(data_url, pkl_path)
                 else:
                     raise FileNotFoundError(
                         "datos_procesados.pkl no encontrado en rutas esperadas: DATA_DIR, Config.DATA_DIR, app/, raíz del proyecto"
                     )
 
+            # Directorio de artefactos por campo: cada propiedad carga su archivo al usarse
+            if pkl_path.is_dir():
+                self._datos_procesados = _BundleData(pkl_path)
+                self._is_loaded = True
+                logger.info("Artefactos por campo disponibles en %s", pkl_path)
+                return
+
             # Detect Git LFS pointer file to provide a clear error
+            # (se omite si una carga anterior ya validó este mismo archivo)
+            validated = _is_validated(pkl_path)
             with open(pkl_path, 'rb') as fb:
-                head = fb.read(64)
+                head = b'' if validated else fb.read(64)
                 # LFS pointer files are small text files starting with 'version https://git-lfs.github.com/spec/v1'
                 if head.startswith(b'version https://git-lfs.github.com/spec/v1'):
                     # Try remote download fallback if DATA_URL is provided
                     data_url = os.environ.get('DATA_URL') or getattr(Config, 'DATA_URL', None)
                     if data_url:
-                        print(f"Detectado puntero Git LFS en {pkl_path}. Intentando descargar datos desde DATA_URL...")
+                        logger.warning("Detectado puntero Git LFS en %s. Intentando descargar datos desde DATA_URL...", pkl_path)
                         try:
                             self._download_data(data_url, pkl_path)
                             # Re-check file header
@@ -96,7 +490,8 @@ class DataManager:
                     else:
                         # Intento opcional: si git y git-lfs están disponibles, intentamos un pull automático
                         try:
-                            if self._try_git_lfs_pull(app_dir.parent):
+                            # Primero solo el objeto de este puntero vía API batch; si no, 'git lfs pull'
+                            if self._try_lfs_batch_fetch(pkl_path, app_dir.parent) or self._try_git_lfs_pull(app_dir.parent):
                                 with open(pkl_path, 'rb') as fb3:
                                     chk = fb3.read(64)
                                 if chk.startswith(b'version https://git-lfs.github.com/spec/v1'):
@@ -113,30 +508,145 @@ class DataManager:
                         except Exception as ge:
                             raise RuntimeError(str(ge))
 
-            # Load pickle
-            with open(pkl_path, 'rb') as f:
-                self._datos_procesados = pickle.load(f)
+            # Load pickle (formato out-of-band con mmap o pickle clásico)
+            self._datos_procesados = self._read_pickle(pkl_path)
+            self._is_loaded = True
+            if not validated:
+                _mark_validated(pkl_path)
 
-            print(f"✓ Datos procesados cargados desde {pkl_path}")
+            logger.info("Datos procesados cargados desde %s", pkl_path)
         except Exception as e:
             raise RuntimeError(f"Error cargando datos procesados: {str(e)}")
 
+    def _read_pickle(self, pkl_path: Path) -> Dict[str, Any]:
+        """Deserialize the data file, zero-copy when it uses the out-of-band layout"""
+        with open(pkl_path, 'rb') as f:
+            _advise_sequential(f.fileno())
+            magic = f.read(len(OOB_MAGIC))
+            if magic.startswith(ZSTD_MAGIC):
+                # Descompresión en streaming: nunca se materializa el pickle completo
+                f.seek(0)
+                with _get_zstd().ZstdDecompressor().stream_reader(f) as raw:
+                    buffered = io.BufferedReader(raw, _SafeReader.SAFE_BUF_SIZE)
+                    return pickle.Unpickler(_SafeReader(buffered)).load()
+            if magic != OOB_MAGIC:
+                # Formato legado: unpickler alimentado en bloques de <= 1 MiB
+                f.seek(0)
+                return pickle.Unpickler(_SafeReader(f)).load()
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_WILLNEED'):
+            mm.madvise(mmap.MADV_WILLNEED)
+        # Los arrays reconstruidos apuntan al mmap; no se cierra mientras vivan
+        self._mmap = mm
+        return _load_oob_pickle(mm)
+
     def _download_data(self, url: str, dest_path: Path) -> None:
         """Download the data pickle from a remote URL to the destination path"""
-        # Lazy import to avoid hard dependency when DATA_URL no se usa
-        try:
-            import httpx
-        except Exception as ie:
-            raise RuntimeError(
-                "No se pudo importar httpx para descargar los datos. Instala dependencias con 'pip install -r requirements.txt' o instala httpx ('pip install httpx')."
-            ) from ie
+        httpx = _get_httpx()
 
         dest_path.parent.mkdir(parents=True, exist_ok=True)
-        with httpx.stream('GET', url, timeout=60) as resp:
-            resp.raise_for_status()
-            with open(dest_path, 'wb') as out:
-                for chunk in resp.iter_bytes():
-                    out.write(chunk)
+        with httpx.Client(timeout=60, follow_redirects=True) as client:
+            # Si el servidor acepta rangos, descargamos en paralelo; si no, streaming simple
+            length = 0
+            try:
+                head = client.head(url)
+                if head.is_success and head.headers.get('Accept-Ranges', '').lower() == 'bytes':
+                    length = int(head.headers.get('Content-Length', 0))
+            except (httpx.HTTPError, ValueError):
+                length = 0
+
+            if length >= _RANGED_MIN_BYTES:
+                self._download_ranged(client, url, dest_path, length)
+                return
+
+            with client.stream('GET', url) as resp:
+                resp.raise_for_status()
+                with open(dest_path, 'wb') as out:
+                    for chunk in resp.iter_bytes():
+                        out.write(chunk)
+                    out.flush()
+                    os.fsync(out.fileno())
+
+    def _download_ranged(self, client, url: str, dest_path: Path, length: int) -> None:
+        """Fetch url with concurrent Range requests written into a pre-sized mmap of dest_path"""
+        step = -(-length // _DOWNLOAD_WORKERS)
+        ranges = [(lo, min(lo + step, length)) for lo in range(0, length, step)]
+
+        with open(dest_path, 'w+b') as out:
+            out.truncate(length)
+            mm = mmap.mmap(out.fileno(), length)
+            try:
+                def fetch(span):
+                    lo, hi = span
+                    with client.stream('GET', url, headers={'Range': f'bytes={lo}-{hi - 1}'}) as resp:
+                        resp.raise_for_status()
+                        if resp.status_code != 206:
+                            raise RuntimeError(f"El servidor ignoró el rango {lo}-{hi - 1} (HTTP {resp.status_code})")
+                        pos = lo
+                        for chunk in resp.iter_bytes():
+                            if pos + len(chunk) > hi:
+                                raise RuntimeError(f"Respuesta más larga que el rango {lo}-{hi - 1}")
+                            mm[pos:pos + len(chunk)] = chunk
+                            pos += len(chunk)
+                    if pos != hi:
+                        raise RuntimeError(f"Rango {lo}-{hi - 1} incompleto ({pos - lo} de {hi - lo} bytes)")
+
+                with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+                    list(pool.map(fetch, ranges))
+                mm.flush()
+            finally:
+                mm.close()
+            os.fsync(out.fileno())
+
+    def _try_lfs_batch_fetch(self, pointer_path: Path, repo_root: Path) -> bool:
+        """Replace an LFS pointer with its object fetched through the LFS batch API.
+        Returns True only if the downloaded content matches the pointer's sha256 oid.
+        """
+        pointer = _parse_lfs_pointer(pointer_path)
+        endpoint = _lfs_endpoint(repo_root)
+        if pointer is None or endpoint is None:
+            return False
+        oid, size = pointer
+        tmp = pointer_path.with_name(pointer_path.name + '.part')
+        try:
+            httpx = _get_httpx()
+            lfs_headers = {'Accept': _LFS_MEDIA_TYPE, 'Content-Type': _LFS_MEDIA_TYPE}
+            with httpx.Client(timeout=60, follow_redirects=True) as client:
+                resp = client.post(
+                    endpoint + '/objects/batch',
+                    headers=lfs_headers,
+                    content=json.dumps({
+                        'operation': 'download',
+                        'transfers': ['basic'],
+                        'objects': [{'oid': oid, 'size': size}],
+                    }),
+                )
+                resp.raise_for_status()
+                objects = resp.json().get('objects') or [{}]
+                download = (objects[0].get('actions') or {}).get('download')
+                if not download or not download.get('href'):
+                    return False
+
+                digest = hashlib.sha256()
+                with client.stream('GET', download['href'], headers=download.get('header') or {}) as r:
+                    r.raise_for_status()
+                    with open(tmp, 'wb') as out:
+                        for chunk in r.iter_bytes():
+                            digest.update(chunk)
+                            out.write(chunk)
+                        out.flush()
+                        os.fsync(out.fileno())
+            if digest.hexdigest() != oid:
+                logger.warning("El objeto LFS descargado no coincide con el oid %s", oid)
+                return False
+            os.replace(tmp, pointer_path)
+            return True
+        except Exception as e:
+            logger.warning("Descarga vía API batch de Git LFS fallida (%s): %s", endpoint, e)
+            return False
+        finally:
+            if tmp.exists():
+                tmp.unlink()
 
     def _try_git_lfs_pull(self, repo_root: Path) -> bool:
         """Try to run 'git lfs install' and 'git lfs pull' in the repository root.
@@ -159,45 +669,147 @@ class DataManager:
         except Exception:
             return False
     
-    @property
+    @cached_property
     def habilidades(self) -> list:
         """Get list of all technical skills"""
-        if not self._is_loaded:
-            self._load_data()
+        self.ensure_loaded()
         return self._datos_procesados.get('habilidades', [])
     
-    @property
+    @cached_property
     def grupos_bge_ngram(self) -> Dict[str, list]:
         """Get skill grouping (69 groups)"""
-        if not self._is_loaded:
-            self._load_data()
+        self.ensure_loaded()
         return self._datos_procesados.get('grupos_bge_ngram', {})
-    
-    @property
+
+    @cached_property
+    def group_membership(self) -> sparse.csr_matrix:
+        """(groups × habilidades) CSR counting how many times each skill is listed in each group"""
+        habilidades_idx = {h: i for i, h in enumerate(self.habilidades)}
+        rows, cols = [], []
+        for g, skills in enumerate(self.grupos_bge_ngram.values()):
+            for skill in skills:
+                i = habilidades_idx.get(skill)
+                if i is not None:
+                    rows.append(g)
+                    cols.append(i)
+        # Las entradas repetidas se suman al pasar de COO a CSR
+        return sparse.coo_matrix(
+            (np.ones(len(rows), dtype=np.int64), (rows, cols)),
+            shape=(len(self.grupos_bge_ngram), len(habilidades_idx)),
+        ).tocsr()
+
+    @cached_property
     def tfidf_epn_69d(self) -> pd.DataFrame:
         """Get TF-IDF matrix for academic careers (69 dimensions)"""
-        if not self._is_loaded:
-            self._load_data()
-        return self._datos_procesados.get('tfidf_epn_69d')
+        self.ensure_loaded()
+        df = self._datos_procesados.get('tfidf_epn_69d')
+        if df is None:
+            # Bundle sin Parquet denso: vista DataFrame reconstruida desde la CSR
+            labels = self._datos_procesados.get('tfidf_epn_69d_labels')
+            mat = self._datos_procesados.get('tfidf_epn_69d_sparse')
+            if labels and mat is not None:
+                df = pd.DataFrame(mat.toarray(), index=labels['index'], columns=labels['columns'])
+        return _compact_frame(df)
+
+    @cached_property
+    def tfidf_epn_69d_sparse(self) -> Optional[sparse.csc_matrix]:
+        """Get academic TF-IDF matrix as float32 CSC (69 groups × careers, same axes as tfidf_epn_69d)"""
+        self.ensure_loaded()
+        mat = self._datos_procesados.get('tfidf_epn_69d_sparse')
+        if mat is None:
+            df = self.tfidf_epn_69d
+            if df is None:
+                return None
+            mat = sparse.csr_matrix(df.to_numpy(dtype=np.float32))
+        # CSC: el vector de una carrera es una columna contigua
+        return mat.astype(np.float32, copy=False).tocsc()
+
+    @cached_property
+    def tfidf_epn_69d_careers(self) -> Dict[str, int]:
+        """Career -> column index in tfidf_epn_69d_sparse"""
+        self.ensure_loaded()
+        labels = self._datos_procesados.get('tfidf_epn_69d_labels')
+        if labels:
+            columns = labels['columns']
+        else:
+            df = self.tfidf_epn_69d
+            columns = [] if df is None else [str(c) for c in df.columns]
+        return {carrera: j for j, carrera in enumerate(columns)}
     
-    @property
+    @cached_property
     def ofertas_por_carrera(self) -> Dict[str, int]:
         """Get count of job offers by career"""
-        if not self._is_loaded:
-            self._load_data()
+        self.ensure_loaded()
         return self._datos_procesados.get('ofertas_por_carrera', {})
     
-    @property
+    @cached_property
     def tfidf_emb_df(self) -> pd.DataFrame:
         """Get TF-IDF matrix for job market offers"""
-        if not self._is_loaded:
-            self._load_data()
-        return self._datos_procesados.get('tfidf_emb_df')
+        self.ensure_loaded()
+        return _compact_frame(self._datos_procesados.get('tfidf_emb_df'))
     
+    def get_offer_bundle(self, carrera_académica: str) -> Optional[tuple]:
+        """Precomputed (df_ofertas, vectores_76d) for a career, or None if not built"""
+        if carrera_académica in self._offer_bundles:
+            return self._offer_bundles[carrera_académica]
+        with self._offer_bundles_lock:
+            if carrera_académica not in self._offer_bundles:
+                self._offer_bundles[carrera_académica] = self._read_offer_bundle(carrera_académica)
+        return self._offer_bundles[carrera_académica]
+
+    def _read_offer_bundle(self, carrera_académica: str) -> Optional[tuple]:
+        try:
+            bundle = read_offer_files(*offer_bundle_paths(carrera_académica))
+        except Exception:
+            logger.exception("No se pudieron leer las ofertas precalculadas de %s", carrera_académica)
+            return None
+        if bundle is None:
+            return None
+        # Generado con otros CSV, otro pickle u otro preprocesado: las matrices no sirven
+        try:
+            built_from = offer_bundle_version_path(carrera_académica).read_text(encoding='utf-8')
+        except OSError:
+            built_from = None
+        if built_from != self.offers_version(carrera_académica):
+            logger.warning("Ofertas precalculadas de %s desactualizadas; se ignoran "
+                           "(vuelve a ejecutar scripts/precompute_offers.py)", carrera_académica)
+            return None
+        df, arr = bundle
+        if arr.shape != (len(df), 76):
+            logger.warning("Ofertas precalculadas de %s con forma inesperada %s; se ignoran", carrera_académica, arr.shape)
+            return None
+        if arr.dtype != np.float32:
+            # Generado antes de normalizar las filas en float32: hay que volver a precalcular
+            logger.warning("Ofertas precalculadas de %s en formato antiguo (%s); se ignoran", carrera_académica, arr.dtype)
+            return None
+        return df, arr
+
+    @cached_property
+    def data_version(self) -> str:
+        """Identity of the loaded data file (path, mtime, size) for keying derived caches"""
+        path = self._find_data_path()
+        if path is None:
+            return ''
+        st = path.stat()
+        return f'{path.resolve()}:{st.st_mtime_ns}:{st.st_size}'
+
+    def offers_version(self, carrera_académica: str) -> str:
+        """Identity of a career's vectorized offers: preprocessing version, its CSVs (mtime, size) and the data file"""
+        parts = [str(OFFERS_CACHE_VERSION)]
+        for path in career_csv_paths(carrera_académica):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            parts.append(f'{path}:{st.st_mtime_ns}:{st.st_size}')
+        parts.append(self.data_version)
+        return '|'.join(parts)
+
     def get_all_data(self) -> Dict[str, Any]:
         """Get all processed data"""
-        if not self._is_loaded:
-            self._load_data()
+        self.ensure_loaded()
+        if isinstance(self._datos_procesados, _BundleData):
+            return {key: self._datos_procesados.get(key) for key in BUNDLE_FILES}
         return self._datos_procesados
     
     def is_ready(self) -> bool:
@@ -205,96 +817,249 @@ class DataManager:
         return self._is_loaded and self._datos_procesados is not None
 
 
+_RRA_PREFIX_RE = re.compile(r'^\(RRA\d+\)\s*')
+
+
+def normalize_career_key(carrera: str) -> str:
+    """Canonical lookup key: no '(RRA20)' prefix, no accents, upper-case, single spaces"""
+    s = _RRA_PREFIX_RE.sub('', carrera.strip())
+    s = unicodedata.normalize('NFKD', s).encode('ascii', 'ignore').decode('ascii')
+    return ' '.join(s.upper().split())
+
+
+# Mapping from Excel survey to tfidf_epn_69d column names
+_MAPEO_CARRERAS_RAW = {
+    '(RRA20) COMPUTACIÓN': 'Ingenieria En Ciencias De La Computacion',
+    '(RRA20) AGROINDUSTRIA': 'Ingenieria Agroindustria',
+    '(RRA20) ADMINISTRACIÓN DE EMPRESAS': 'Licenciatura Administracion De Empresas',
+    '(RRA20) INGENIERÍA AMBIENTAL': 'Ingenieria Ambiental',
+    '(RRA20) ECONOMÍA': 'Economia',
+    'INGENIERIA EN CIENCIAS ECONOMICAS Y FINANCIERAS': 'Economia',
+    '(RRA20) ELECTRICIDAD': 'Ingenieria En Electricidad',
+    '(RRA20) ELECTRÓNICA Y AUTOMATIZACIÓN': 'Ingenieria En Electronica Y Automatizacion',
+    '(RRA20) FÍSICA': 'Fisica',
+    'FISICA': 'Fisica',
+    '(RRA20) GEOLOGÍA': 'Ingenieria En Geologia',
+    'INGENIERIA GEOLOGICA': 'Ingenieria En Geologia',
+    '(RRA20) INGENIERÍA DE LA PRODUCCIÓN': 'Ingenieria De La Produccion',
+    '(RRA20) MATEMÁTICA': 'Matematica',
+    '(RRA20) MECÁNICA': 'Ingenieria En Mecanica',
+    'INGENIERIA MECANICA': 'Ingenieria En Mecanica',
+    '(RRA20) PETRÓLEOS': 'Ingenieria En Petroleos',
+    '(RRA20) INGENIERÍA QUÍMICA': 'Ingenieria Quimica',
+    '(RRA20) DESARROLLO DE SOFTWARE': 'Ingenieria En Software',
+    '(RRA20) SOFTWARE': 'Ingenieria En Software',
+    '(RRA20) TELECOMUNICACIONES': 'Ingenieria En Telecomunicaciones',
+    '(RRA20) INGENIERÍA CIVIL': 'Ingenieria Civil',
+    '(RRA20) TECNOLOGÍAS DE LA INFORMACIÓN': 'Ingenieria En Telecomunicacion De La Informacion'
+}
+
+# Claves y valores internados: los nombres de carrera se repiten en cada oferta y petición
+MAPEO_CARRERAS: Dict[str, str] = {
+    sys.intern(k): sys.intern(v) for k, v in _MAPEO_CARRERAS_RAW.items()
+}
+
+# Misma tabla indexada por clave normalizada: '(RRA20) FÍSICA' y 'FISICA' comparten entrada
+_MAPEO_NORMALIZADO: Dict[str, str] = {
+    normalize_career_key(k): v for k, v in MAPEO_CARRERAS.items()
+}
+
+# Mapping from academic career to job offers CSV
+CARRERA_TO_CSV: Dict[str, Any] = {
+    'Ingenieria En Ciencias De La Computacion': 'todas_las_plataformas/Computación/Computación_Merged.csv',
+    'Ingenieria Agroindustria': 'todas_las_plataformas/Agroindustria/Agroindustria_Merged.csv',
+    'Licenciatura Administracion De Empresas': 'todas_las_plataformas/Administración_de_Empresas/Administración_de_Empresas_Merged.csv',
+    'Ingenieria Ambiental': 'todas_las_plataformas/Ingeniería_Ambiental/Ingeniería_Ambiental_Merged.csv',
+    'Economia': 'todas_las_plataformas/Economía/Economía_Merged.csv',
+    'Ingenieria En Electricidad': 'todas_las_plataformas/Electricidad/Electricidad_Merged.csv',
+    'Ingenieria En Electronica Y Automatizacion': 'todas_las_plataformas/Electrónica_y_Automatización/Electrónica_y_Automatización_Merged.csv',
+    'Fisica': 'todas_las_plataformas/Física/Física_Merged.csv',
+    'Ingenieria En Geologia': 'todas_las_plataformas/Geología/Geología_Merged.csv',
+    'Ingenieria De La Produccion': 'todas_las_plataformas/Ingeniería_de_la_Producción/Ingeniería_de_la_Producción_Merged.csv',
+    'Ingenieria En Materiales': 'todas_las_plataformas/Materiales/Materiales_Merged.csv',
+    'Ingenieria En Mecanica': 'todas_las_plataformas/Mecánica/Mecánica_Merged.csv',
+    'Ingenieria En Mecatronica': 'todas_las_plataformas/Mecatrónica/Mecatrónica_Merged.csv',
+    'Ingenieria En Petroleos': 'todas_las_plataformas/Petróleos/Petróleos_Merged.csv',
+    'Ingenieria Quimica': 'todas_las_plataformas/Ingeniería_Química/Ingeniería_Química_Merged.csv',
+    'Ingenieria En Telecomunicaciones': 'todas_las_plataformas/Telecomunicaciones/Telecomunicaciones_Merged.csv',
+    'Ingenieria Civil': 'todas_las_plataformas/Ingeniería_Civil/Ingeniería_Civil_Merged.csv',
+    'Matematica': 'todas_las_plataformas/Matemática/Matemática_Merged.csv',
+    'Matematica Aplicada': 'todas_las_plataformas/Matemática_Aplicada/Matemática_Aplicada_Merged.csv',
+    'Ingenieria En Software': 'todas_las_plataformas/Software/Software_Merged.csv',
+    'Ingenieria En Ciencias De Datos': 'todas_las_plataformas/Ciencia_de_Datos/Ciencia_de_Datos_Merged.csv',
+    # Unificación: Ciencias De Datos E Inteligencia Artificial abarca dos fuentes
+    'Ciencias De Datos E Inteligencia Artificial': [
+        'todas_las_plataformas/Inteligencia_Artificial/Inteligencia_Artificial_Merged.csv',
+        'todas_las_plataformas/Ciencia_de_Datos/Ciencia_de_Datos_Merged.csv'
+    ],
+    'Ingenieria En Sistemas De Informacion': 'todas_las_plataformas/Sistemas_de_Información/Sistemas_de_Información_Merged.csv',
+    # Canonicalizamos a 'Ingenieria En Telecomunicacion De La Informacion' para coincidir con tfidf y encuestas
+    'Ingenieria En Telecomunicacion De La Informacion': 'todas_las_plataformas/Tecnologías_de_la_Información/Tecnologías_de_la_Información_Merged.csv',
+}
+
+# Soft skills labels (7 dimensions)
+SOFT_SKILLS_LABELS: Tuple[str, ...] = (
+    'Gestión',
+    'Comunicación efectiva',
+    'Liderazgo',
+    'Trabajo en equipo',
+    'Ética profesional',
+    'Responsabilidad social',
+    'Aprendizaje autónomo'
+)
+
+
+def map_career(carrera_input: str) -> Optional[str]:
+    """Map career from any format to tfidf_epn_69d format"""
+    return _MAPEO_NORMALIZADO.get(normalize_career_key(carrera_input))
+
+
+def get_career_csv(carrera_académica: str) -> Optional[Any]:
+    """Get CSV file path for job offers of a career"""
+    return CARRERA_TO_CSV.get(carrera_académica)
+
+
+# Vistas derivadas, calculadas una vez al importar (las tablas no cambian en ejecución)
+_AVAILABLE_CAREERS = tuple(CARRERA_TO_CSV.keys())
+_AVAILABLE_FROM_EXCEL = tuple(MAPEO_CARRERAS.keys())
+_AVAILABLE_BY_LOWER = {c.lower(): c for c in _AVAILABLE_CAREERS}
+
+
+def get_available_careers() -> tuple:
+    """Get the available academic careers"""
+    return _AVAILABLE_CAREERS
+
+
+def get_available_careers_from_excel() -> tuple:
+    """Get career names as they appear in Excel"""
+    return _AVAILABLE_FROM_EXCEL
+
+
+def find_available_career(carrera: str) -> Optional[str]:
+    """Case-insensitive exact match against the available academic careers"""
+    return _AVAILABLE_BY_LOWER.get(carrera.lower())
+
+
+# Las rutas de CARRERA_TO_CSV son relativas a la raíz del proyecto
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+def career_csv_paths(carrera_académica: str) -> List[Path]:
+    """Absolute paths of every offers CSV mapped to a career (empty if it has none)"""
+    csv_path = get_career_csv(carrera_académica)
+    if not csv_path:
+        return []
+    csv_paths = csv_path if isinstance(csv_path, list) else [csv_path]
+    return [_PROJECT_ROOT / p for p in csv_paths]
+
+
+def read_offers_csv(csv_path, usecols: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read a job offers CSV with every column as string (same result as pd.read_csv(dtype=str)).
+
+    usecols restricts the result to those columns; names absent from the CSV are skipped.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        if usecols is None:
+            return pd.read_csv(csv_path, dtype=str)
+        wanted = set(usecols)
+        return pd.read_csv(csv_path, dtype=str, usecols=lambda c: c in wanted)
+
+    # Tipos fijados desde la cabecera: Arrow no infiere tipos columna por columna
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        columns = next(csv.reader(f), [])
+    if usecols is not None:
+        wanted = set(usecols)
+        columns = [c for c in columns if c in wanted]
+    table = pacsv.read_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(block_size=1 << 20),
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        convert_options=pacsv.ConvertOptions(
+            column_types={c: pa.string() for c in columns},
+            include_columns=columns if usecols is not None else None,
+            strings_can_be_null=True,
+        ),
+    )
+    return _arrow_to_pandas(table)
+
+
+def _arrow_to_pandas(table) -> pd.DataFrame:
+    df = table.to_pandas(self_destruct=True, split_blocks=True)
+    # Arrow entrega None en los nulos; pandas usa NaN
+    return df.where(df.notna(), np.nan)
+
+
+# Ofertas ya vectorizadas por carrera (scripts/precompute_offers.py)
+PRECOMPUTED_DIR = Path(__file__).resolve().parent.parent / 'precomputed'
+
+
+def _bundle_slug(carrera_académica: str) -> str:
+    return normalize_career_key(carrera_académica).lower().replace(' ', '_')
+
+
+def offer_bundle_paths(carrera_académica: str) -> tuple:
+    """(feather, npy) paths of a career's precomputed offers and 76D matrix"""
+    slug = _bundle_slug(carrera_académica)
+    return PRECOMPUTED_DIR / f'{slug}.feather', PRECOMPUTED_DIR / f'{slug}.npy'
+
+
+def offer_bundle_version_path(carrera_académica: str) -> Path:
+    """Path of the offers_version a career's precomputed bundle was built from"""
+    return PRECOMPUTED_DIR / f'{_bundle_slug(carrera_académica)}.version'
+
+
+# Caché en disco de ofertas vectorizadas por CSV, compartida por todos los workers
+OFFERS_CACHE_DIR = Path(os.environ.get('OFFERS_CACHE_DIR') or PRECOMPUTED_DIR / 'cache')
+
+# Sube cuando cambia el preprocesado de las ofertas: invalida la caché en disco
+OFFERS_CACHE_VERSION = 3
+
+
+def read_offer_files(feather_path: Path, npy_path: Path) -> Optional[tuple]:
+    """Memory-mapped (DataFrame, ndarray) from a feather/npy pair, or None if either is missing"""
+    if not (feather_path.exists() and npy_path.exists()):
+        return None
+    import pyarrow.feather as feather
+    df = _arrow_to_pandas(feather.read_table(feather_path, memory_map=True))
+    arr = np.load(npy_path, mmap_mode='r', allow_pickle=False)
+    return df, arr
+
+
+def write_offer_files(df: pd.DataFrame, arr: np.ndarray, feather_path: Path, npy_path: Path) -> None:
+    """Atomically write a feather/npy pair readable by read_offer_files"""
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    feather_path.parent.mkdir(parents=True, exist_ok=True)
+    # Temporales únicos por proceso: varios workers pueden escribir la misma entrada
+    tmp_feather = feather_path.with_name(f'{feather_path.name}.{os.getpid()}.tmp')
+    tmp_npy = npy_path.with_name(f'{npy_path.name}.{os.getpid()}.tmp')
+    try:
+        # Sin compresión para poder mapear el archivo en memoria
+        feather.write_feather(pa.Table.from_pandas(df, preserve_index=False), tmp_feather,
+                              compression='uncompressed')
+        with open(tmp_npy, 'wb') as f:
+            np.save(f, np.ascontiguousarray(arr), allow_pickle=False)
+        os.replace(tmp_npy, npy_path)
+        os.replace(tmp_feather, feather_path)
+    finally:
+        for tmp in (tmp_feather, tmp_npy):
+            if tmp.exists():
+                tmp.unlink()
+
+
 class CarreraMapper:
-    """Maps career names from various sources"""
-    
-    # Mapping from Excel survey to tfidf_epn_69d column names
-    MAPEO_CARRERAS = {
-        '(RRA20) COMPUTACIÓN': 'Ingenieria En Ciencias De La Computacion',
-        '(RRA20) AGROINDUSTRIA': 'Ingenieria Agroindustria',
-        '(RRA20) ADMINISTRACIÓN DE EMPRESAS': 'Licenciatura Administracion De Empresas',
-        '(RRA20) INGENIERÍA AMBIENTAL': 'Ingenieria Ambiental',
-        '(RRA20) ECONOMÍA': 'Economia',
-        'INGENIERIA EN CIENCIAS ECONOMICAS Y FINANCIERAS': 'Economia',
-        '(RRA20) ELECTRICIDAD': 'Ingenieria En Electricidad',
-        '(RRA20) ELECTRÓNICA Y AUTOMATIZACIÓN': 'Ingenieria En Electronica Y Automatizacion',
-        '(RRA20) FÍSICA': 'Fisica',
-        'FISICA': 'Fisica',
-        '(RRA20) GEOLOGÍA': 'Ingenieria En Geologia',
-        'INGENIERIA GEOLOGICA': 'Ingenieria En Geologia',
-        '(RRA20) INGENIERÍA DE LA PRODUCCIÓN': 'Ingenieria De La Produccion',
-        '(RRA20) MATEMÁTICA': 'Matematica',
-        '(RRA20) MECÁNICA': 'Ingenieria En Mecanica',
-        'INGENIERIA MECANICA': 'Ingenieria En Mecanica',
-        '(RRA20) PETRÓLEOS': 'Ingenieria En Petroleos',
-        '(RRA20) INGENIERÍA QUÍMICA': 'Ingenieria Quimica',
-        '(RRA20) DESARROLLO DE SOFTWARE': 'Ingenieria En Software',
-        '(RRA20) SOFTWARE': 'Ingenieria En Software',
-        '(RRA20) TELECOMUNICACIONES': 'Ingenieria En Telecomunicaciones',
-        '(RRA20) INGENIERÍA CIVIL': 'Ingenieria Civil',
-        '(RRA20) TECNOLOGÍAS DE LA INFORMACIÓN': 'Ingenieria En Telecomunicacion De La Informacion'
-    }
+    """Maps career names from various sources (compat shim over the module-level tables)"""
     
-    # Mapping from academic career to job offers CSV
-    CARRERA_TO_CSV = {
-        'Ingenieria En Ciencias De La Computacion': 'todas_las_plataformas/Computación/Computación_Merged.csv',
-        'Ingenieria Agroindustria': 'todas_las_plataformas/Agroindustria/Agroindustria_Merged.csv',
-        'Licenciatura Administracion De Empresas': 'todas_las_plataformas/Administración_de_Empresas/Administración_de_Empresas_Merged.csv',
-        'Ingenieria Ambiental': 'todas_las_plataformas/Ingeniería_Ambiental/Ingeniería_Ambiental_Merged.csv',
-        'Economia': 'todas_las_plataformas/Economía/Economía_Merged.csv',
-        'Ingenieria En Electricidad': 'todas_las_plataformas/Electricidad/Electricidad_Merged.csv',
-        'Ingenieria En Electronica Y Automatizacion': 'todas_las_plataformas/Electrónica_y_Automatización/Electrónica_y_Automatización_Merged.csv',
-        'Fisica': 'todas_las_plataformas/Física/Física_Merged.csv',
-        'Ingenieria En Geologia': 'todas_las_plataformas/Geología/Geología_Merged.csv',
-        'Ingenieria De La Produccion': 'todas_las_plataformas/Ingeniería_de_la_Producción/Ingeniería_de_la_Producción_Merged.csv',
-        'Ingenieria En Materiales': 'todas_las_plataformas/Materiales/Materiales_Merged.csv',
-        'Ingenieria En Mecanica': 'todas_las_plataformas/Mecánica/Mecánica_Merged.csv',
-        'Ingenieria En Mecatronica': 'todas_las_plataformas/Mecatrónica/Mecatrónica_Merged.csv',
-        'Ingenieria En Petroleos': 'todas_las_plataformas/Petróleos/Petróleos_Merged.csv',
-        'Ingenieria Quimica': 'todas_las_plataformas/Ingeniería_Química/Ingeniería_Química_Merged.csv',
-        'Ingenieria En Telecomunicaciones': 'todas_las_plataformas/Telecomunicaciones/Telecomunicaciones_Merged.csv',
-        'Ingenieria Civil': 'todas_las_plataformas/Ingeniería_Civil/Ingeniería_Civil_Merged.csv',
-        'Matematica': 'todas_las_plataformas/Matemática/Matemática_Merged.csv',
-        'Matematica Aplicada': 'todas_las_plataformas/Matemática_Aplicada/Matemática_Aplicada_Merged.csv',
-        'Ingenieria En Software': 'todas_las_plataformas/Software/Software_Merged.csv',
-        'Ingenieria En Ciencias De Datos': 'todas_las_plataformas/Ciencia_de_Datos/Ciencia_de_Datos_Merged.csv',
-        # Unificación: Ciencias De Datos E Inteligencia Artificial abarca dos fuentes
-        'Ciencias De Datos E Inteligencia Artificial': [
-            'todas_las_plataformas/Inteligencia_Artificial/Inteligencia_Artificial_Merged.csv',
-            'todas_las_plataformas/Ciencia_de_Datos/Ciencia_de_Datos_Merged.csv'
-        ],
-        'Ingenieria En Sistemas De Informacion': 'todas_las_plataformas/Sistemas_de_Información/Sistemas_de_Información_Merged.csv',
-        # Canonicalizamos a 'Ingenieria En Telecomunicacion De La Informacion' para coincidir con tfidf y encuestas
-        'Ingenieria En Telecomunicacion De La Informacion': 'todas_las_plataformas/Tecnologías_de_la_Información/Tecnologías_de_la_Información_Merged.csv',
-    }
-    
-    # Soft skills labels (7 dimensions)
-    SOFT_SKILLS_LABELS = [
-        'Gestión',
-        'Comunicación efectiva',
-        'Liderazgo',
-        'Trabajo en equipo',
-        'Ética profesional',
-        'Responsabilidad social',
-        'Aprendizaje autónomo'
-    ]
-    
-    @classmethod
-    def map_career(cls, carrera_input: str) -> Optional[str]:
-        """Map career from any format to tfidf_epn_69d format"""
-        return cls.MAPEO_CARRERAS.get(carrera_input.strip())
+    MAPEO_CARRERAS = MAPEO_CARRERAS
+    CARRERA_TO_CSV = CARRERA_TO_CSV
+    SOFT_SKILLS_LABELS = SOFT_SKILLS_LABELS
     
-    @classmethod
-    def get_career_csv(cls, carrera_académica: str) -> Optional[str]:
-        """Get CSV file path for job offers of a career"""
-        return cls.CARRERA_TO_CSV.get(carrera_académica)
-    
-    @classmethod
-    def get_available_careers(cls) -> list:
-        """Get list of available academic careers"""
-        return list(cls.CARRERA_TO_CSV.keys())
-    
-    @classmethod
-    def get_available_careers_from_excel(cls) -> list:
-        """Get list of career names as they appear in Excel"""
-        return list(cls.MAPEO_CARRERAS.keys())
+    map_career = staticmethod(map_career)
+    get_career_csv = staticmethod(get_career_csv)
+    get_available_careers = staticmethod(get_available_careers)
+    get_available_careers_from_excel = staticmethod(get_available_careers_from_excel)
+    find_available_career = staticmethod(find_available_career)
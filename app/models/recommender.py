@@ -2,14 +2,178 @@
 import pandas as pd
 import numpy as np
 import os
+import re
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional, Tuple, List
 from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 
-from app.models.data_manager import DataManager, CarreraMapper
+from app.models.data_manager import (
+    DataManager, OFFERS_CACHE_DIR, OFFERS_CACHE_VERSION, career_csv_paths, read_offers_csv, read_offer_files,
+    write_offer_files
+)
 
-# Global cache to persist offers across requests and instances
-_GLOBAL_OFFERS_CACHE: dict = {}
+logger = logging.getLogger(__name__)
+
+class _OffersLRU:
+    """Thread-safe LRU of (df_ofertas, tfidf_69d_array) by CSV path, bounded by entries and bytes"""
+    
+    def __init__(self, maxsize: int, max_bytes: int = 0):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes  # 0 = sin límite de bytes
+        self._data: OrderedDict = OrderedDict()
+        self._sizes: dict = {}
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _entry_bytes(value) -> int:
+        df, arr = value
+        return int(df.memory_usage(index=True, deep=True).sum()) + int(arr.nbytes)
+    
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+    
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._data
+    
+    def __getitem__(self, key):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key, value) -> None:
+        size = self._entry_bytes(value) if self.max_bytes else 0
+        with self._lock:
+            if key in self._data:
+                self._total_bytes -= self._sizes.pop(key)
+                del self._data[key]
+            self._data[key] = value
+            self._sizes[key] = size
+            self._total_bytes += size
+            # Se conserva siempre la entrada recién insertada
+            while len(self._data) > 1 and (
+                len(self._data) > self.maxsize
+                or (self.max_bytes and self._total_bytes > self.max_bytes)
+            ):
+                old_key, old_value = self._data.popitem(last=False)
+                self._total_bytes -= self._sizes.pop(old_key)
+                del old_value  # suelta df y array (y los buffers Arrow/mmap detrás)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+
+
+# Global cache to persist offers across requests and instances (LRU acotado)
+_GLOBAL_OFFERS_CACHE = _OffersLRU(
+    maxsize=max(1, int(os.environ.get('OFFER_CACHE_MAX', 32))),
+    max_bytes=int(os.environ.get('OFFER_CACHE_MAX_BYTES', 0)),
+)
+
+# Resultados ya calculados por (carrera, versión de ofertas, top_n, vector normalizado): reintentos de la UI
+# y la misma consulta desde varias vistas no recalculan similitudes ni deduplicación
+_RECO_CACHE_MAX = max(0, int(os.environ.get('RECO_CACHE_MAX', 256)))
+_GLOBAL_RECO_CACHE: OrderedDict = OrderedDict()
+_RECO_CACHE_LOCK = threading.Lock()
+
+# Únicas columnas de los CSV de ofertas que usa el recomendador
+OFFER_COLUMNS = ['job_title', 'description', 'skills', 'EURACE_skills', 'url']
+
+# Candidatos ordenados de entrada por cada recomendación pedida (margen para duplicados por título)
+_TOP_CANDIDATES_FACTOR = 8
+
+
+def _ranked_indices(similarities: np.ndarray, k: int):
+    """Yield offer indices by descending similarity, fully sorting only the first k up front.
+
+    Ties keep CSV order (the first posting wins).
+    """
+    def by_rank(idx):
+        return idx[np.lexsort((idx, -similarities[idx]))]
+
+    n = len(similarities)
+    if k >= n:
+        yield from np.argsort(-similarities, kind='stable')
+        return
+    # k-ésimo mayor valor en O(N) sin negar el vector completo; los empates con él entran todos en la cabeza
+    kth = similarities[np.argpartition(similarities, n - k)[n - k]]
+    in_head = similarities >= kth
+    yield from by_rank(np.flatnonzero(in_head))
+    # Solo si la deduplicación por título agota la cabeza
+    yield from by_rank(np.flatnonzero(~in_head))
+
+
+# Fila b = las 7 columnas de habilidades blandas (0/1) codificadas en los bits de b
+_SOFT_SKILL_BITS_LUT = ((np.arange(128)[:, None] >> np.arange(7)) & 1).astype(np.float32)
+
+# Mismo patrón de tokens que CountVectorizer(analyzer='word')
+_TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
+_MAX_NGRAM = 5
+
+# Analizador de n-gramas de habilidades compartido entre instancias (por lista de habilidades)
+_GLOBAL_SKILL_ANALYZER: dict = {}
+
+
+def _skill_ngram_analyzer(habilidades: list):
+    """Analyzer yielding only the 1-5 grams that are skills, as CountVectorizer(ngram_range=(1, 5)) would count them.
+
+    Each n-gram is only extended while it is still a prefix of some skill, instead
+    of generating every 1-5 gram of the document and discarding the unknown ones.
+    """
+    key = id(habilidades)
+    analyzer = _GLOBAL_SKILL_ANALYZER.get(key)
+    if analyzer is not None:
+        return analyzer
+
+    vocab = set(habilidades)
+    prefixes = set()
+    for habilidad in habilidades:
+        partes = habilidad.split(' ')
+        for m in range(1, min(len(partes), _MAX_NGRAM) + 1):
+            prefixes.add(' '.join(partes[:m]))
+
+    def analyzer(doc: str) -> list:
+        tokens = _TOKEN_RE.findall(doc.lower())
+        n_tokens = len(tokens)
+        encontrados = []
+        for i in range(n_tokens):
+            ngram = tokens[i]
+            j = i + 1
+            while ngram in prefixes:
+                if ngram in vocab:
+                    encontrados.append(ngram)
+                if j >= n_tokens or j - i >= _MAX_NGRAM:
+                    break
+                ngram = f'{ngram} {tokens[j]}'
+                j += 1
+        return encontrados
+
+    _GLOBAL_SKILL_ANALYZER.clear()
+    _GLOBAL_SKILL_ANALYZER[key] = analyzer
+    return analyzer
+
+
+def _column_values(df: pd.DataFrame, column: str, default: str) -> np.ndarray:
+    """Column as an object array (empty cells as ''), or default for every row if the column is missing"""
+    if column in df.columns:
+        return df[column].fillna('').to_numpy(dtype=object)
+    return np.full(len(df), default, dtype=object)
 
 
 class RecommendationEngine:
@@ -34,8 +198,21 @@ class RecommendationEngine:
             Tuple of (DataFrame with offers, 69D TF-IDF matrix) or None if error
         """
         # Check cache first
-        if csv_path in self._ofertas_cache:
-            return self._ofertas_cache[csv_path]
+        cached = self._ofertas_cache.get(csv_path)
+        if cached is not None:
+            return cached
+        
+        # Luego la caché en disco (otro worker o un arranque anterior ya la vectorizó)
+        disk_paths = self._disk_cache_paths(csv_path)
+        if disk_paths is not None:
+            try:
+                cached = read_offer_files(*disk_paths)
+            except Exception as e:
+                logger.warning("Ignoring unreadable offers cache for %s: %s", csv_path, e)
+                cached = None
+            if cached is not None:
+                self._ofertas_cache[csv_path] = cached
+                return cached
         
         try:
             if not os.path.exists(csv_path):
@@ -43,7 +220,7 @@ class RecommendationEngine:
                 return None
             
             # Load CSV
-            df_ofertas = pd.read_csv(csv_path, dtype=str)
+            df_ofertas = read_offers_csv(csv_path, usecols=OFFER_COLUMNS)
             
             # Validate required columns
             required_cols = {'skills', 'description', 'EURACE_skills'}
@@ -51,33 +228,36 @@ class RecommendationEngine:
                 print(f"Missing required columns in {csv_path}")
                 return None
             
+            # Una sola oferta por título (la primera del CSV) antes de vectorizar
+            if 'job_title' in df_ofertas.columns:
+                df_ofertas = df_ofertas.drop_duplicates(subset=['job_title'], keep='first').reset_index(drop=True)
+            
             # Vectorize job descriptions
             textos = df_ofertas[['skills', 'description']].fillna('').agg(' '.join, axis=1).str.lower().tolist()
             
-            # Create term-document matrix
+            # Create term-document matrix (solo se generan n-gramas que son prefijos de habilidades)
             vectorizer = CountVectorizer(
                 vocabulary=self.habilidades, 
-                analyzer='word', 
-                ngram_range=(1, 5), 
-                lowercase=True
+                analyzer=_skill_ngram_analyzer(self.habilidades)
             )
             X = vectorizer.fit_transform(textos)
-            matriz_td = pd.DataFrame(X.T.toarray(), index=vectorizer.get_feature_names_out())
             
-            # Group by 69 dimensions
-            matriz_69d = pd.DataFrame(0, index=self.grupos_bge_ngram.keys(), columns=range(len(textos)))
-            for label, terms in self.grupos_bge_ngram.items():
-                terms_validos = [t for t in terms if t in matriz_td.index]
-                if terms_validos:
-                    matriz_69d.loc[label] = matriz_td.loc[terms_validos].sum(axis=0)
+            # Group by 69 dimensions: (69 × habilidades) @ (habilidades × ofertas), todo en CSR
+            matriz_69d = self.data_manager.group_membership @ X.T.tocsr()
             
             # Apply TF-IDF
             tfidf = TfidfTransformer(norm='l2')
-            tfidf_69d = tfidf.fit_transform(matriz_69d.values)
-            tfidf_69d_array = tfidf_69d.toarray()  # Convert to dense array
+            tfidf_69d = tfidf.fit_transform(matriz_69d)
+            tfidf_69d_array = tfidf_69d.astype(np.float32).toarray()  # Convert to dense float32 array
             
             # Cache the result
             self._ofertas_cache[csv_path] = (df_ofertas, tfidf_69d_array)
+            if disk_paths is not None:
+                try:
+                    write_offer_files(df_ofertas, tfidf_69d_array, *disk_paths)
+                except OSError as e:
+                    # Disco de solo lectura o lleno: seguimos solo con la caché en memoria
+                    logger.warning("Could not persist offers cache for %s: %s", csv_path, e)
             
             return df_ofertas, tfidf_69d_array
             
@@ -85,29 +265,18 @@ class RecommendationEngine:
             print(f"Error loading offers from {csv_path}: {e}")
             return None
     
-    def _expand_offers_to_76d(self, 
-                             tfidf_69d_array: np.ndarray,
-                             df_ofertas: pd.DataFrame) -> np.ndarray:
-        """
-        Expand 69D job offer vectors to 76D by adding soft skills
-        
-        Args:
-            tfidf_69d_array: 69D TF-IDF vectors (shape: num_offers × 69)
-            df_ofertas: DataFrame with job offer data
-            
-        Returns:
-            76D vectors (shape: num_offers × 76)
-        """
-        num_offers = len(df_ofertas)
-        vectores_76d = np.zeros((num_offers, 76))
-        # Asegurarse de que tfidf_69d_array tiene forma (num_offers, 69)
-        arr = tfidf_69d_array
-        if arr.shape[0] == 69 and arr.shape[1] == num_offers:
-            arr = arr.T  # Transponer si está al revés
-        if arr.shape[0] != num_offers or arr.shape[1] != 69:
-            raise ValueError(f"La matriz TF-IDF de ofertas tiene forma inesperada: {arr.shape}, esperado ({num_offers}, 69)")
-        vectores_76d[:, :69] = arr
-        
+    def _disk_cache_paths(self, csv_path: str) -> Optional[Tuple[Path, Path]]:
+        """Feather/npy cache paths keyed by the CSV (path, mtime, size) and the loaded data file"""
+        try:
+            st = os.stat(csv_path)
+        except OSError:
+            return None
+        key = f'{OFFERS_CACHE_VERSION}:{os.path.abspath(csv_path)}:{st.st_mtime_ns}:{st.st_size}:{self.data_manager.data_version}'
+        name = f'{Path(csv_path).stem}-{hashlib.sha1(key.encode()).hexdigest()[:16]}'
+        return OFFERS_CACHE_DIR / f'{name}.feather', OFFERS_CACHE_DIR / f'{name}.npy'
+    
+    def _add_soft_skills(self, vectores_76d: np.ndarray, df_ofertas: pd.DataFrame) -> None:
+        """Fill columns 69-75 of vectores_76d in place from the offers' EURACE_skills"""
         # Add soft skills (69-75) - search for keywords in EURACE_skills
         soft_skills_keywords = [
             'gestion',
@@ -119,54 +288,45 @@ class RecommendationEngine:
             'aprendizaje'
         ]
         
-        for idx in range(num_offers):
-            eurace_skills = str(df_ofertas.iloc[idx].get('EURACE_skills', '')).lower()
-            
-            for skill_idx, keyword in enumerate(soft_skills_keywords):
-                if keyword in eurace_skills:
-                    vectores_76d[idx, 69 + skill_idx] = 1.0
+        if 'EURACE_skills' not in df_ofertas.columns:
+            return
         
-        return vectores_76d
+        # Las ofertas repiten mucho el mismo texto EURACE: las palabras clave se buscan
+        # una vez por texto distinto y se guardan como bits (bit i = palabra clave i)
+        eurace_skills = df_ofertas['EURACE_skills'].fillna('').astype(str).str.lower()
+        codes, textos_unicos = pd.factorize(eurace_skills)
+        textos_unicos = pd.Series(textos_unicos, dtype=object)
+        bits = np.zeros(len(textos_unicos), dtype=np.uint8)
+        for skill_idx, keyword in enumerate(soft_skills_keywords):
+            bits |= textos_unicos.str.contains(keyword, regex=False).to_numpy(dtype=np.uint8) << skill_idx
+        # Una sola expansión bits -> 7 columnas float32 con la tabla de consulta
+        vectores_76d[:, 69:76] = _SOFT_SKILL_BITS_LUT[bits[codes]]
     
-    def get_recommendations(self, 
-                           student_vector_76d: np.ndarray,
-                           carrera_académica: str,
-                           top_n: int = 5) -> Optional[pd.DataFrame]:
+    def build_offer_vectors(self, carrera_académica: str) -> Optional[Tuple[pd.DataFrame, np.ndarray]]:
         """
-        Get job recommendations for a student
+        Load and vectorize all job offers of a career into 76D
         
         Args:
-            student_vector_76d: Student vector (76 dimensions)
             carrera_académica: Academic career name
-            top_n: Number of recommendations to return
             
         Returns:
-            DataFrame with recommendations or None if error
+            Tuple of (merged offers DataFrame, 76D matrix) or None if no offers
         """
-        # Validate input
-        if not isinstance(student_vector_76d, np.ndarray) or len(student_vector_76d) != 76:
-            return None
-        
-        if top_n < 1:
-            top_n = 5
-        
-        # Get CSV path(s) for this career (supports single path or list of paths)
-        csv_path = CarreraMapper.get_career_csv(carrera_académica)
-        if not csv_path:
+        # CSV(s) de la carrera (una o varias fuentes), con rutas absolutas
+        full_paths = [str(p) for p in career_csv_paths(carrera_académica)]
+        if not full_paths:
             return None
 
-        # Normalize to list of paths
-        csv_paths = csv_path if isinstance(csv_path, list) else [csv_path]
+        # Load and vectorize offers from all sources (in parallel when several), then merge
+        if len(full_paths) > 1:
+            with ThreadPoolExecutor(max_workers=len(full_paths)) as pool:
+                results = list(pool.map(self._load_job_offers, full_paths))
+        else:
+            results = [self._load_job_offers(p) for p in full_paths]
 
-        # Make paths absolute (relative to project root)
-        backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        full_paths = [os.path.join(backend_dir, p) for p in csv_paths]
-
-        # Load and vectorize offers from all sources, then merge
         df_list = []
         arr_list = []
-        for csv_full_path in full_paths:
-            result = self._load_job_offers(csv_full_path)
+        for result in results:
             if result is None:
                 continue
             df, arr = result
@@ -179,18 +339,134 @@ class RecommendationEngine:
         if not df_list:
             return None
 
-        # Concatenate DataFrames and TF-IDF arrays
-        df_ofertas = pd.concat(df_list, ignore_index=True)
-        tfidf_69d_array = np.vstack(arr_list)
+        # Cada fuente se copia directamente a su bloque de la matriz 76D (sin vstack intermedio)
+        vectores_76d = np.zeros((sum(len(df) for df in df_list), 76), dtype=np.float32)
+        inicio = 0
+        for df, arr in zip(df_list, arr_list):
+            if arr.shape != (len(df), 69):
+                raise ValueError(f"La matriz TF-IDF de ofertas tiene forma inesperada: {arr.shape}, esperado ({len(df)}, 69)")
+            np.copyto(vectores_76d[inicio:inicio + len(df), :69], arr)
+            inicio += len(df)
+        
+        # Una sola fuente: el DataFrame cacheado se usa tal cual, sin copiarlo
+        df_ofertas = df_list[0] if len(df_list) == 1 else pd.concat(df_list, ignore_index=True)
+        
+        # Add soft skills (69-75)
+        self._add_soft_skills(vectores_76d, df_ofertas)
+        
+        # Filas normalizadas (L2): la similitud coseno queda como un solo producto matriz-vector
+        vectores_76d /= np.linalg.norm(vectores_76d, axis=1, keepdims=True) + 1e-12
+        return df_ofertas, vectores_76d
+    
+    def get_recommendations(self, 
+                           student_vector_76d: np.ndarray,
+                           carrera_académica: str,
+                           top_n: int = 5) -> Optional[pd.DataFrame]:
+        """
+        Get job recommendations for a student
+        
+        Args:
+            student_vector_76d: Student vector (76 dimensions)
+            carrera_académica: Academic career name
+            top_n: Number of recommendations to return
+            
+        Returns:
+            DataFrame with recommendations or None if error
+        """
+        return self.get_recommendations_batch([student_vector_76d], carrera_académica, [top_n])[0]
+    
+    def get_recommendations_batch(self,
+                                  student_vectors: List[np.ndarray],
+                                  carrera_académica: str,
+                                  top_ns: List[int]) -> List[Optional[pd.DataFrame]]:
+        """
+        Get job recommendations for several student vectors of the same career
         
-        # Expand to 76D
-        vectores_76d = self._expand_offers_to_76d(tfidf_69d_array, df_ofertas)
+        All vectors not already memoized are scored against the offer matrix
+        with a single matrix product.
         
-        # Calculate cosine similarity
-        similarities = cosine_similarity([student_vector_76d], vectores_76d)[0]
+        Args:
+            student_vectors: Student vectors (76 dimensions each)
+            carrera_académica: Academic career name
+            top_ns: Number of recommendations to return for each vector
+            
+        Returns:
+            One DataFrame with recommendations (or None if error) per vector
+        """
+        resultados: List[Optional[pd.DataFrame]] = [None] * len(student_vectors)
+        
+        # Validate input
+        validos = [
+            i for i, v in enumerate(student_vectors)
+            if isinstance(v, np.ndarray) and len(v) == 76
+        ]
+        if not validos:
+            return resultados
+        top_ns = [top_n if top_n >= 1 else 5 for top_n in top_ns]
+        # Misma versión de ofertas (CSV, pickle y preprocesado) -> mismo resultado
+        offers_version = self.data_manager.offers_version(carrera_académica)
+        
+        # Student vectors normalized like the offer rows (L2, float32)
+        pendientes = []
+        for i in validos:
+            sv = student_vectors[i].astype(np.float32)
+            sv /= np.linalg.norm(sv) + 1e-12
+            cache_key = (carrera_académica, offers_version, top_ns[i],
+                         hashlib.blake2b(sv.tobytes(), digest_size=16).digest())
+            with _RECO_CACHE_LOCK:
+                cached = _GLOBAL_RECO_CACHE.get(cache_key)
+                if cached is not None:
+                    _GLOBAL_RECO_CACHE.move_to_end(cache_key)
+            if cached is not None:
+                resultados[i] = cached.copy()
+            else:
+                pendientes.append((i, sv, cache_key))
+        if not pendientes:
+            return resultados
+        
+        # Ofertas precalculadas (scripts/precompute_offers.py); si no existen se vectoriza aquí
+        bundle = self.data_manager.get_offer_bundle(carrera_académica)
+        if bundle is None:
+            bundle = self.build_offer_vectors(carrera_académica)
+        if bundle is None:
+            return resultados
+        df_ofertas, vectores_76d = bundle
+        
+        # Calculate cosine similarity (offer rows are already L2-normalized float32):
+        # one product for every pending vector, each row of the result is one student
+        if len(pendientes) == 1:
+            similarities_all = (vectores_76d @ pendientes[0][1])[None, :]
+        else:
+            similarities_all = np.stack([sv for _, sv, _ in pendientes]) @ vectores_76d.T
+        
+        # Columnas como arrays una sola vez: sin construir una Series por fila
+        columnas = (
+            _column_values(df_ofertas, 'job_title', 'N/A'),
+            _column_values(df_ofertas, 'description', ''),
+            _column_values(df_ofertas, 'EURACE_skills', 'N/A'),
+            _column_values(df_ofertas, 'skills', 'N/A'),
+            _column_values(df_ofertas, 'url', ''),
+        )
+        
+        for (i, _, cache_key), similarities in zip(pendientes, similarities_all):
+            recomendaciones_df = self._top_unique_offers(similarities, columnas, top_ns[i])
+            if recomendaciones_df is None:
+                continue
+            if _RECO_CACHE_MAX:
+                with _RECO_CACHE_LOCK:
+                    _GLOBAL_RECO_CACHE[cache_key] = recomendaciones_df
+                    _GLOBAL_RECO_CACHE.move_to_end(cache_key)
+                    while len(_GLOBAL_RECO_CACHE) > _RECO_CACHE_MAX:
+                        _GLOBAL_RECO_CACHE.popitem(last=False)
+            resultados[i] = recomendaciones_df.copy()
+        return resultados
+    
+    def _top_unique_offers(self, similarities: np.ndarray, columnas: tuple, top_n: int) -> Optional[pd.DataFrame]:
+        """Top N offers by similarity with one offer per job title"""
+        titles, descs, eurace, skills_col, urls = columnas
         
-        # Sort by similarity (descending)
-        indices_ordenados = np.argsort(similarities)[::-1]
+        # Sort by similarity (descending); argpartition avoids sorting every offer
+        indices_ordenados = _ranked_indices(similarities, top_n * _TOP_CANDIDATES_FACTOR)
         
         # Get top N unique offers (avoid duplicates by job title)
         resultado = []
@@ -200,13 +476,13 @@ class RecommendationEngine:
             if len(resultado) >= top_n:
                 break
             
-            cargo_titulo = str(df_ofertas.iloc[idx_oferta].get('job_title', 'N/A'))
+            cargo_titulo = str(titles[idx_oferta])
             
             # Avoid duplicates
             if cargo_titulo not in cargos_vistas:
                 cargos_vistas.add(cargo_titulo)
                 
-                descripcion = str(df_ofertas.iloc[idx_oferta].get('description', ''))
+                descripcion = str(descs[idx_oferta])
                 if len(descripcion) > 100:
                     descripcion = descripcion[:100] + '...'
                 
@@ -215,9 +491,9 @@ class RecommendationEngine:
                     'similitud': float(similarities[idx_oferta]),
                     'cargo': cargo_titulo,
                     'descripcion': descripcion,
-                    'eurace_skills': str(df_ofertas.iloc[idx_oferta].get('EURACE_skills', 'N/A')),
-                    'skills': str(df_ofertas.iloc[idx_oferta].get('skills', 'N/A'))[:100] + '...',
-                    'url': str(df_ofertas.iloc[idx_oferta].get('url', '')).strip()
+                    'eurace_skills': str(eurace[idx_oferta]),
+                    'skills': str(skills_col[idx_oferta])[:100] + '...',
+                    'url': str(urls[idx_oferta]).strip()
                 })
         
         if not resultado:
@@ -226,5 +502,7 @@ class RecommendationEngine:
         return pd.DataFrame(resultado)
     
     def clear_cache(self) -> None:
-        """Clear the job offers cache"""
+        """Clear the job offers and recommendations caches"""
         self._ofertas_cache.clear()
+        with _RECO_CACHE_LOCK:
+            _GLOBAL_RECO_CACHE.clear()
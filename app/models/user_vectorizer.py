@@ -4,10 +4,30 @@ import pandas as pd
 import re
 from typing import Optional, List, Tuple
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
+from sklearn.utils.extmath import safe_sparse_dot
 
 from app.models.data_manager import DataManager, CarreraMapper
 
+# Vectorizador de habilidades y matriz de habilidades ya transformada, compartidos
+# entre peticiones (UserVectorizer se instancia en cada una)
+_GLOBAL_SKILL_INDEX: dict = {}
+
+# Separadores de la lista de asignaturas
+_ITEM_SEP_RE = re.compile(r',|;|/|\n')
+
+
+def _build_skill_index(habilidades: list, group_membership) -> dict:
+    vectorizer = TfidfVectorizer().fit(habilidades)
+    return {
+        'vectorizer': vectorizer,
+        # Filas normalizadas una vez: el producto con la asignatura normalizada es la similitud coseno
+        'H': normalize(vectorizer.transform(habilidades)),
+        'habilidades_arr': np.array(habilidades, dtype=object),
+        # Columna j = grupos (de los 69) que listan la habilidad j
+        'skill_groups': group_membership.tocsc(),
+    }
+
 
 class UserVectorizer:
     """Vectorizes user data into 76-dimensional vectors (69 technical + 7 soft skills)"""
@@ -16,10 +36,22 @@ class UserVectorizer:
         self.data_manager = DataManager()
         self.habilidades = self.data_manager.habilidades
         self.grupos_bge_ngram = self.data_manager.grupos_bge_ngram
-        self.tfidf_epn_69d = self.data_manager.tfidf_epn_69d
-        
-        # Initialize TF-IDF vectorizer for soft skill similarity search
-        self.vectorizer = TfidfVectorizer().fit(self.habilidades)
+        # Matriz académica dispersa (columna = carrera) y su índice de columnas
+        self.tfidf_epn_69d_sparse = self.data_manager.tfidf_epn_69d_sparse
+        self._career_columns = self.data_manager.tfidf_epn_69d_careers
+        
+        # TF-IDF vectorizer for skill similarity search (fitted once per process)
+        key = id(self.habilidades)
+        if key not in _GLOBAL_SKILL_INDEX:
+            _GLOBAL_SKILL_INDEX.clear()
+            _GLOBAL_SKILL_INDEX[key] = _build_skill_index(
+                self.habilidades, self.data_manager.group_membership
+            )
+        index = _GLOBAL_SKILL_INDEX[key]
+        self.vectorizer = index['vectorizer']
+        self._H = index['H']
+        self._habilidades_arr = index['habilidades_arr']
+        self._skill_groups = index['skill_groups']
     
     def get_academic_vector_69d(self, carrera_académica: str) -> Optional[np.ndarray]:
         """
@@ -32,9 +64,10 @@ class UserVectorizer:
             numpy array of shape (69,) or None if career not found
         """
         try:
-            if carrera_académica not in self.tfidf_epn_69d.columns:
+            j = self._career_columns.get(carrera_académica)
+            if j is None:
                 return None
-            return self.tfidf_epn_69d.T.loc[carrera_académica].values
+            return self.tfidf_epn_69d_sparse[:, j].toarray().ravel()
         except Exception as e:
             print(f"Error getting academic vector for {carrera_académica}: {e}")
             return None
@@ -52,7 +85,7 @@ class UserVectorizer:
         if not isinstance(texto, str) or not texto.strip():
             return []
         
-        items = [a.strip().lower() for a in re.split(r',|;|/|\n', texto) if a.strip()]
+        items = [a.strip().lower() for a in _ITEM_SEP_RE.split(texto) if a.strip()]
         return items
     
     def _find_similar_skills(self, asignatura: str, threshold: float = 0.5) -> List[str]:
@@ -70,11 +103,10 @@ class UserVectorizer:
             return []
         
         try:
-            vect_asig = self.vectorizer.transform([asignatura])
-            vect_habs = self.vectorizer.transform(self.habilidades)
-            sims = cosine_similarity(vect_asig, vect_habs).flatten()
+            vect_asig = normalize(self.vectorizer.transform([asignatura]))
+            sims = safe_sparse_dot(vect_asig, self._H.T, dense_output=True).ravel()
             
-            similar_skills = [self.habilidades[i] for i in np.where(sims >= threshold)[0]]
+            similar_skills = self._habilidades_arr[sims >= threshold].tolist()
             return similar_skills
         except Exception as e:
             print(f"Error finding similar skills for '{asignatura}': {e}")
@@ -97,15 +129,23 @@ class UserVectorizer:
         
         vector = vector_base_69d.copy()
         
-        for asignatura in self._normalize_text(asignaturas_relevantes):
-            similar_skills = self._find_similar_skills(asignatura)
-            for skill in similar_skills:
-                try:
-                    skill_idx = self.habilidades.index(skill)
-                    if 0 <= skill_idx < len(vector):
-                        vector[skill_idx] = 0.99  # Set to maximum personalization
-                except ValueError:
-                    continue
+        items = self._normalize_text(asignaturas_relevantes)
+        if not items:
+            return vector
+        
+        try:
+            # Todas las asignaturas en un solo producto (asignaturas × habilidades)
+            vect_items = normalize(self.vectorizer.transform(items))
+            sims = safe_sparse_dot(vect_items, self._H.T, dense_output=True)
+            hits = np.flatnonzero((sims >= 0.5).any(axis=0))
+        except Exception as e:
+            print(f"Error finding similar skills for '{asignaturas_relevantes}': {e}")
+            return vector
+        
+        # Las posiciones del vector son grupos, no habilidades: cada habilidad
+        # encontrada activa los grupos que la contienen
+        group_idx = np.unique(self._skill_groups[:, hits].indices)
+        vector[group_idx[group_idx < len(vector)]] = 0.99  # Set to maximum personalization
         
         return vector
     
@@ -1,16 +1,34 @@
-from flask import Blueprint, send_from_directory
-import os
+from flask import Blueprint, Response, abort, current_app, request
+from pathlib import Path
 
 frontend_bp = Blueprint('frontend', __name__)
 
+# frontend.html en el directorio raíz del proyecto; se lee una vez y se sirve desde memoria
+_FRONTEND_PATH = Path(__file__).resolve().parent.parent.parent / 'frontend.html'
+_frontend_cache = {'mtime': None, 'html': b''}
+
+
+def _frontend_response() -> Response:
+    # En modo debug se vuelve a leer si el archivo cambió en disco
+    if _frontend_cache['mtime'] is None or current_app.debug:
+        try:
+            mtime = _FRONTEND_PATH.stat().st_mtime_ns
+            if mtime != _frontend_cache['mtime']:
+                _frontend_cache['html'] = _FRONTEND_PATH.read_bytes()
+                _frontend_cache['mtime'] = mtime
+        except OSError:
+            abort(404)
+    resp = Response(_frontend_cache['html'], mimetype='text/html')
+    # Mismo soporte de peticiones condicionales (304) que ofrecía send_from_directory
+    resp.set_etag(f"frontend-{_frontend_cache['mtime']}")
+    return resp.make_conditional(request)
+
 @frontend_bp.route('/frontend')
 def serve_frontend():
     # Sirve el archivo frontend.html desde el directorio raíz del proyecto
-    root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
-    return send_from_directory(root_dir, 'frontend.html')
+    return _frontend_response()
 
 @frontend_bp.route('/')
 def serve_root():
     # Redirige la raíz al frontend
-    root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
-    return send_from_directory(root_dir, 'frontend.html')
+    return _frontend_response()
@@ -1,17 +1,392 @@
 """Recommendations API routes"""
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
+from werkzeug.exceptions import RequestEntityTooLarge
+import logging
 import os
 import numpy as np
+import queue
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 from app.models import UserVectorizer, RecommendationEngine, CarreraMapper, DataManager
-from app.utils import validate_request_data, ValidationError, success_response, error_response
+from app.utils import (
+    validate_request_data, ValidationError, success_response, error_response,
+    request_etag, etag_matches, not_modified_response
+)
 from app.utils.ai_personalizer import AIPersonalizer
+from app.utils.responses import APIError, handle_api_error, msgpack, MSGPACK_MIMETYPE, wants_msgpack
 
 recommendations_bp = Blueprint('recommendations', __name__, url_prefix='/api/recommendations')
 
+logger = logging.getLogger(__name__)
 
-@recommendations_bp.route('/predict', methods=['POST'])
+# Configuración del LLM: fija durante la vida del proceso (el .env ya se cargó al
+# importar ai_personalizer)
+_REQUIRE_LLM = os.getenv('AI_PERSONALIZER_REQUIRE_LLM', '').strip().lower() in {'1', 'true', 'yes'}
+_OPENAI_MODEL = os.getenv('OPENAI_MODEL', '')
+# Una petición al LLM por oferta, todas concurrentes, en lugar de un solo prompt por lote
+_LLM_PER_ITEM = os.getenv('AI_LLM_PER_ITEM', '').strip().lower() in {'1', 'true', 'yes'}
+# Máximo de peticiones simultáneas al LLM por grupo de llamadas (límites de RPM del proveedor)
+_AI_MAX_CONCURRENCY = max(1, int(os.getenv('AI_MAX_CONCURRENCY', '8') or 8))
+# Máximo de consultas por petición a /predict/batch
+_PREDICT_BATCH_MAX = 10
+# max-age de las respuestas de /predict (misma entrada y mismos datos -> misma respuesta)
+_PREDICT_CACHE_SECONDS = max(0, int(os.getenv('PREDICT_CACHE_SECONDS', '300') or 0))
+
+# Las carreras disponibles son una tabla estática: se ordenan una sola vez
+_CAREERS_SORTED = tuple(sorted(CarreraMapper.get_available_careers()))
+_CAREERS_PAYLOAD = {
+    'total': len(_CAREERS_SORTED),
+    'careers': list(_CAREERS_SORTED)
+}
+
+# Mapeo de keywords a etiquetas de soft skills
+_SOFT_KW_PAIRS = (
+    ('gestion', 'Gestión'),
+    ('comunicacion', 'Comunicación efectiva'),
+    ('liderazgo', 'Liderazgo'),
+    ('equipo', 'Trabajo en equipo'),
+    ('etica', 'Ética profesional'),
+    ('responsabilidad', 'Responsabilidad social'),
+    ('aprendizaje', 'Aprendizaje autónomo')
+)
+# Columna j de la máscara de keywords = _SOFT_KWS[j] -> etiqueta _SOFT_LABELS[j]
+_SOFT_KWS, _SOFT_LABELS = (tuple(col) for col in zip(*_SOFT_KW_PAIRS))
+
+# Vectorizador, recomendador y personalizador no guardan estado por petición:
+# se crean una vez por proceso (el personalizador construye el cliente de OpenAI)
+_components: dict = {}
+_components_lock = threading.Lock()
+
+
+def _shared(cls):
+    """Process-wide instance of cls, created on first use"""
+    instance = _components.get(cls)
+    if instance is None:
+        with _components_lock:
+            instance = _components.get(cls)
+            if instance is None:
+                instance = _components[cls] = cls()
+    return instance
+
+
+def _run_ai_calls(calls: dict, parallel: bool) -> dict:
+    """Run independent AI calls; with the LLM enabled their round-trips overlap in threads"""
+    if not parallel or len(calls) < 2:
+        return {name: call() for name, call in calls.items()}
+    with ThreadPoolExecutor(max_workers=min(len(calls), _AI_MAX_CONCURRENCY)) as pool:
+        futures = {name: pool.submit(call) for name, call in calls.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _fill_missing_explanations(ai, explicaciones: list, items: list, carrera: str,
+                               asignaturas: str, soft_skills: list, parallel: bool) -> list:
+    """One explanation per item; slots the batch call left empty get a per-item call"""
+    result = [explicaciones[i] if i < len(explicaciones) else '' for i in range(len(items))]
+    calls = {
+        i: (lambda it=items[i]: ai.personalize_description(
+            cargo=it['cargo'],
+            descripcion=it['descripcion'],
+            eurace_skills=it['eurace_skills'],
+            skills=it['skills'],
+            carrera=carrera,
+            asignaturas=asignaturas,
+            soft_skills=soft_skills
+        ))
+        for i, exp in enumerate(result) if not exp
+    }
+    for i, exp in _run_ai_calls(calls, parallel).items():
+        result[i] = exp
+    return result
+
+
+def _records(df) -> list:
+    """Rows as dicts of native Python values, zipping whole-column lists instead of building each row"""
+    cols = df.columns.tolist()
+    dict_ = dict
+    return [dict_(zip(cols, values)) for values in zip(*(df[c].tolist() for c in cols))]
+
+
+def _alt_candidates(alt_df, cargos_iniciales: frozenset, soft_skills: list, top_n: int) -> tuple:
+    """Up to top_n alternative offers not already recommended, each as {'rec': row, 'prompt_item': personalizer input}"""
+    # Descartar cargos ya recomendados y recortar a top_n de forma vectorizada
+    alt_df = alt_df.loc[~alt_df['cargo'].isin(cargos_iniciales)].head(top_n)
+    # Detectar habilidades relevantes en EURACE: una búsqueda vectorizada por keyword
+    eur_lower = alt_df['eurace_skills'].str.lower()
+    kw_mask = np.column_stack([eur_lower.str.contains(kw, regex=False).to_numpy(dtype=bool) for kw in _SOFT_KWS])
+    relevant_per_row = [{_SOFT_LABELS[j] for j in np.flatnonzero(row)} for row in kw_mask]
+    alt_records = []
+    # Obtener labels ordenadas por menor puntuación del usuario
+    pairs_sorted = sorted(zip(CarreraMapper.SOFT_SKILLS_LABELS, soft_skills), key=lambda x: x[1])
+
+    for rd, relevant in zip(_records(alt_df), relevant_per_row):
+        cargo = rd['cargo']
+        # Priorizar sugerir las de menor puntuación del usuario dentro de las relevantes
+        suggest = []
+        if relevant:
+            for lab, score in pairs_sorted:
+                if lab in relevant and score <= 3:
+                    suggest.append(lab)
+                if len(suggest) >= 2:
+                    break
+        # Si no hay relevantes de baja puntuación, sugerir dos de las más bajas en general
+        if not suggest:
+            suggest = [pairs_sorted[0][0]]
+            if len(pairs_sorted) > 1:
+                suggest.append(pairs_sorted[1][0])
+
+        alt_records.append({'rec': rd, 'prompt_item': {
+            'cargo': cargo,
+            'descripcion': rd['descripcion'],
+            'eurace_skills': rd['eurace_skills'],
+            'skills': rd['skills'],
+            'suggest_soft': ', '.join(suggest)
+        }})
+    return alt_records
+
+
+def _cosine_params(recs: list) -> tuple:
+    """Cosine similarity and angle in degrees for every recommendation, in one NumPy pass"""
+    sims = np.array([rec.get('similitud', 0.0) for rec in recs], dtype=np.float64)
+    angs = np.degrees(np.arccos(np.clip(sims, -1.0, 1.0)))
+    return sims.tolist(), angs.tolist()
+
+
+def _request_json() -> tuple:
+    """(parsed JSON or msgpack body, None), or (None, error response) if it is malformed or too large"""
+    # silent: un cuerpo mal formado es un 400, no un 500
+    try:
+        if msgpack is not None and request.mimetype == MSGPACK_MIMETYPE:
+            try:
+                data = msgpack.unpackb(request.get_data(), raw=False)
+            except Exception:
+                data = None
+        else:
+            data = request.get_json(silent=True)
+    except RequestEntityTooLarge:
+        return None, error_response("El cuerpo de la petición es demasiado grande", status_code=413)
+    if data is None:
+        return None, error_response("El cuerpo de la petición debe ser JSON válido", status_code=400)
+    return data, None
+
+
+def _query_value(value: str):
+    """int for an integer query value, otherwise the raw string (validation reports it)"""
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def _request_args() -> dict:
+    """/predict data from the query string: soft_skills as comma-separated ratings"""
+    args = request.args
+    data = {key: args[key] for key in ('carrera', 'asignaturas') if key in args}
+    if 'soft_skills' in args:
+        data['soft_skills'] = [_query_value(v) for v in args['soft_skills'].split(',')]
+    if 'top_n' in args:
+        data['top_n'] = _query_value(args['top_n'])
+    if 'include_alt' in args:
+        data['include_alt'] = args['include_alt'].strip().lower() in {'1', 'true', 'yes'}
+    return data
+
+
+def _predict_input() -> tuple:
+    """(data, validated fields, None) for a valid /predict body (or GET query), or (None, None, error response)"""
+    if request.method == 'GET':
+        data, error = _request_args(), None
+    else:
+        data, error = _request_json()
+    if error is not None:
+        return None, None, error
+    try:
+        return data, validate_request_data(data), None
+    except ValidationError as e:
+        return None, None, error_response(str(e), status_code=400)
+
+
+def _sse(event: str, data) -> str:
+    """One Server-Sent Events message with a JSON payload"""
+    return f"event: {event}\ndata: {current_app.json.dumps(data)}\n\n"
+
+
+def _explanation_events(ai, recomendaciones: list, rec_items: list, carrera: str,
+                        asignaturas: str, soft_skills: list, llm_used: bool):
+    """SSE stream: the cards first, then each explanation as soon as it is ready"""
+    yield _sse('recomendaciones', {
+        'carrera': carrera,
+        'num_recomendaciones': len(recomendaciones),
+        'recomendaciones': recomendaciones,
+        'llm_used': llm_used
+    })
+    if llm_used:
+        # Una petición en streaming por oferta: cada frase sale en cuanto el LLM la
+        # termina y el texto completo al cerrar la oferta, sin esperar al lote
+        events = queue.Queue()
+
+        def explain(idx: int, item: dict) -> None:
+            partes = []
+            try:
+                for frase in ai.personalize_description_stream(
+                    carrera=carrera, asignaturas=asignaturas, soft_skills=soft_skills, **item
+                ):
+                    partes.append(frase)
+                    events.put(('fragmento', {'index': idx, 'texto': frase}))
+            finally:
+                # Siempre se cierra la oferta, para que el stream no quede esperando
+                events.put(('explicacion', {'index': idx, 'explicacion_ai': ' '.join(partes)}))
+
+        with ThreadPoolExecutor(max_workers=min(len(rec_items), _AI_MAX_CONCURRENCY)) as pool:
+            for idx, item in enumerate(rec_items):
+                pool.submit(explain, idx, item)
+            pendientes = len(rec_items)
+            while pendientes:
+                event, data = events.get()
+                if event == 'explicacion':
+                    pendientes -= 1
+                yield _sse(event, data)
+    else:
+        for idx, exp in enumerate(ai.personalize_batch(rec_items, carrera, asignaturas, soft_skills)):
+            yield _sse('explicacion', {'index': idx, 'explicacion_ai': exp})
+    yield _sse('fin', {'llm_used': llm_used})
+
+
+def _predict_payload(fields: tuple, include_alt: bool) -> dict:
+    """/predict data for validated fields; APIError for the failures answered without a 500"""
+    carrera_académica, asignaturas, soft_skills, top_n = fields
+    vectorizer = _shared(UserVectorizer)
+    recommender = _shared(RecommendationEngine)
+    ai = _shared(AIPersonalizer)
+
+    # Create student vector (76d)
+    student_vector_76d = vectorizer.create_vector_76d(
+        carrera_académica=carrera_académica,
+        asignaturas_relevantes=asignaturas,
+        soft_skills_1_to_5=soft_skills
+    )
+    
+    if student_vector_76d is None:
+        raise APIError(
+            f"No se pudo crear el vector para la carrera: {carrera_académica}",
+            status_code=400
+        )
+    
+    if include_alt:
+        # Build an improved vector simulating better soft skills (only indices 69-75, in place)
+        improved_vector = student_vector_76d.copy()
+        soft_tail = improved_vector[69:]
+        np.add(soft_tail, 0.3, out=soft_tail)
+        np.clip(soft_tail, 0.0, 1.0, out=soft_tail)
+        # Current and alternative recommendations, scored in one matrix product
+        recomendaciones_df, alt_df = recommender.get_recommendations_batch(
+            [student_vector_76d, improved_vector],
+            carrera_académica,
+            [top_n, top_n * 2]
+        )
+    else:
+        # Get recommendations (current soft skills)
+        recomendaciones_df = recommender.get_recommendations(
+            student_vector_76d=student_vector_76d,
+            carrera_académica=carrera_académica,
+            top_n=top_n
+        )
+    if recomendaciones_df is None or recomendaciones_df.empty:
+        raise APIError(
+            "No se encontraron recomendaciones",
+            status_code=200
+        )
+
+    # AI personalizer
+    llm_used = ai.is_enabled()
+    # Si se requiere LLM y no está disponible, evitar las plantillas y avisar
+    if _REQUIRE_LLM and not llm_used:
+        raise APIError(
+            "El personalizador con OpenAI está deshabilitado o no pudo inicializarse en este entorno. Revisa OPENAI_API_KEY/OPENAI_MODEL y conectividad.",
+            status_code=503,
+            details=ai.status_details()
+        )
+
+    # Enrich recommendations using a single AI call (batch) for speed
+    recomendaciones = []
+    rec_items = []
+    # Una sola pasada sobre las filas (dicts con tipos nativos, sin Series por fila)
+    for rec in _records(recomendaciones_df):
+        rec_items.append({
+            'cargo': rec['cargo'],
+            'descripcion': rec['descripcion'],
+            'eurace_skills': rec['eurace_skills'],
+            'skills': rec['skills'],
+        })
+        recomendaciones.append(rec)
+
+    # Las llamadas al personalizador son independientes entre sí
+    if llm_used and _LLM_PER_ITEM:
+        # La latencia es la de la oferta más lenta y no la de generar todo el lote
+        main_call = lambda: _fill_missing_explanations(
+            ai, [], rec_items, carrera_académica, asignaturas, soft_skills, parallel=True
+        )
+    else:
+        main_call = lambda: ai.personalize_batch(rec_items, carrera_académica, asignaturas, soft_skills)
+    ai_calls = {'main': main_call}
+    # Todo el camino alternativo solo existe con include_alt
+    if include_alt:
+        # Alternative recommendations emphasizing improved soft skills
+        if alt_df is not None:
+            cargos_iniciales = frozenset(item['cargo'] for item in rec_items)
+            alt_records = _alt_candidates(alt_df, cargos_iniciales, soft_skills, top_n)
+            alt_items = [r['prompt_item'] for r in alt_records]
+            # Sin alternativas nuevas no hay nada que personalizar
+            if alt_items:
+                ai_calls['alt'] = lambda: ai.personalize_alt_batch(alt_items, carrera_académica, asignaturas, soft_skills)
+        # Advice message about soft skills improvement
+        ai_calls['advice'] = lambda: ai.soft_skills_advice(
+            carrera=carrera_académica,
+            asignaturas=asignaturas,
+            soft_skills=soft_skills
+        )
+    ai_results = _run_ai_calls(ai_calls, parallel=llm_used)
+
+    # Fallback por item si batch vino vacío (en paralelo si hay varios)
+    explicaciones = _fill_missing_explanations(
+        ai, ai_results['main'], rec_items, carrera_académica, asignaturas, soft_skills, parallel=llm_used
+    )
+    # Parámetros: ángulo y similitud coseno
+    sims, angs = _cosine_params(recomendaciones)
+    for idx, (rec, exp) in enumerate(zip(recomendaciones, explicaciones)):
+        rec['explicacion_ai'] = exp
+        rec['cosine_similarity'] = sims[idx]
+        rec['cosine_angle_deg'] = angs[idx]
+
+    alt_recomendaciones = []
+    if 'alt' in ai_results:
+        alt_explicaciones = _fill_missing_explanations(
+            ai, ai_results['alt'], alt_items, carrera_académica, asignaturas, soft_skills, parallel=llm_used
+        )
+        alt_recomendaciones = [r['rec'] for r in alt_records]
+        alt_sims, alt_angs = _cosine_params(alt_recomendaciones)
+        alt_rows = zip(alt_recomendaciones, alt_explicaciones, alt_sims, alt_angs)
+        for rank, (rec, exp, sim, ang) in enumerate(alt_rows, start=1):
+            rec['explicacion_ai'] = exp
+            rec['cosine_similarity'] = sim
+            rec['cosine_angle_deg'] = ang
+            rec['rank'] = rank
+
+    consejo_mejora = ai_results.get('advice', '')
+
+    # Return combined payload
+    return {
+        'carrera': carrera_académica,
+        'num_recomendaciones': len(recomendaciones),
+        'recomendaciones': recomendaciones,
+        'mejora_soft_skills_mensaje': consejo_mejora,
+        'recomendaciones_mejorando_soft_skills': alt_recomendaciones,
+        'include_alt': include_alt,
+        'llm_used': llm_used
+    }
+
+
+@recommendations_bp.route('/predict', methods=['GET', 'POST'])
 def get_recommendations():
     """
     Get job recommendations for a student
@@ -24,6 +399,9 @@ def get_recommendations():
         "top_n": 5
     }
     
+    GET form (cacheable when the LLM is disabled):
+    /predict?carrera=...&asignaturas=...&soft_skills=4,5,3,4,4,3,4&top_n=5
+    
     Response:
     {
         "success": true,
@@ -46,214 +424,186 @@ def get_recommendations():
     }
     """
     try:
-        # Get JSON data
-        data = request.get_json() or {}
-        
-        # Validate request data
-        try:
-            carrera_académica, asignaturas, soft_skills, top_n = validate_request_data(data)
-        except ValidationError as e:
-            return error_response(str(e), status_code=400)
+        # Get and validate JSON data
+        data, fields, error = _predict_input()
+        if error is not None:
+            return error
         # Optional: include alternative recommendations (lazy-load for speed)
         include_alt = bool(data.get('include_alt', False))
+        ai = _shared(AIPersonalizer)
+
+        # Con LLM las explicaciones cambian en cada llamada y son de un usuario: no se cachean
+        if ai.is_enabled():
+            return success_response(
+                data=_predict_payload(fields, include_alt),
+                message="Recomendaciones generadas exitosamente",
+                no_store=True
+            )
         
-        # Initialize components
-        vectorizer = UserVectorizer()
-        recommender = RecommendationEngine()
+        # Sin LLM la respuesta depende solo de la entrada validada y de los datos
+        # (pickle y CSV de ofertas de la carrera)
+        etag = request_etag(
+            DataManager().offers_version(fields[0]), fields, include_alt, wants_msgpack()
+        )
+        # 304 solo para GET: en un POST una precondición cumplida no evita la petición
+        is_get = request.method == 'GET'
+        if is_get and etag_matches(etag):
+            return not_modified_response(etag, _PREDICT_CACHE_SECONDS)
         
-        # Create student vector (76d)
-        student_vector_76d = vectorizer.create_vector_76d(
+        return success_response(
+            data=_predict_payload(fields, include_alt),
+            message="Recomendaciones generadas exitosamente",
+            etag=etag,
+            cache_seconds=_PREDICT_CACHE_SECONDS if is_get else None
+        )
+    
+    except APIError as e:
+        return handle_api_error(e)
+    except Exception as e:
+        print(f"Error in get_recommendations: {str(e)}")
+        print(traceback.format_exc())
+        return error_response(
+            "Error interno del servidor",
+            status_code=500,
+            details=str(e)
+        )
+
+
+def _batch_result(item) -> dict:
+    """One /predict/batch entry: the /predict body (success, data) or its error (success, message, status_code)"""
+    try:
+        fields = validate_request_data(item)
+        return {'success': True, 'data': _predict_payload(fields, bool(item.get('include_alt', False)))}
+    except ValidationError as e:
+        return {'success': False, 'message': str(e), 'status_code': 400}
+    except APIError as e:
+        result = {'success': False, 'message': e.message, 'status_code': e.status_code}
+        if e.details:
+            result['details'] = e.details
+        return result
+    except Exception as e:
+        logger.exception("Error in /predict/batch item")
+        return {'success': False, 'message': "Error interno del servidor", 'status_code': 500, 'details': str(e)}
+
+
+@recommendations_bp.route('/predict/batch', methods=['POST'])
+def get_recommendations_batch():
+    """
+    Several /predict requests in one call
+    
+    Request JSON:
+    {
+        "requests": [<cuerpo de /predict>, ...]   (máximo 10)
+    }
+    
+    Response data:
+    {
+        "num_results": 2,
+        "results": [
+            {"success": true, "data": {...}},                              (igual que /predict)
+            {"success": false, "message": "...", "status_code": 400},
+            ...
+        ]
+    }
+    Results come in the same order as the requests; one failing entry does not fail the others.
+    """
+    try:
+        data, error = _request_json()
+        if error is not None:
+            return error
+        items = data.get('requests') if isinstance(data, dict) else None
+        if not isinstance(items, list) or not items:
+            return error_response("El campo 'requests' debe ser una lista no vacía", status_code=400)
+        if len(items) > _PREDICT_BATCH_MAX:
+            return error_response(f"Máximo {_PREDICT_BATCH_MAX} consultas por lote, recibidas {len(items)}", status_code=400)
+
+        results = [_batch_result(item) for item in items]
+        return success_response(
+            data={'num_results': len(results), 'results': results},
+            message="Lote de recomendaciones procesado"
+        )
+
+    except Exception as e:
+        logger.exception("Error in /predict/batch")
+        return error_response(
+            "Error interno del servidor",
+            status_code=500,
+            details=str(e)
+        )
+
+
+@recommendations_bp.route('/predict/stream', methods=['POST'])
+def stream_recommendations():
+    """
+    Same input as /predict (without alternatives), answered as Server-Sent Events
+
+    Events:
+        recomendaciones: the cards without explanation (same fields as /predict)
+        fragmento: {"index": i, "texto": "..."} each sentence of a card's explanation as the LLM writes it
+        explicacion: {"index": i, "explicacion_ai": "..."} per card, as soon as it is ready
+        fin: end of the stream
+    """
+    try:
+        _, fields, error = _predict_input()
+        if error is not None:
+            return error
+        carrera_académica, asignaturas, soft_skills, top_n = fields
+
+        student_vector_76d = _shared(UserVectorizer).create_vector_76d(
             carrera_académica=carrera_académica,
             asignaturas_relevantes=asignaturas,
             soft_skills_1_to_5=soft_skills
         )
-        
         if student_vector_76d is None:
             return error_response(
                 f"No se pudo crear el vector para la carrera: {carrera_académica}",
                 status_code=400
             )
-        
-        # Get recommendations (current soft skills)
-        recomendaciones_df = recommender.get_recommendations(
+        recomendaciones_df = _shared(RecommendationEngine).get_recommendations(
             student_vector_76d=student_vector_76d,
             carrera_académica=carrera_académica,
             top_n=top_n
         )
-        if recomendaciones_df is None:
+        if recomendaciones_df is None or recomendaciones_df.empty:
             return error_response(
                 "No se encontraron recomendaciones",
                 status_code=200
             )
 
-        # AI personalizer
-        ai = AIPersonalizer()
+        ai = _shared(AIPersonalizer)
         llm_used = ai.is_enabled()
-        require_llm = bool(os.getenv('AI_PERSONALIZER_REQUIRE_LLM','').strip().lower() in {'1','true','yes'})
-        # Si se requiere LLM y no está disponible, evitar las plantillas y avisar
-        if require_llm and not llm_used:
+        if _REQUIRE_LLM and not llm_used:
             return error_response(
                 "El personalizador con OpenAI está deshabilitado o no pudo inicializarse en este entorno. Revisa OPENAI_API_KEY/OPENAI_MODEL y conectividad.",
                 status_code=503,
                 details=ai.status_details()
             )
 
-        # Enrich recommendations using a single AI call (batch) for speed
-        recomendaciones = []
-        cargos_iniciales = set()
+        recomendaciones = _records(recomendaciones_df)
+        sims, angs = _cosine_params(recomendaciones)
         rec_items = []
-        for _, row in recomendaciones_df.iterrows():
-            rec = row.to_dict()
-            cargos_iniciales.add(str(rec.get('cargo')))
-            rec_items.append({
-                'cargo': str(rec.get('cargo')),
-                'descripcion': str(rec.get('descripcion')),
-                'eurace_skills': str(rec.get('eurace_skills')),
-                'skills': str(rec.get('skills')),
-            })
-        explicaciones = ai.personalize_batch(rec_items, carrera_académica, asignaturas, soft_skills)
-        for idx, (_, row) in enumerate(recomendaciones_df.iterrows()):
-            rec = row.to_dict()
-            exp = explicaciones[idx] if idx < len(explicaciones) else ''
-            if not exp:
-                # Fallback por item si batch vino vacío
-                exp = ai.personalize_description(
-                    cargo=str(rec.get('cargo')), 
-                    descripcion=str(rec.get('descripcion')), 
-                    eurace_skills=str(rec.get('eurace_skills')), 
-                    skills=str(rec.get('skills')), 
-                    carrera=carrera_académica, 
-                    asignaturas=asignaturas, 
-                    soft_skills=soft_skills
-                )
-            rec['explicacion_ai'] = exp
-            # Parámetros: ángulo y similitud coseno
-            sim = float(rec.get('similitud', 0.0))
-            ang = float(np.degrees(np.arccos(max(min(sim, 1.0), -1.0))))
+        for rec, sim, ang in zip(recomendaciones, sims, angs):
             rec['cosine_similarity'] = sim
             rec['cosine_angle_deg'] = ang
-            recomendaciones.append(rec)
-
-        # Build an improved vector simulating better soft skills (only indices 69-75)
-        improved_vector = student_vector_76d.copy()
-        improved_vector[69:] = np.clip(improved_vector[69:] + 0.3, 0.0, 1.0)
-
-        # Fetch alternative recommendations emphasizing improved soft skills
-        alt_df = None
-        if include_alt:
-            alt_df = recommender.get_recommendations(
-                student_vector_76d=improved_vector,
-                carrera_académica=carrera_académica,
-                top_n=top_n * 2
-            )
-
-        alt_recomendaciones = []
-        if include_alt and alt_df is not None:
-            alt_items = []
-            alt_rows = []
-            # Mapeo de keywords a etiquetas de soft skills
-            soft_kw_map = {
-                'gestion': 'Gestión',
-                'comunicacion': 'Comunicación efectiva',
-                'liderazgo': 'Liderazgo',
-                'equipo': 'Trabajo en equipo',
-                'etica': 'Ética profesional',
-                'responsabilidad': 'Responsabilidad social',
-                'aprendizaje': 'Aprendizaje autónomo'
-            }
-            # Obtener labels ordenadas por menor puntuación del usuario
-            labels = CarreraMapper.SOFT_SKILLS_LABELS
-            pairs = list(zip(labels, soft_skills))
-            pairs_sorted = sorted(pairs, key=lambda x: x[1])
-
-            for _, row in alt_df.iterrows():
-                rd = row.to_dict()
-                cargo = str(rd.get('cargo'))
-                if cargo in cargos_iniciales:
-                    continue
-                eur = str(rd.get('eurace_skills', '')).lower()
-                # Detectar habilidades relevantes en EURACE
-                relevant = []
-                for kw, lab in soft_kw_map.items():
-                    if kw in eur:
-                        relevant.append(lab)
-                # Priorizar sugerir las de menor puntuación del usuario dentro de las relevantes
-                suggest = []
-                if relevant:
-                    for lab, score in pairs_sorted:
-                        if lab in relevant and score <= 3:
-                            suggest.append(lab)
-                        if len(suggest) >= 2:
-                            break
-                # Si no hay relevantes de baja puntuación, sugerir dos de las más bajas en general
-                if not suggest:
-                    suggest = [pairs_sorted[0][0]]
-                    if len(pairs_sorted) > 1:
-                        suggest.append(pairs_sorted[1][0])
-
-                alt_items.append({
-                    'cargo': cargo,
-                    'descripcion': str(rd.get('descripcion')),
-                    'eurace_skills': str(rd.get('eurace_skills')),
-                    'skills': str(rd.get('skills')),
-                    'suggest_soft': ', '.join(suggest)
-                })
-                alt_rows.append(rd)
-                if len(alt_items) >= top_n:
-                    break
-
-            alt_explicaciones = ai.personalize_alt_batch(alt_items, carrera_académica, asignaturas, soft_skills)
-            rank_counter = 1
-            for i in range(len(alt_rows)):
-                rec = alt_rows[i]
-                exp = alt_explicaciones[i] if i < len(alt_explicaciones) else ''
-                if not exp:
-                    exp = ai.personalize_description(
-                        cargo=str(rec.get('cargo')),
-                        descripcion=str(rec.get('descripcion')),
-                        eurace_skills=str(rec.get('eurace_skills')),
-                        skills=str(rec.get('skills')),
-                        carrera=carrera_académica,
-                        asignaturas=asignaturas,
-                        soft_skills=soft_skills
-                    )
-                rec['explicacion_ai'] = exp
-                sim = float(rec.get('similitud', 0.0))
-                ang = float(np.degrees(np.arccos(max(min(sim, 1.0), -1.0))))
-                rec['cosine_similarity'] = sim
-                rec['cosine_angle_deg'] = ang
-                rec['rank'] = rank_counter
-                alt_recomendaciones.append(rec)
-                rank_counter += 1
-
-        # Advice message about soft skills improvement
-        consejo_mejora = ''
-        if include_alt:
-            consejo_mejora = ai.soft_skills_advice(
-                carrera=carrera_académica,
-                asignaturas=asignaturas,
-                soft_skills=soft_skills
-            )
-
-        # Return combined payload
-        payload = {
-            'carrera': carrera_académica,
-            'num_recomendaciones': len(recomendaciones),
-            'recomendaciones': recomendaciones,
-            'mejora_soft_skills_mensaje': consejo_mejora,
-            'recomendaciones_mejorando_soft_skills': alt_recomendaciones,
-            'include_alt': include_alt,
-            'llm_used': llm_used
-        }
+            rec_items.append({
+                'cargo': rec['cargo'],
+                'descripcion': rec['descripcion'],
+                'eurace_skills': rec['eurace_skills'],
+                'skills': rec['skills'],
+            })
 
-        return success_response(
-            data=payload,
-            message="Recomendaciones generadas exitosamente"
+        events = _explanation_events(
+            ai, recomendaciones, rec_items, carrera_académica, asignaturas, soft_skills, llm_used
         )
-    
+        return Response(
+            stream_with_context(events),
+            mimetype='text/event-stream',
+            # Sin caché ni buffering en proxies: cada evento sale en cuanto se genera
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+
     except Exception as e:
-        print(f"Error in get_recommendations: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error in /predict/stream")
         return error_response(
             "Error interno del servidor",
             status_code=500,
@@ -261,18 +611,59 @@ def get_recommendations():
         )
 
 
+def _health_data() -> dict:
+    is_ready = DataManager().is_ready()
+    return {
+        'status': 'healthy' if is_ready else 'not_ready',
+        'data_loaded': is_ready
+    }
+
+
+def _soft_skills_labels_data() -> dict:
+    labels = CarreraMapper.SOFT_SKILLS_LABELS
+    return {
+        'labels': labels,
+        'count': len(labels)
+    }
+
+
+def _api_info_data() -> dict:
+    # LLM status
+    try:
+        ai = _shared(AIPersonalizer)
+        ai_status = ai.is_enabled()
+        ai_diag = ai.status_details()
+    except Exception:
+        ai_status = False
+        ai_diag = {'enabled': False}
+    return {
+        'version': '1.0.0',
+        'name': 'Sistema de Recomendación de Ofertas Laborales',
+        'description': 'API que proporciona recomendaciones de ofertas laborales basadas en vectores de estudiantes',
+        'features': [
+            'Vectorización de usuarios (76 dimensiones)',
+            'Personalización por asignaturas relevantes',
+            'Evaluación de habilidades blandas',
+            'Cálculo de similitud coseno con ofertas laborales',
+            'Ranking de recomendaciones'
+        ],
+        'technical_skills_dimensions': 69,
+        'soft_skills_dimensions': 7,
+        'total_dimensions': 76,
+        'available_careers_count': len(CarreraMapper.get_available_careers()),
+        'llm_enabled': ai_status,
+        'llm_required': _REQUIRE_LLM,
+        'openai_model': _OPENAI_MODEL,
+        'llm_status_details': ai_diag
+    }
+
+
 @recommendations_bp.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
     try:
-        data_manager = DataManager()
-        is_ready = data_manager.is_ready()
-        
         return success_response(
-            data={
-                'status': 'healthy' if is_ready else 'not_ready',
-                'data_loaded': is_ready
-            },
+            data=_health_data(),
             message="Health check passed"
         )
     except Exception as e:
@@ -303,13 +694,8 @@ def get_available_careers():
     }
     """
     try:
-        careers = CarreraMapper.get_available_careers()
-        
         return success_response(
-            data={
-                'total': len(careers),
-                'careers': sorted(careers)
-            },
+            data=_CAREERS_PAYLOAD,
             message="Carreras obtenidas exitosamente"
         )
     except Exception as e:
@@ -335,13 +721,8 @@ def get_soft_skills_labels():
     }
     """
     try:
-        labels = CarreraMapper.SOFT_SKILLS_LABELS
-        
         return success_response(
-            data={
-                'labels': labels,
-                'count': len(labels)
-            },
+            data=_soft_skills_labels_data(),
             message="Soft skills labels obtenidos exitosamente"
         )
     except Exception as e:
@@ -369,39 +750,45 @@ def get_api_info():
     }
     """
     try:
-        # LLM status
-        try:
-            ai = AIPersonalizer()
-            ai_status = ai.is_enabled()
-            ai_diag = ai.status_details()
-        except Exception:
-            ai_status = False
-            ai_diag = {'enabled': False}
-        info = {
-            'version': '1.0.0',
-            'name': 'Sistema de Recomendación de Ofertas Laborales',
-            'description': 'API que proporciona recomendaciones de ofertas laborales basadas en vectores de estudiantes',
-            'features': [
-                'Vectorización de usuarios (76 dimensiones)',
-                'Personalización por asignaturas relevantes',
-                'Evaluación de habilidades blandas',
-                'Cálculo de similitud coseno con ofertas laborales',
-                'Ranking de recomendaciones'
-            ],
-            'technical_skills_dimensions': 69,
-            'soft_skills_dimensions': 7,
-            'total_dimensions': 76,
-            'available_careers_count': len(CarreraMapper.get_available_careers()),
-            'llm_enabled': ai_status,
-            'llm_required': bool(os.getenv('AI_PERSONALIZER_REQUIRE_LLM','').strip().lower() in {'1','true','yes'}),
-            'openai_model': os.getenv('OPENAI_MODEL', ''),
-            'llm_status_details': ai_diag
-        }
-        
-        return success_response(data=info, message="API info retrieved successfully")
+        return success_response(data=_api_info_data(), message="API info retrieved successfully")
     except Exception as e:
         return error_response(
             "Error obteniendo información de API",
             status_code=500,
             details=str(e)
         )
+
+
+@recommendations_bp.route('/meta', methods=['GET'])
+def get_meta():
+    """
+    Health, careers, soft skills labels and API info in a single request
+    
+    Response:
+    {
+        "success": true,
+        "message": "Success",
+        "data": {
+            "health": {...},             # data de /health
+            "careers": {...},            # data de /careers
+            "soft_skills_labels": {...}, # data de /soft-skills-labels
+            "info": {...}                # data de /info
+        }
+    }
+    """
+    try:
+        return success_response(
+            data={
+                'health': _health_data(),
+                'careers': _CAREERS_PAYLOAD,
+                'soft_skills_labels': _soft_skills_labels_data(),
+                'info': _api_info_data()
+            },
+            message="Metadatos obtenidos exitosamente"
+        )
+    except Exception as e:
+        return error_response(
+            "Error obteniendo metadatos de API",
+            status_code=500,
+            details=str(e)
+        )
@@ -1,6 +1,9 @@
 """Utils init file"""
 from app.utils.validation import validate_request_data, ValidationError
-from app.utils.responses import success_response, error_response, handle_api_error, format_recommendations_response
+from app.utils.responses import (
+    success_response, error_response, handle_api_error, format_recommendations_response,
+    request_etag, etag_matches, not_modified_response
+)
 
 __all__ = [
     'validate_request_data',
@@ -8,5 +11,8 @@ __all__ = [
     'success_response',
     'error_response',
     'handle_api_error',
-    'format_recommendations_response'
+    'format_recommendations_response',
+    'request_etag',
+    'etag_matches',
+    'not_modified_response'
 ]
@@ -5,15 +5,33 @@ llamadas externas (heurístico), pero si se configuran las variables de
 entorno OPENAI_API_KEY y OPENAI_MODEL, usa la API de OpenAI para producir
 resúmenes más naturales y contextuales.
 """
-from typing import List, Dict, Optional
+from typing import Any, Callable, List, Dict, Optional, Hashable, Iterator
 import os
 import re
 import json
 import hashlib
+import functools
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+try:
+	import orjson  # type: ignore
+except ImportError:  # opcional: sin orjson se usa json de la biblioteca estándar
+	orjson = None
+
+# Respuestas del LLM en JSON; orjson acepta str directamente
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+try:
+	import h2  # type: ignore  # noqa: F401
+	_HTTP2 = True
+except ImportError:  # opcional: sin h2 el cliente HTTP usa HTTP/1.1 con keep-alive
+	_HTTP2 = False
 
 try:
 	from dotenv import load_dotenv  # type: ignore
-	from pathlib import Path
 	# Cargar .env desde la raíz del proyecto explícitamente
 	root_env = Path(__file__).resolve().parents[2] / '.env'
 	load_dotenv(dotenv_path=str(root_env))
@@ -25,6 +43,323 @@ except Exception:
 		pass
 
 
+# Patrones usados en cada ítem de los lotes: se compilan una sola vez
+_RE_SUBJECT_SEP = re.compile(r"[;,]\s*|\s{2,}")
+_RE_HAS_LETTER = re.compile(r"[A-Za-zÁÉÍÓÚáéíóúñ]")
+_RE_HAS_VOWEL = re.compile(r"[AEIOUaeiouáéíóú]")
+_RE_PUNCT = re.compile(r"[^\w\s]")
+_RE_NON_LETTERS = re.compile(r"[^A-Za-zÁÉÍÓÚáéíóúñ]+")
+_RE_CODE_FENCE = re.compile(r"^```(?:json|JSON)?\s*")
+_RE_LEAD_BRACKETS = re.compile(r"^\[+\s*")
+_RE_TRAIL_BRACKETS = re.compile(r"\s*\]+$")
+# Los patrones de _clean_text_out empiezan por un literal para que el motor
+# salte directamente a los candidatos en lugar de probar cada posición
+_RE_NOISE = re.compile(r"[nN](?<=\b[nN])(?i:an|/?a|ull|one)\b(?:\s*[\.…,;:\-]*)?")
+_RE_DOTS = re.compile(r"\.\.+")
+_RE_WS_RUN = re.compile(r"[^\S ]\s*| \s+")
+_RE_WS = re.compile(r"\s+")
+_RE_SPACE_PUNCT = re.compile(r" (?=[\.!?,;:])")
+_RE_SPACE_BEFORE = re.compile(r" [\s\.!?,;:]")
+_RE_SENTENCE_BREAK = re.compile(r"[\.!?]\s+")
+_RE_SKELETON = re.compile(r"[^a-z0-9áéíóúñ]+")
+_NULL_TOKENS = frozenset({"nan", "null", "none"})
+
+_SYSTEM_PROMPT = "Redacta en español, claro, directo y profesional. Entrega un único párrafo de 3–4 frases. Evita plantillas y frases hechas; PROHIBIDO usar expresiones como 'La base de ... sustenta', 'guarda relación directa', 'destaca como opción sólida', 'Asignaturas relevantes:'. Integra las asignaturas y EUR-ACE de forma natural si aportan. No uses la palabra 'encaja'. Varía el inicio y estructura. No incluyas tokens ruidosos como 'nan'."
+# Mensaje de sistema compartido por todas las llamadas (el cliente no lo modifica)
+_SYSTEM_MSG = {"role": "system", "content": _SYSTEM_PROMPT}
+
+# Los prompts por lote piden salida JSON estructurada (response_format json_object):
+# cada texto llega con el número de su oferta
+_BATCH_JSON_SHAPE = 'Devuelve EXACTAMENTE un objeto JSON con la forma {"items":[{"idx":1,"text":"..."}, ...]} (sin texto extra).'
+_BATCH_JSON_TAIL = 'Devuelve solo el objeto JSON, con un elemento en "items" por oferta ({n} en total; idx = número de la oferta).'
+_JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Partes fijas del prompt por lote: estilos y enfoques se asignan en orden por oferta
+_PROMPT_STYLES = (
+	"analítico",
+	"concreto",
+	"académico",
+	"orientado a impacto",
+	"motivador",
+	"estratégico",
+)
+_BATCH_FOCUS = (
+	"operativo",
+	"académico",
+	"técnico",
+	"estratégico",
+	"proyección profesional"
+)
+_BATCH_PROMPT_RULES = "\n".join((
+	_BATCH_JSON_SHAPE,
+	"Cada elemento es el mensaje para una oferta: 3–4 frases, tono profesional y ético.",
+	"Varía el inicio y la estructura entre elementos; evita frases hechas o plantillas repetidas.",
+	"REGLAS ESTRICTAS DE DIVERSIDAD:",
+	"- Cada texto debe ser semánticamente distinto; no solo cambiar palabras.",
+	"- Está PROHIBIDO reutilizar estructuras como: 'Asignaturas relevantes:', 'Se sustentan en', 'La base de ... sustenta', 'guarda relación directa', 'destaca como opción sólida'.",
+	"- No repitas argumentos entre ofertas, aunque pertenezcan a la misma carrera.",
+	"- Cada texto debe enfatizar UN enfoque distinto: operativo, académico, técnico, estratégico, o de proyección profesional.",
+	"Incluye: (1) resumen del rol; (2) vínculo con la carrera del usuario con una afirmación breve de afinidad razonada usando asignaturas válidas y/o EUR-ACE; (3) 1–2 skills técnicas SOLO si aportan contexto real.",
+	"Prohibido usar 'encaja/encaje'. No incluyas 'nan' ni cadenas sin sentido ni encabezados tipo 'Link:'.",
+))
+_BATCH_PROMPT_OFFERS = (
+	"Para forzar diversidad, asigna estos estilos en orden (y repite si faltan): analítico, concreto, académico, orientado a impacto, motivador, estratégico.\n"
+	"Ofertas:"
+)
+# Las descripciones de las ofertas son largas y ruidosas: en los prompts por lote
+# basta el comienzo (menos tokens de entrada por oferta)
+_PROMPT_DESC_MAX = 200
+_BATCH_ITEM_FMT = "{i}) Cargo: {cargo}; Desc: {desc}; EURACE: {eur}; Skills: {sk}; Enfoque obligatorio: {foc}; Estilo: {sty}"
+# Plantillas del texto local y de la frase de mejora; se guarda el .format ya
+# ligado de cada una (el orden importa: el índice sale de la semilla)
+_SIMPLE_TPLS = tuple(t.format for t in (
+	"'{cargo}' es pertinente para perfiles de {carrera}. {asig} {razon}.",
+	"En {carrera}, '{cargo}' destaca como opción sólida. {asig} {razon}.",
+	"La base de {carrera} sustenta '{cargo}' con buen potencial. {asig} {razon}.",
+	"'{cargo}' guarda relación directa con {carrera}. {asig} {razon}."
+))
+_ALT_TPLS = tuple(t.format for t in (
+	"Si fortaleces {obj}, accederás a retos con mayor alcance y mejor proyección.",
+	"Al incorporar {obj}, ganarás tracción hacia proyectos de impacto y liderazgo.",
+	"Con {obj}, ampliarás tu margen para roles con mejores condiciones y responsabilidad.",
+	"Al desarrollar {obj}, acelerarás tu avance hacia posiciones de referencia.",
+	"Si potencias {obj}, destacarás en procesos con mayores exigencias técnicas y de gestión."
+))
+
+
+@functools.lru_cache(maxsize=1024)
+def _clean_subjects_text(s: str) -> str:
+	if not s:
+		return ''
+	clean: List[str] = []
+	for p in _RE_SUBJECT_SEP.split(s):
+		w = p.strip()
+		if not w:
+			continue
+		# Heurísticas de sentido: contiene vocales (y por tanto letras), baja puntuación, no 'nan'
+		if _RE_NON_LETTERS.sub('', w.lower()) in _NULL_TOKENS:
+			continue
+		if not _RE_HAS_VOWEL.search(w):
+			continue
+		if len(_RE_PUNCT.findall(w)) / len(w) > 0.35:
+			continue
+		# Evitar secuencias repetidas tipo 'aaaa', 'asdadsad' detectando baja diversidad
+		if len(w) > 4 and len({c for c in w.lower() if c.isalpha()}) < 3:
+			continue
+		clean.append(w)
+		if len(clean) == 3:
+			break
+	# Frase compacta (máx 3 elementos)
+	return ", ".join(clean)
+
+
+def _seed(text: str) -> int:
+	# Semilla estable entre procesos (hash() de str se aleatoriza por proceso)
+	return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_noise(s: str) -> bool:
+	# Ruido: menos de 3 letras o 'nan'/'null'/'none'; las skills se repiten entre
+	# ofertas, así que cada token distinto se evalúa una sola vez
+	ns = _RE_NON_LETTERS.sub('', s.lower())
+	return len(ns) <= 2 or ns in _NULL_TOKENS
+
+
+@functools.lru_cache(maxsize=2048)
+def _pick_skills_text(st: str) -> tuple:
+	if not st:
+		return ()
+	clean = []
+	# Dividir por coma/; y limpiar (espacios colapsados sin regex)
+	for part in st.replace(';', ',').split(','):
+		p = ' '.join(part.split())
+		# Evitar 'nan' o cadenas muy genéricas; limitar longitud; requiere al menos una letra
+		if not p or _is_noise(p) or len(p) > 40 or not _RE_HAS_LETTER.search(p):
+			continue
+		# Evita tokens dominados por dígitos/puntuación: ambos se cuentan en una pasada
+		n_digits = n_punct = 0
+		for c in p:
+			if c.isdecimal():
+				n_digits += 1
+			elif not (c.isalnum() or c.isspace() or c == '_'):
+				n_punct += 1
+		if n_punct / len(p) > 0.4 or n_digits / len(p) > 0.4:
+			continue
+		clean.append(p)
+	if not clean:
+		# fallback: separar por espacios y tomar tokens significativos
+		clean = [t for t in st.split() if len(t) > 2 and not _is_noise(t) and _RE_HAS_LETTER.search(t)][:3]
+	return tuple(clean[:2])
+
+class _TextLRU:
+	"""Thread-safe LRU of generated texts by key."""
+
+	def __init__(self, maxsize: int) -> None:
+		self.maxsize = maxsize
+		self._data: OrderedDict = OrderedDict()
+		self._lock = threading.Lock()
+
+	def get(self, key: Hashable) -> Optional[str]:
+		with self._lock:
+			value = self._data.get(key)
+			if value is not None:
+				self._data.move_to_end(key)
+			return value
+
+	def put(self, key: Hashable, value: str) -> None:
+		if self.maxsize <= 0:
+			return
+		with self._lock:
+			self._data[key] = value
+			self._data.move_to_end(key)
+			while len(self._data) > self.maxsize:
+				self._data.popitem(last=False)
+
+	def clear(self) -> None:
+		with self._lock:
+			self._data.clear()
+
+
+# Respuestas del LLM por contenido de la consulta: las carreras y perfiles que se
+# repiten entre peticiones no vuelven a pagar la llamada (solo se guardan éxitos)
+_LLM_CACHE = _TextLRU(maxsize=int(os.getenv('AI_CACHE_MAX', '4096') or 0))
+# Textos del fallback determinístico: el mismo cargo con la misma carrera y
+# asignaturas se repite entre lotes y peticiones (p. ej. al recargar resultados)
+_FALLBACK_CACHE = _TextLRU(maxsize=int(os.getenv('AI_CACHE_MAX', '4096') or 0))
+
+
+class _DiskTextCache:
+	"""SQLite store of LLM answers by prompt hash, shared by worker processes and restarts."""
+
+	def __init__(self, path: str, maxrows: int) -> None:
+		self.path = path
+		self.maxrows = maxrows
+		self._conn: Optional[sqlite3.Connection] = None
+		self._pid = None
+		self._lock = threading.Lock()
+
+	def _connection(self) -> Optional[sqlite3.Connection]:
+		# Conexión propia por proceso: no se hereda una conexión abierta tras un fork
+		# (maxrows <= 0 desactiva la caché, igual que en _TextLRU)
+		if not self.path or self.maxrows <= 0:
+			return None
+		if self._pid != os.getpid():
+			self._pid = os.getpid()
+			self._conn = None
+			try:
+				Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+				conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+				conn.execute('PRAGMA journal_mode=WAL')
+				conn.execute('CREATE TABLE IF NOT EXISTS llm (key BLOB PRIMARY KEY, text TEXT NOT NULL)')
+				conn.commit()
+				self._conn = conn
+			except Exception as e:
+				print(f"[AIPersonalizer] disk cache disabled: {e}")
+		return self._conn
+
+	def get(self, key: bytes) -> Optional[str]:
+		with self._lock:
+			conn = self._connection()
+			if conn is None:
+				return None
+			try:
+				row = conn.execute('SELECT text FROM llm WHERE key = ?', (key,)).fetchone()
+			except Exception:
+				return None
+		return row[0] if row else None
+
+	def put(self, key: bytes, value: str) -> None:
+		with self._lock:
+			conn = self._connection()
+			if conn is None or not value:
+				return
+			try:
+				with conn:
+					conn.execute('INSERT OR REPLACE INTO llm (key, text) VALUES (?, ?)', (key, value))
+					# Las entradas más antiguas (menor rowid) salen al superar el límite
+					conn.execute('DELETE FROM llm WHERE rowid <= (SELECT MAX(rowid) FROM llm) - ?', (self.maxrows,))
+			except Exception as e:
+				print(f"[AIPersonalizer] disk cache write failed: {e}")
+
+
+# Segundo nivel, opcional y persistente: mismo prompt -> misma respuesta sin llamar a la API
+_LLM_DISK_CACHE = _DiskTextCache(
+	os.getenv('AI_CACHE_DB', '').strip(),
+	maxrows=int(os.getenv('AI_CACHE_DB_MAX', '100000') or 0)
+)
+
+
+def _llm_cache_key(kind: str, item: Dict[str, str], carrera: str, asignaturas: str, soft_skills: List[int]) -> str:
+	payload = json.dumps(
+		{'kind': kind, 'item': item, 'carrera': carrera, 'asignaturas': asignaturas, 'soft_skills': list(soft_skills or [])},
+		sort_keys=True, ensure_ascii=False, default=str
+	)
+	return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_client() -> Dict[str, object]:
+	"""Read the OpenAI settings once per process and build the client if configured."""
+	model = os.getenv('OPENAI_MODEL', '').strip()
+	api_key = os.getenv('OPENAI_API_KEY', '').strip()
+	org_id = os.getenv('OPENAI_ORG_ID', '').strip()
+	project_id = os.getenv('OPENAI_PROJECT', '').strip()
+	base_url = os.getenv('OPENAI_BASE_URL', '').strip()
+	# Proxy soporte (si se define en entorno). NO pasar 'proxies' directo al cliente.
+	proxy_env = (
+		os.getenv('OPENAI_PROXY')
+		or os.getenv('HTTPS_PROXY')
+		or os.getenv('HTTP_PROXY')
+		or ''
+	).strip()
+	require_llm = os.getenv('AI_PERSONALIZER_REQUIRE_LLM', '').strip().lower() in {'1','true','yes'}
+	enabled = bool(api_key and model)
+	client = None
+	init_error = ''
+	if enabled:
+		try:
+			from openai import OpenAI, DEFAULT_TIMEOUT  # type: ignore
+			import httpx  # type: ignore
+			# Inicializa el cliente usando explícitamente la API key y parámetros opcionales
+			kwargs = { 'api_key': api_key }
+			if org_id:
+				kwargs['organization'] = org_id
+			if project_id:
+				kwargs['project'] = project_id
+			if base_url:
+				kwargs['base_url'] = base_url
+			# Un solo cliente HTTP por proceso para todas las peticiones al LLM: conexiones
+			# keep-alive acotadas y HTTP/2 (varias peticiones por conexión) si h2 está instalado
+			http_kwargs = {
+				'http2': _HTTP2,
+				'limits': httpx.Limits(max_connections=100, max_keepalive_connections=20),
+				'timeout': DEFAULT_TIMEOUT,
+				'follow_redirects': True,
+			}
+			if proxy_env:
+				# httpx>=0.27 usa 'proxy' (singular) en lugar de 'proxies'
+				http_kwargs['proxy'] = proxy_env
+				http_kwargs['timeout'] = 30.0
+			try:
+				kwargs['http_client'] = httpx.Client(**http_kwargs)
+			except Exception as e_http:
+				stage = 'proxy_setup_failed' if proxy_env else 'http_client_setup_failed'
+				init_error = f"{stage}: {e_http.__class__.__name__}: {e_http}"
+			client = OpenAI(**kwargs)
+		except Exception as e:
+			# Si no se puede inicializar, desactivar silenciosamente
+			enabled = False
+			init_error = f"init_failed: {e.__class__.__name__}: {e}"
+	return {
+		'enabled': enabled,
+		'model': model,
+		'require_llm': require_llm,
+		'client': client,
+		'init_error': init_error,
+	}
+
+
 class AIPersonalizer:
 	"""Generates concise explanations and soft-skills advice.
 
@@ -34,7 +369,7 @@ class AIPersonalizer:
 	- Spanish output, 2–3 frases por explicación.
 	"""
 
-	SOFT_SKILLS_LABELS = [
+	SOFT_SKILLS_LABELS = (
 		'Gestión',
 		'Comunicación efectiva',
 		'Liderazgo',
@@ -42,52 +377,28 @@ class AIPersonalizer:
 		'Ética profesional',
 		'Responsabilidad social',
 		'Aprendizaje autónomo'
-	]
+	)
+	# Forma textual de las etiquetas para el prompt del consejo (se formatea una sola vez;
+	# como lista, igual que antes en el prompt)
+	SOFT_SKILLS_LABELS_STR = str(list(SOFT_SKILLS_LABELS))
+
+	# Textos fijos del consejo determinístico
+	_BENEFICIOS = (
+		"acceder a más ofertas relevantes",
+		"mejorar tu proyección y remuneración",
+		"acelerar tu crecimiento profesional"
+	)
+	_ACCIONES = "Prácticas rápidas: lidera pequeñas tareas en equipo y presenta avances breves; busca feedback quincenal y documenta aprendizajes."
 
 	def __init__(self) -> None:
 		# OpenAI support (enabled only if both API key and model are set)
-		self._enabled = False
-		self._model = os.getenv('OPENAI_MODEL', '').strip()
-		api_key = os.getenv('OPENAI_API_KEY', '').strip()
-		org_id = os.getenv('OPENAI_ORG_ID', '').strip()
-		project_id = os.getenv('OPENAI_PROJECT', '').strip()
-		base_url = os.getenv('OPENAI_BASE_URL', '').strip()
-		# Proxy soporte (si se define en entorno). NO pasar 'proxies' directo al cliente.
-		proxy_env = (
-			os.getenv('OPENAI_PROXY')
-			or os.getenv('HTTPS_PROXY')
-			or os.getenv('HTTP_PROXY')
-			or ''
-		).strip()
-		self._require_llm = os.getenv('AI_PERSONALIZER_REQUIRE_LLM', '').strip().lower() in {'1','true','yes'}
-		self._enabled = bool(api_key and self._model)
-		self._client = None
-		self._init_error = ''
-		if self._enabled:
-			try:
-				from openai import OpenAI  # type: ignore
-				import httpx  # type: ignore
-				# Inicializa el cliente usando explícitamente la API key y parámetros opcionales
-				kwargs = { 'api_key': api_key }
-				if org_id:
-					kwargs['organization'] = org_id
-				if project_id:
-					kwargs['project'] = project_id
-				if base_url:
-					kwargs['base_url'] = base_url
-				# Si hay proxy, construir http_client de httpx con proxies correctos
-				if proxy_env:
-					try:
-						# httpx>=0.27 usa 'proxy' (singular) en lugar de 'proxies'
-						http_client = httpx.Client(proxy=proxy_env, timeout=30.0)
-						kwargs['http_client'] = http_client
-					except Exception as e_proxy:
-						self._init_error = f"proxy_setup_failed: {e_proxy.__class__.__name__}: {e_proxy}"
-				self._client = OpenAI(**kwargs)
-			except Exception as e:
-				# Si no se puede inicializar, desactivar silenciosamente
-				self._enabled = False
-				self._init_error = f"init_failed: {e.__class__.__name__}: {e}"
+		# El entorno se lee y el cliente se construye una sola vez por proceso
+		settings = _build_client()
+		self._enabled = settings['enabled']
+		self._model = settings['model']
+		self._require_llm = settings['require_llm']
+		self._client = settings['client']
+		self._init_error = settings['init_error']
 		# Información de diagnóstico mínima para saber por qué no se usa LLM
 		self._diag = {
 			'enabled': self._enabled,
@@ -108,73 +419,40 @@ class AIPersonalizer:
 
 	def _clean_subjects(self, asignaturas: str) -> str:
 		"""Sanear asignaturas para evitar basura (ej. 'asdadsad'). Devuelve frase breve o ''"""
-		s = (asignaturas or '').strip()
-		if not s:
-			return ''
-		# Normalizar separadores y dividir
-		parts = re.split(r"[;,]\s*|\s{2,}", s)
-		clean: List[str] = []
-		for p in parts:
-			w = p.strip()
-			if not w:
-				continue
-			# Heurísticas de sentido: contiene letras y vocales, baja puntuación, no 'nan'
-			if self._normalize(w) in {'nan', 'null', 'none'}:
-				continue
-			if not re.search(r"[A-Za-zÁÉÍÓÚáéíóúñ]", w):
-				continue
-			if not re.search(r"[AEIOUaeiouáéíóú]", w):
-				continue
-			punct_ratio = (len(re.findall(r"[^\w\s]", w)) / max(len(w), 1))
-			if punct_ratio > 0.35:
-				continue
-			# Evitar secuencias repetidas tipo 'aaaa', 'asdadsad' detectando baja diversidad
-			diversidad = len(set([c for c in w.lower() if c.isalpha()]))
-			if diversidad < 3 and len(w) > 4:
-				continue
-			clean.append(w)
-		if not clean:
-			return ''
-		# Construir frase compacta (máx 3 elementos)
-		return ", ".join(clean[:3])
+		# Mismo texto para todas las ofertas de una petición: se limpia una sola vez
+		return _clean_subjects_text((asignaturas or '').strip())
 
 	def _normalize(self, s: str) -> str:
-		return re.sub(r"[^A-Za-zÁÉÍÓÚáéíóúñ]+", "", (s or "").lower())
+		return _RE_NON_LETTERS.sub("", (s or "").lower())
 
 	def _is_noise_token(self, s: str) -> bool:
-		ns = self._normalize(s)
-		if not ns:
-			return True
-		if ns in {"nan", "null", "none"}:
-			return True
-		if len(ns) <= 2:
-			return True
-		return False
+		return _is_noise(s or '')
 
 	def _clean_text_out(self, text: str) -> str:
 		t = (text or "").strip()
 		if not t:
 			return ""
+		# Atajo para el caso común (texto ya limpio): nada que ninguno de los pasos
+		# siguientes cambiaría (isprintable() es False ante cualquier espacio distinto de ' ')
+		if not (
+			'`' in t or '[' in t or ']' in t or '..' in t or not t.isprintable()
+			or _RE_SPACE_BEFORE.search(t) or _RE_NOISE.search(t)
+		):
+			return t
 		# remover cercas de código y etiquetas de formato comunes
-		t = re.sub(r"^```(?:json|JSON)?\s*", "", t)
-		t = t.replace("```", "")
+		t = _RE_CODE_FENCE.sub("", t).replace("```", "")
 		# eliminar corchetes sueltos en extremos causados por respuestas en bloque
-		t = re.sub(r"^\[+\s*", "", t)
-		t = re.sub(r"\s*\]+$", "", t)
+		t = _RE_LEAD_BRACKETS.sub("", t)
+		if t.endswith((']', ']\n')):
+			t = _RE_TRAIL_BRACKETS.sub("", t)
 		# eliminar tokens tipo 'nan', 'n/a', 'null', 'none' con puntuación o puntos de arrastre
-		t = re.sub(r"(?i)\b(?:nan|n/?a|null|none)\b(?:\s*[\.…,;:\-]*)?", "", t)
+		t = _RE_NOISE.sub("", t)
 		# colapsar puntuación repetida
-		t = re.sub(r"[\.]{2,}", ".", t)
-		# arreglar espacios antes de signos y dobles espacios
-		t = re.sub(r"\s+", " ", t)
-		t = re.sub(r"\s([\.!?,;:])", r"\1", t)
-		# conectores huérfanos tras limpieza (e.g., ' y .')
-		t = t.replace(" y .", ".")
-		t = t.replace(" e .", ".")
-		t = t.replace(" o .", ".")
-		# limpiar comas/puntos mal formados
-		t = t.replace(", .", ".")
-		t = t.replace(" ,", ",")
+		t = _RE_DOTS.sub(".", t)
+		# colapsar espacios (solo se reescriben las secuencias que cambian) y quitar
+		# el espacio antes de signos
+		t = _RE_WS_RUN.sub(" ", t)
+		t = _RE_SPACE_PUNCT.sub("", t)
 		return t.strip()
 
 	def _simple_explanation(
@@ -186,12 +464,28 @@ class AIPersonalizer:
 		carrera: str,
 		asignaturas: str,
 		soft_skills: List[int]
+	) -> str:
+		# El texto no depende de la descripción ni de las habilidades blandas
+		use_eur = bool((eurace_skills or '').strip())
+		key = ('simple', cargo, use_eur, skills, carrera, asignaturas)
+		line = _FALLBACK_CACHE.get(key)
+		if line is None:
+			line = self._build_simple_explanation(cargo, use_eur, skills, carrera, asignaturas)
+			_FALLBACK_CACHE.put(key, line)
+		return line
+
+	def _build_simple_explanation(
+		self,
+		cargo: str,
+		use_eur: bool,
+		skills: str,
+		carrera: str,
+		asignaturas: str
 	) -> str:
 		# Generar un texto breve con variación determinística por oferta
 		asignaturas_txt = self._clean_subjects(asignaturas)
 		picked = self._pick_skills(skills)
 		# Construir pistas sin 'nan' ni ruido
-		use_eur = bool((eurace_skills or '').strip())
 		pista_txt = ''
 		if use_eur and picked:
 			pista_txt = f"EURACE y {self._spanish_join(picked)}"
@@ -203,19 +497,13 @@ class AIPersonalizer:
 			pista_txt = "tus competencias y trayectoria"
 
 		seed_base = f"{cargo}|{carrera}|{asignaturas_txt}|{','.join(picked)}"
-		seed = int(hashlib.md5(seed_base.encode('utf-8')).hexdigest(), 16)
-		templates = [
-			"'{cargo}' es pertinente para perfiles de {carrera}. {asig} {razon}.",
-			"En {carrera}, '{cargo}' destaca como opción sólida. {asig} {razon}.",
-			"La base de {carrera} sustenta '{cargo}' con buen potencial. {asig} {razon}.",
-			"'{cargo}' guarda relación directa con {carrera}. {asig} {razon}."
-		]
-		idx = seed % len(templates)
+		seed = _seed(seed_base)
+		idx = seed % len(_SIMPLE_TPLS)
 		asig = f"Asignaturas relevantes: {asignaturas_txt}." if asignaturas_txt else ""
 		razon = f"Se sustentan en {pista_txt}." if pista_txt else ""
-		line = templates[idx].format(cargo=cargo, carrera=carrera, asig=asig, razon=razon).strip()
+		line = _SIMPLE_TPLS[idx](cargo=cargo, carrera=carrera, asig=asig, razon=razon).strip()
 		# Evitar puntos dobles o espacios redundantes
-		line = re.sub(r"\s+", " ", line).strip()
+		line = _RE_WS.sub(" ", line).strip()
 		line = self._clean_text_out(line)
 		return line
 
@@ -227,10 +515,28 @@ class AIPersonalizer:
 		skills: str,
 		carrera: str,
 		asignaturas: str
+	) -> str:
+		key = ('semantic', cargo, bool(descripcion), bool(eurace_skills.strip()), skills, carrera, asignaturas)
+		text = _FALLBACK_CACHE.get(key)
+		if text is None:
+			text = self._build_semantic_fallback(
+				cargo, bool(descripcion), bool(eurace_skills.strip()), skills, carrera, asignaturas
+			)
+			_FALLBACK_CACHE.put(key, text)
+		return text
+
+	def _build_semantic_fallback(
+		self,
+		cargo: str,
+		has_descripcion: bool,
+		has_eurace: bool,
+		skills: str,
+		carrera: str,
+		asignaturas: str
 	) -> str:
 		parts = []
 
-		if descripcion:
+		if has_descripcion:
 			parts.append(
 				f"El rol de {cargo} se centra en actividades técnicas descritas en la oferta, "
 				f"con responsabilidades alineadas al campo de {carrera.lower()}."
@@ -254,7 +560,7 @@ class AIPersonalizer:
 				f"relevantes para el desempeño cotidiano del rol."
 			)
 
-		if eurace_skills.strip():
+		if has_eurace:
 			parts.append(
 				"El perfil también se alinea con competencias profesionales contempladas "
 				"en el marco de referencia EURACE."
@@ -274,20 +580,63 @@ class AIPersonalizer:
 		soft_skills: List[int]
 	) -> str:
 		# Si OpenAI está disponible, intentar explicación con LLM
+		item = {'cargo': cargo, 'descripcion': descripcion, 'eurace_skills': eurace_skills, 'skills': skills}
+		texts = self._cached_llm_texts('single', [item], carrera, asignaturas, soft_skills, self._llm_single)
+		if texts and texts[0]:
+			return texts[0]
+		# Fallback determinístico
+		return self._semantic_fallback(
+			cargo, descripcion, eurace_skills, skills, carrera, asignaturas
+		)
+
+	def personalize_description_stream(
+		self,
+		cargo: str,
+		descripcion: str,
+		eurace_skills: str,
+		skills: str,
+		carrera: str,
+		asignaturas: str,
+		soft_skills: List[int]
+	) -> Iterator[str]:
+		"""Same text as personalize_description, yielded sentence by sentence as the LLM produces it."""
 		if self._enabled and self._client is not None:
+			item = {'cargo': cargo, 'descripcion': descripcion, 'eurace_skills': eurace_skills, 'skills': skills}
+			key = _llm_cache_key('single', item, carrera, asignaturas, soft_skills)
+			cached = _LLM_CACHE.get(key)
+			if cached is not None:
+				yield cached
+				return
+			raw = ''
+			sent = 0
 			try:
 				prompt = self._build_single_prompt(
 					cargo, descripcion, eurace_skills, skills, carrera, asignaturas, soft_skills
 				)
-				msg = self._chat(prompt)
-				if msg:
-					return self._clean_text_out(msg)
+				for delta in self._chat_stream(prompt):
+					raw += delta
+					# Solo se limpian y emiten frases completas, para no cortar tokens a medias
+					cut = 0
+					for m in _RE_SENTENCE_BREAK.finditer(raw, sent):
+						cut = m.end()
+					if cut:
+						sentence = self._clean_text_out(raw[sent:cut])
+						sent = cut
+						if sentence:
+							yield sentence
+				tail = self._clean_text_out(raw[sent:])
+				if tail:
+					yield tail
+				text = self._clean_text_out(raw)
+				if text:
+					_LLM_CACHE.put(key, text)
+					return
 			except Exception as e:
-				# Log básico para diagnóstico en despliegue
-				print(f"[AIPersonalizer] LLM error in personalize_description: {e}")
-				pass
-		# Fallback determinístico
-		return self._semantic_fallback(
+				print(f"[AIPersonalizer] LLM error in personalize_description_stream: {e}")
+			# Si ya se emitió parte del texto no se mezcla con el fallback
+			if sent:
+				return
+		yield self._semantic_fallback(
 			cargo, descripcion, eurace_skills, skills, carrera, asignaturas
 		)
 
@@ -298,60 +647,35 @@ class AIPersonalizer:
 		asignaturas: str,
 		soft_skills: List[int]
 	) -> List[str]:
+		if not items:
+			return []
 		# Si el LLM no está disponible, continuar con fallback determinístico sin mensajes de configuración
-		if self._enabled and self._client is not None and items:
-			try:
-				prompt = self._build_batch_prompt(items, carrera, asignaturas, soft_skills)
-				# Mayor variación de estilo y longitud controlada
-				text = self._chat(
-					prompt,
-					temperature=0.7,
-					presence_penalty=0.6,
-					frequency_penalty=0.4,
-					max_tokens=1100
-				)
-				parsed = self._parse_json_array(text, expected=len(items))
-				if not parsed:
-					parsed = self._parse_batch_lines(text, expected=len(items))
-				if parsed and len(parsed) >= len(items):
-					final: List[str] = []
-					for idx, it in enumerate(items):
-						line = (parsed[idx] or '').strip()
-						# Limpieza y validación de calidad
-						line = self._clean_text_out(line)
-						is_short = len(line) < 80
-						ends_ok = bool(re.search(r"[\.!?]$", line))
-						if not ends_ok:
-							line += "."
-						if is_short:
-							# Completar con una frase breve basada en skills si falta
-							tech = self._pick_skills(it.get('skills',''))
-							if tech:
-								line += f" Destaca el uso de {self._spanish_join(tech)} en el puesto."
-							else:
-								line += f" Apoya el desarrollo del perfil de {carrera}."
-						final.append(line)
-					# Forzar diversidad básica si hay duplicados evidentes
-					final = self._enforce_diversity(final, items, carrera)
-					return final[:len(items)]
-			except Exception as e:
-				print(f"[AIPersonalizer] LLM error in personalize_batch: {e}")
-				pass
+		if not self._has_offer_context(items):
+			# Sin descripción, EURACE ni skills el LLM no aporta nada sobre el texto local
+			explicaciones = None
+		elif len(items) == 1:
+			# Una sola oferta: el prompt individual evita el objeto JSON del lote
+			it = items[0]
+			item = {k: it.get(k, '') for k in ('cargo', 'descripcion', 'eurace_skills', 'skills')}
+			explicaciones = self._cached_llm_texts('single', [item], carrera, asignaturas, soft_skills, self._llm_single)
+		else:
+			explicaciones = self._cached_llm_texts('batch', items, carrera, asignaturas, soft_skills, self._llm_batch)
+		if explicaciones is not None:
+			return explicaciones
 		# Fallback determinístico
-		explicaciones: List[str] = []
-		for it in items:
-			explicaciones.append(
-				self._simple_explanation(
-					cargo=it.get('cargo', ''),
-					descripcion=it.get('descripcion', ''),
-					eurace_skills=it.get('eurace_skills', ''),
-					skills=it.get('skills', ''),
-					carrera=carrera,
-					asignaturas=asignaturas,
-					soft_skills=soft_skills,
-				)
+		cargos, descs, eurace_list, skills_list, _ = self._to_soa(items)
+		return [
+			self._simple_explanation(
+				cargo=cargo,
+				descripcion=desc,
+				eurace_skills=eurace,
+				skills=skills,
+				carrera=carrera,
+				asignaturas=asignaturas,
+				soft_skills=soft_skills,
 			)
-		return explicaciones
+			for cargo, desc, eurace, skills in zip(cargos, descs, eurace_list, skills_list)
+		]
 
 	def personalize_alt_batch(
 		self,
@@ -360,39 +684,25 @@ class AIPersonalizer:
 		asignaturas: str,
 		soft_skills: List[int]
 	) -> List[str]:
+		if not items:
+			return []
 		# Si el LLM no está disponible, continuar con fallback determinístico
-		if self._enabled and self._client is not None and items:
-			try:
-				prompt = self._build_alt_batch_prompt(items, carrera, asignaturas, soft_skills)
-				text = self._chat(prompt, temperature=0.55, presence_penalty=0.25, frequency_penalty=0.25, max_tokens=450)
-				parsed = self._parse_json_array(text, expected=len(items))
-				if not parsed:
-					parsed = self._parse_batch_lines(text, expected=len(items))
-				if parsed:
-					cleaned = [self._clean_text_out(p) for p in parsed]
-					return self._enforce_diversity(cleaned, items, carrera)[:len(items)]
-			except Exception as e:
-				print(f"[AIPersonalizer] LLM error in personalize_alt_batch: {e}")
-				pass
-		explicaciones: List[str] = []
-		for it in items:
-			sugeridas = it.get('suggest_soft', '').strip()
+		explicaciones = self._cached_llm_texts('alt_batch', items, carrera, asignaturas, soft_skills, self._llm_alt_batch)
+		if explicaciones is not None:
+			return explicaciones
+		explicaciones = []
+		for cargo, desc, eurace, skills, sugeridas in zip(*self._to_soa(items)):
 			base = self._simple_explanation(
-				cargo=it.get('cargo', ''),
-				descripcion=it.get('descripcion', ''),
-				eurace_skills=it.get('eurace_skills', ''),
-				skills=it.get('skills', ''),
+				cargo=cargo,
+				descripcion=desc,
+				eurace_skills=eurace,
+				skills=skills,
 				carrera=carrera,
 				asignaturas=asignaturas,
 				soft_skills=soft_skills,
 			)
-			if sugeridas:
-				ss = [s.strip() for s in sugeridas.split(',') if s.strip()]
-				tech = self._pick_skills(it.get('skills',''))
-				extra = self._alt_extra_phrase(it.get('cargo',''), ss, tech)
-			else:
-				tech = self._pick_skills(it.get('skills',''))
-				extra = self._alt_extra_phrase(it.get('cargo',''), [], tech)
+			ss = [s.strip() for s in sugeridas.split(',') if s.strip()]
+			extra = self._alt_extra_phrase(cargo, ss, self._pick_skills(skills))
 			explicaciones.append(self._clean_text_out(base + " " + extra))
 		return explicaciones
 
@@ -420,59 +730,164 @@ class AIPersonalizer:
 					f"Carrera: {carrera}\n"
 					f"Asignaturas (limpias si aplican): {self._clean_subjects(asignaturas)}\n"
 					f"Puntajes de soft skills (1–5): {soft_skills}\n"
-					f"Etiquetas soft: {self.SOFT_SKILLS_LABELS}\n"
+					f"Etiquetas soft: {self.SOFT_SKILLS_LABELS_STR}\n"
 				)
 				msg = self._chat(prompt, temperature=0.5, presence_penalty=0.2, frequency_penalty=0.2, max_tokens=230)
 				if msg:
-					return self._clean_text_out(msg)
+					return msg
 			except Exception:
 				pass
 
 		# Fallback: enfatiza 1–2 bajas, reconoce 1 fortaleza, da 2 prácticas + beneficio
-		pares = list(zip(self.SOFT_SKILLS_LABELS, soft_skills))
-		orden = sorted(pares, key=lambda x: x[1])
-		bajas = [p[0] for p in orden if p[1] <= 3][:2]
-		altas = [p[0] for p in pares if p[1] >= 4]
-		fortaleza = altas[0] if altas else ''
+		pares = tuple(zip(self.SOFT_SKILLS_LABELS, soft_skills))
+		bajas = [label for label, v in sorted(pares, key=lambda x: x[1]) if v <= 3][:2]
+		fortaleza = next((label for label, v in pares if v >= 4), '')
 		asign_txt = asignaturas.strip()
-		beneficios = [
-			"acceder a más ofertas relevantes",
-			"mejorar tu proyección y remuneración",
-			"acelerar tu crecimiento profesional"
-		]
-		benef = beneficios[(sum(soft_skills) % len(beneficios))]
-		intro = f"Para impulsar tu trayectoria en {carrera}, prioriza "
-		if bajas:
-			intro += self._spanish_join(bajas)
-		else:
-			intro += "tus habilidades blandas clave"
-		intro += f": te ayudará a {benef}."
-		if fortaleza:
-			intro += f" Ya destacas en {fortaleza}; capitalízalo mientras fortaleces lo anterior."
-		acciones = "Prácticas rápidas: lidera pequeñas tareas en equipo y presenta avances breves; busca feedback quincenal y documenta aprendizajes."
-		if asign_txt:
-			acciones += f" Integra estas acciones con {asign_txt} para impacto inmediato."
-		return intro + "\n" + acciones
+		benef = self._BENEFICIOS[sum(soft_skills) % len(self._BENEFICIOS)]
+		prioridad = self._spanish_join(bajas) if bajas else "tus habilidades blandas clave"
+		destaca = f" Ya destacas en {fortaleza}; capitalízalo mientras fortaleces lo anterior." if fortaleza else ""
+		integra = f" Integra estas acciones con {asign_txt} para impacto inmediato." if asign_txt else ""
+		return (
+			f"Para impulsar tu trayectoria en {carrera}, prioriza {prioridad}: te ayudará a {benef}.{destaca}\n"
+			f"{self._ACCIONES}{integra}"
+		)
 
 	# -----------------
 	# OpenAI utilities
 	# -----------------
-	def _chat(self, prompt: str, temperature: float = 0.2, presence_penalty: float = 0.0, frequency_penalty: float = 0.0, max_tokens: int = 250) -> str:
-		from typing import Any
+	def _cached_llm_texts(self, kind: str, items: List[Dict[str, str]], carrera: str, asignaturas: str, soft_skills: List[int], llm_call) -> Optional[List[str]]:
+		"""LLM text per item, reusing earlier answers for identical inputs; None if the LLM gave nothing."""
+		if not (self._enabled and self._client is not None and items):
+			return None
+		keys = [_llm_cache_key(kind, it, carrera, asignaturas, soft_skills) for it in items]
+		texts = [_LLM_CACHE.get(k) for k in keys]
+		pending = [i for i, t in enumerate(texts) if t is None]
+		if pending:
+			# Solo los ítems no vistos van al LLM, en una sola llamada
+			fresh = llm_call([items[i] for i in pending], carrera, asignaturas, soft_skills)
+			if fresh is None and len(pending) == len(items):
+				return None
+			for i, text in zip(pending, fresh or []):
+				if text:
+					_LLM_CACHE.put(keys[i], text)
+				texts[i] = text
+		# Los huecos ('') se completan por ítem en la ruta
+		return [t or '' for t in texts]
+
+	def _llm_single(self, items: List[Dict[str, str]], carrera: str, asignaturas: str, soft_skills: List[int]) -> Optional[List[str]]:
+		it = items[0]
+		try:
+			prompt = self._build_single_prompt(
+				it['cargo'], it['descripcion'], it['eurace_skills'], it['skills'], carrera, asignaturas, soft_skills
+			)
+			msg = self._chat(prompt)
+			if msg:
+				return [msg]
+		except Exception as e:
+			# Log básico para diagnóstico en despliegue
+			print(f"[AIPersonalizer] LLM error in personalize_description: {e}")
+		return None
+
+	def _llm_batch(self, items: List[Dict[str, str]], carrera: str, asignaturas: str, soft_skills: List[int]) -> Optional[List[str]]:
+		try:
+			prompt = self._build_batch_prompt(items, carrera, asignaturas, soft_skills)
+			# Mayor variación de estilo y longitud controlada
+			parsed = self._chat(
+				prompt,
+				temperature=0.7,
+				presence_penalty=0.6,
+				frequency_penalty=0.4,
+				max_tokens=1100,
+				json_mode=True,
+				parse=lambda text: self._parse_json_items(text, expected=len(items))
+			)
+			if parsed:
+				# Los huecos ('') se completan por ítem con el texto local en la ruta
+				return self._enforce_diversity(parsed, items, carrera)
+		except Exception as e:
+			print(f"[AIPersonalizer] LLM error in personalize_batch: {e}")
+			pass
+		return None
+
+	def _llm_alt_batch(self, items: List[Dict[str, str]], carrera: str, asignaturas: str, soft_skills: List[int]) -> Optional[List[str]]:
+		try:
+			prompt = self._build_alt_batch_prompt(items, carrera, asignaturas, soft_skills)
+			parsed = self._chat(
+				prompt, temperature=0.55, presence_penalty=0.25, frequency_penalty=0.25, max_tokens=450, json_mode=True,
+				parse=lambda text: self._parse_json_items(text, expected=len(items))
+			)
+			if parsed:
+				return self._enforce_diversity(parsed, items, carrera)
+		except Exception as e:
+			print(f"[AIPersonalizer] LLM error in personalize_alt_batch: {e}")
+			pass
+		return None
+
+	def _chat(
+		self,
+		prompt: str,
+		temperature: float = 0.2,
+		presence_penalty: float = 0.0,
+		frequency_penalty: float = 0.0,
+		max_tokens: int = 250,
+		json_mode: bool = False,
+		parse: Optional[Callable[[str], Any]] = None
+	) -> Any:
+		"""Completion passed through parse (default: cleaned text); only answers parse accepts reach the disk cache."""
 		if not (self._enabled and self._client):
-			return ''
-		resp = self._client.chat.completions.create(
-			model=self._model,
-			messages=[
-				{"role": "system", "content": "Redacta en español, claro, directo y profesional. Entrega un único párrafo de 3–4 frases. Evita plantillas y frases hechas; PROHIBIDO usar expresiones como 'La base de ... sustenta', 'guarda relación directa', 'destaca como opción sólida', 'Asignaturas relevantes:'. Integra las asignaturas y EUR-ACE de forma natural si aportan. No uses la palabra 'encaja'. Varía el inicio y estructura. No incluyas tokens ruidosos como 'nan'."},
-				{"role": "user", "content": prompt}
-			],
-			temperature=float(temperature),
-			presence_penalty=float(presence_penalty),
-			frequency_penalty=float(frequency_penalty),
-			max_tokens=int(max_tokens)
-		)
-		return (resp.choices[0].message.content or '').strip()
+			return None
+		parse = parse or self._clean_text_out
+		params = self._chat_params(prompt, temperature, presence_penalty, frequency_penalty, max_tokens)
+		if json_mode:
+			params['response_format'] = _JSON_RESPONSE_FORMAT
+		key = self._chat_key(params)
+		cached = _LLM_DISK_CACHE.get(key)
+		if cached is not None:
+			parsed = parse(cached)
+			if parsed:
+				return parsed
+		resp = self._client.chat.completions.create(**params)
+		text = (resp.choices[0].message.content or '').strip()
+		parsed = parse(text)
+		# Una respuesta vacía o mal formada no se guarda: se reintenta en la próxima petición
+		if parsed:
+			_LLM_DISK_CACHE.put(key, text)
+		return parsed
+
+	def _chat_stream(self, prompt: str, temperature: float = 0.2, presence_penalty: float = 0.0, frequency_penalty: float = 0.0, max_tokens: int = 250) -> Iterator[str]:
+		"""Like _chat, but yields the completion in pieces as the API sends them."""
+		if not (self._enabled and self._client):
+			return
+		params = self._chat_params(prompt, temperature, presence_penalty, frequency_penalty, max_tokens)
+		key = self._chat_key(params)
+		cached = _LLM_DISK_CACHE.get(key)
+		if cached is not None:
+			yield cached
+			return
+		pieces: List[str] = []
+		for chunk in self._client.chat.completions.create(stream=True, **params):
+			delta = chunk.choices[0].delta.content if chunk.choices else None
+			if delta:
+				pieces.append(delta)
+				yield delta
+		# Solo una respuesta completa y con texto útil va a la caché en disco
+		text = "".join(pieces).strip()
+		if self._clean_text_out(text):
+			_LLM_DISK_CACHE.put(key, text)
+
+	def _chat_params(self, prompt: str, temperature: float, presence_penalty: float, frequency_penalty: float, max_tokens: int) -> Dict[str, object]:
+		return {
+			'model': self._model,
+			'messages': [_SYSTEM_MSG, {"role": "user", "content": prompt}],
+			'temperature': temperature,
+			'presence_penalty': presence_penalty,
+			'frequency_penalty': frequency_penalty,
+			'max_tokens': max_tokens,
+		}
+
+	def _chat_key(self, params: Dict[str, object]) -> bytes:
+		payload = json.dumps(params, sort_keys=True, ensure_ascii=False)
+		return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
 
 	def _build_single_prompt(
 		self,
@@ -504,52 +919,23 @@ class AIPersonalizer:
 		asignaturas: str,
 		soft_skills: List[int]
 	) -> str:
-		styles = [
-			"analítico",
-			"concreto",
-			"académico",
-			"orientado a impacto",
-			"motivador",
-			"estratégico",
-		]
-		lines = [
-			"Genera EXACTAMENTE un arreglo JSON de cadenas (sin texto extra).",
-			"Cada elemento es el mensaje para una oferta: 3–4 frases, tono profesional y ético.",
-			"Varía el inicio y la estructura entre elementos; evita frases hechas o plantillas repetidas.",
-			"REGLAS ESTRICTAS DE DIVERSIDAD:",
-			"- Cada texto debe ser semánticamente distinto; no solo cambiar palabras.",
-			"- Está PROHIBIDO reutilizar estructuras como: 'Asignaturas relevantes:', 'Se sustentan en', 'La base de ... sustenta', 'guarda relación directa', 'destaca como opción sólida'.",
-			"- No repitas argumentos entre ofertas, aunque pertenezcan a la misma carrera.",
-			"- Cada texto debe enfatizar UN enfoque distinto: operativo, académico, técnico, estratégico, o de proyección profesional.",
-			"Incluye: (1) resumen del rol; (2) vínculo con la carrera del usuario con una afirmación breve de afinidad razonada usando asignaturas válidas y/o EUR-ACE; (3) 1–2 skills técnicas SOLO si aportan contexto real.",
-			"Prohibido usar 'encaja/encaje'. No incluyas 'nan' ni cadenas sin sentido ni encabezados tipo 'Link:'.",
-			f"Carrera del usuario: {carrera}",
-			f"Asignaturas (limpias si aplican): {self._clean_subjects(asignaturas)}",
-			f"Soft skills (1–5): {soft_skills}",
-			"Para forzar diversidad, asigna estos estilos en orden (y repite si faltan): analítico, concreto, académico, orientado a impacto, motivador, estratégico.",
-			"Ofertas:",
-		]
-		focus = [
-			"operativo",
-			"académico",
-			"técnico",
-			"estratégico",
-			"proyección profesional"
-		]
-
-		for i, it in enumerate(items, 1):
-			style = styles[(i - 1) % len(styles)]
-			enfoque = focus[(i - 1) % len(focus)]
-			lines.append(
-				f"{i}) Cargo: {it.get('cargo','')}; "
-				f"Desc: {it.get('descripcion','')}; "
-				f"EURACE: {it.get('eurace_skills','')}; "
-				f"Skills: {it.get('skills','')}; "
-				f"Enfoque obligatorio: {enfoque}; "
-				f"Estilo: {style}"
+		head = (
+			f"{_BATCH_PROMPT_RULES}\n"
+			f"Carrera del usuario: {carrera}\n"
+			f"Asignaturas (limpias si aplican): {self._clean_subjects(asignaturas)}\n"
+			f"Soft skills (1–5): {soft_skills}\n"
+			f"{_BATCH_PROMPT_OFFERS}"
+		)
+		cargos, descs, eurace_list, skills_list, _ = self._to_soa(items)
+		ofertas = (
+			_BATCH_ITEM_FMT.format(
+				i=i, cargo=cargo, desc=desc[:_PROMPT_DESC_MAX], eur=eurace, sk=skills,
+				foc=_BATCH_FOCUS[(i - 1) % len(_BATCH_FOCUS)],
+				sty=_PROMPT_STYLES[(i - 1) % len(_PROMPT_STYLES)]
 			)
-		lines.append(f"Devuelve solo el arreglo JSON con {len(items)} elementos.")
-		return "\n".join(lines)
+			for i, (cargo, desc, eurace, skills) in enumerate(zip(cargos, descs, eurace_list, skills_list), 1)
+		)
+		return "\n".join((head, *ofertas, _BATCH_JSON_TAIL.format(n=len(items))))
 
 	def _build_alt_batch_prompt(
 		self,
@@ -558,17 +944,10 @@ class AIPersonalizer:
 		asignaturas: str,
 		soft_skills: List[int]
 	) -> str:
-		styles = [
-			"analítico",
-			"concreto",
-			"académico",
-			"orientado a impacto",
-			"motivador",
-			"estratégico",
-		]
+		styles = _PROMPT_STYLES
 		lines = [
-			"Genera EXACTAMENTE un arreglo JSON de cadenas (sin texto extra).",
-			"Cada elemento: 2–3 frases. Varía inicio y estilo entre elementos.",
+			_BATCH_JSON_SHAPE,
+			"Cada texto: 2–3 frases. Varía inicio y estilo entre elementos.",
 			"Enfócate en 1–2 habilidades blandas a mejorar (no resaltes las altas) y explica el beneficio (más ofertas, mejor remuneración, crecimiento).",
 			"Incluye un breve resumen del cargo y 1–2 skills técnicas solo si aportan. Prohibido 'encaja/encaje' y tokens ruidosos.",
 			f"Carrera del usuario: {carrera}",
@@ -577,15 +956,31 @@ class AIPersonalizer:
 			"Para diversidad, estilos sugeridos en orden: analítico, concreto, académico, orientado a impacto, motivador, estratégico.",
 			"Ofertas:",
 		]
-		for i, it in enumerate(items, 1):
+		for i, (cargo, desc, eurace, skills, sugeridas) in enumerate(zip(*self._to_soa(items)), 1):
 			style = styles[(i - 1) % len(styles)]
 			lines.append(
-				f"{i}) Cargo: {it.get('cargo','')}; Desc: {it.get('descripcion','')}; EURACE: {it.get('eurace_skills','')}; "
-				f"Skills: {it.get('skills','')}; Sugeridas: {it.get('suggest_soft','')}; Estilo: {style}"
+				f"{i}) Cargo: {cargo}; Desc: {desc[:_PROMPT_DESC_MAX]}; EURACE: {eurace}; "
+				f"Skills: {skills}; Sugeridas: {sugeridas}; Estilo: {style}"
 			)
-		lines.append(f"Devuelve solo el arreglo JSON con {len(items)} elementos.")
+		lines.append(_BATCH_JSON_TAIL.format(n=len(items)))
 		return "\n".join(lines)
 
+	def _to_soa(self, items: List[Dict[str, str]]) -> tuple:
+		"""Offer fields as parallel tuples: cargos, descripciones, EURACE, skills, sugeridas."""
+		# Un solo recorrido de los dicts; los bucles de lote indexan tuplas
+		return tuple(
+			tuple(it.get(k, '') for it in items)
+			for k in ('cargo', 'descripcion', 'eurace_skills', 'skills', 'suggest_soft')
+		)
+
+	def _has_offer_context(self, items: List[Dict[str, str]]) -> bool:
+		"""True if any offer has a description, EURACE or skills text to give the LLM."""
+		return any(
+			str(it.get(k) or '').strip()
+			for it in items
+			for k in ('descripcion', 'eurace_skills', 'skills')
+		)
+
 	def _spanish_join(self, parts: List[str]) -> str:
 		if not parts:
 			return ''
@@ -596,109 +991,47 @@ class AIPersonalizer:
 		return ", ".join(parts[:-1]) + f" y {parts[-1]}"
 
 	def _alt_extra_phrase(self, cargo: str, sugeridas: List[str], tech_skills: List[str]) -> str:
-		seed = int(hashlib.md5((cargo + '|' + ' '.join(sugeridas)).encode('utf-8')).hexdigest(), 16)
-		templates = [
-			"Si fortaleces {obj}, accederás a retos con mayor alcance y mejor proyección.",
-			"Al incorporar {obj}, ganarás tracción hacia proyectos de impacto y liderazgo.",
-			"Con {obj}, ampliarás tu margen para roles con mejores condiciones y responsabilidad.",
-			"Al desarrollar {obj}, acelerarás tu avance hacia posiciones de referencia.",
-			"Si potencias {obj}, destacarás en procesos con mayores exigencias técnicas y de gestión."
-		]
-		idx = seed % len(templates)
+		seed = _seed(cargo + '|' + ' '.join(sugeridas))
+		idx = seed % len(_ALT_TPLS)
 		if len(sugeridas) <= 1:
 			obj = f"esta habilidad ({self._spanish_join(sugeridas)})" if sugeridas else "tus habilidades blandas prioritarias"
 		else:
 			obj = f"estas habilidades ({self._spanish_join(sugeridas[:2])})"
-		extra = templates[idx].format(obj=obj)
+		extra = _ALT_TPLS[idx](obj=obj)
 		if tech_skills:
 			extra += f" En paralelo, tus bases técnicas en {self._spanish_join(tech_skills)} consolidarán tu aporte en el rol."
 		return extra
 
 	def _pick_skills(self, skills_text: str) -> List[str]:
-		st = (skills_text or '').strip()
-		if not st:
-			return []
-		# Dividir por coma/; y limpiar
-		parts = re.split(r"[;,]\s*", st)
-		clean = []
-		for p in parts:
-			p2 = p.strip()
-			# Evitar 'nan' o cadenas muy genéricas
-			if not p2 or self._is_noise_token(p2):
-				continue
-			# Limitar longitud y caracteres extraños
-			p2 = re.sub(r"\s+", " ", p2)
-			if len(p2) > 40:
-				continue
-			# Requiere al menos una letra; evita tokens dominados por dígitos/puntuación
-			if not re.search(r"[A-Za-zÁÉÍÓÚáéíóúñ]", p2):
-				continue
-			punct_ratio = (len(re.findall(r"[^\w\s]", p2)) / max(len(p2), 1))
-			digit_ratio = (len(re.findall(r"\d", p2)) / max(len(p2), 1))
-			if punct_ratio > 0.4 or digit_ratio > 0.4:
-				continue
-			clean.append(p2)
-		if not clean:
-			# fallback: separar por espacios y tomar tokens significativos
-			toks = [t for t in re.split(r"\s+", st) if len(t) > 2 and not self._is_noise_token(t) and re.search(r"[A-Za-zÁÉÍÓÚáéíóúñ]", t)]
-			clean = toks[:3]
-		return clean[:2]
-
-	def _parse_batch_lines(self, text: str, expected: int) -> List[str]:
-		if not text:
-			return []
-		# Dividir por líneas que comiencen con índice o guión
-		lines = [l.strip() for l in text.splitlines() if l.strip()]
-		# Filtrar encabezados o texto extra
-		cand: List[str] = []
-		for l in lines:
-			# Ignorar cercas de código, corchetes sueltos o etiquetas
-			if l in {"[", "]"} or l.startswith("```") or l.lower() in {"json", "arreglo", "array"}:
-				continue
-			m = re.match(r"^(?:\d+\.|- )\s*(.+)$", l)
-			cand.append(m.group(1).strip() if m else l)
-		# Recortar a expected
-		if len(cand) >= expected:
-			return cand[:expected]
-		return cand
-
-	def _parse_json_array(self, text: str, expected: int) -> List[str]:
-		# Intentar extraer un arreglo JSON aunque vengan cercas de código o texto extra
-		def _extract_json_slice(s: str) -> Optional[str]:
-			if not s:
-				return None
-			# remover cercas de código en bloque
-			s_clean = re.sub(r"^```(?:json|JSON)?\s*", "", s.strip())
-			s_clean = s_clean.replace("```", "").strip()
-			# si es JSON válido tal cual
-			try:
-				json.loads(s_clean)
-				return s_clean
-			except Exception:
-				pass
-			# buscar el primer segmento que aparenta ser un arreglo JSON
-			m = re.search(r"\[[\s\S]*\]", s_clean)
-			if m:
-				return m.group(0)
-			return None
+		# Las mismas skills se repiten entre ofertas y textos: se analizan una sola vez
+		return list(_pick_skills_text((skills_text or '').strip()))
+
+	def _parse_json_items(self, text: str, expected: int) -> List[str]:
+		"""Texts of a {"items": [{"idx", "text"}]} answer placed by idx ('' for gaps); [] if unusable."""
 		try:
-			jtxt = _extract_json_slice(text)
-			if not jtxt:
-				return []
-			data = json.loads(jtxt)
-			if isinstance(data, list):
-				vals = [self._clean_text_out(str(x)) for x in data]
-				if len(vals) >= expected:
-					return vals[:expected]
-				return vals
+			data = _json_loads(text) if text else None
 		except Exception:
 			return []
+		entries = data.get('items') if isinstance(data, dict) else None
+		if not isinstance(entries, list):
+			return []
+		texts = [''] * expected
+		for entry in entries:
+			if not isinstance(entry, dict):
+				continue
+			idx, val = entry.get('idx'), entry.get('text')
+			if isinstance(idx, int) and 1 <= idx <= expected and isinstance(val, str):
+				texts[idx - 1] = self._clean_text_out(val)
+		return texts if any(texts) else []
 
 	def _enforce_diversity(self, lines: List[str], items: List[Dict[str, str]], carrera: str) -> List[str]:
 		seen: set = set()
 		diverse: List[str] = []
 		for idx, line in enumerate(lines):
-			skel = re.sub(r"[^a-z0-9áéíóúñ]+", " ", line.lower()).strip()
+			if not line:
+				diverse.append(line)
+				continue
+			skel = _RE_SKELETON.sub(" ", line.lower()).strip()
 			if skel in seen:
 				# Añadir rasgo distintivo breve usando skills o EURACE
 				tech = self._pick_skills(items[idx].get('skills', ''))
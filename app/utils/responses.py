@@ -1,6 +1,45 @@
 """Error handling and response formatting"""
-from flask import jsonify
-from typing import Dict, Any
+from flask import jsonify, request, Response
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+from typing import Dict, Any, Optional
+import hashlib
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional: sin él se usa el proveedor JSON por defecto de Flask
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack es opcional: sin él todas las respuestas son JSON
+    msgpack = None
+
+MSGPACK_MIMETYPE = 'application/msgpack'
+
+
+if orjson is not None:
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson (keys sorted, as with the default provider)"""
+        
+        _OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        
+        def _dumpb(self, obj: Any) -> bytes:
+            # Tipos que orjson no conoce (Decimal, __html__, ...) como los serializa Flask
+            return orjson.dumps(obj, default=DefaultJSONProvider.default, option=self._OPTIONS)
+        
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            return self._dumpb(obj).decode('utf-8')
+        
+        def loads(self, s, **kwargs: Any) -> Any:
+            return orjson.loads(s)
+        
+        def response(self, *args: Any, **kwargs: Any):
+            # Los bytes de orjson van directos al cuerpo, sin pasar por str
+            obj = self._prepare_response_obj(args, kwargs)
+            return self._app.response_class(self._dumpb(obj), mimetype='application/json')
+else:
+    OrjsonProvider = None
 
 
 class APIError(Exception):
@@ -30,7 +69,9 @@ class ServerError(APIError):
         super().__init__(message, status_code=500, details=details)
 
 
-def success_response(data: Any, message: str = "Success", status_code: int = 200) -> tuple:
+def success_response(data: Any, message: str = "Success", status_code: int = 200,
+                     etag: Optional[str] = None, cache_seconds: Optional[int] = None,
+                     no_store: bool = False) -> tuple:
     """
     Create a success response
     
@@ -38,15 +79,80 @@ def success_response(data: Any, message: str = "Success", status_code: int = 200
         data: Response data
         message: Success message
         status_code: HTTP status code
+        etag: Optional ETag for the response
+        cache_seconds: Optional max-age for a public Cache-Control header
+        no_store: Mark the response private and not storable (per-user content)
         
     Returns:
         Tuple of (response_dict, status_code)
     """
-    return jsonify({
+    response = _body_response({
         'success': True,
         'message': message,
         'data': data
-    }), status_code
+    })
+    _set_cache_headers(response, etag, cache_seconds, no_store)
+    return response, status_code
+
+
+def wants_msgpack() -> bool:
+    """True if the current request prefers msgpack (Accept) and msgpack is installed"""
+    if msgpack is None:
+        return False
+    return request.accept_mimetypes.best_match(['application/json', MSGPACK_MIMETYPE]) == MSGPACK_MIMETYPE
+
+
+def _msgpack_default(obj: Any) -> Any:
+    # Escalares de NumPy y tipos que msgpack no conoce
+    if hasattr(obj, 'item'):
+        return obj.item()
+    return str(obj)
+
+
+def _body_response(body: Dict[str, Any]) -> Response:
+    """JSON response, or msgpack when the client asks for it with Accept"""
+    if msgpack is None:
+        return jsonify(body)
+    if wants_msgpack():
+        response = Response(msgpack.packb(body, default=_msgpack_default), mimetype=MSGPACK_MIMETYPE)
+    else:
+        response = jsonify(body)
+    # El formato depende de Accept: las cachés deben distinguirlo
+    response.vary.add('Accept')
+    return response
+
+
+def request_etag(*parts: Any) -> str:
+    """Short ETag derived from the (JSON-serializable) inputs that determine a response"""
+    raw = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def etag_matches(etag: str) -> bool:
+    """True if the request's If-None-Match already holds etag"""
+    if etag in request.if_none_match:
+        return True
+    # Flask-Compress añade ':<algoritmo>' al ETag de las respuestas comprimidas
+    return any(tag.rpartition(':')[0] == etag for tag in request.if_none_match)
+
+
+def not_modified_response(etag: str, cache_seconds: Optional[int] = None) -> Response:
+    """Empty 304 response for a request whose If-None-Match already holds etag"""
+    response = Response(status=304)
+    _set_cache_headers(response, etag, cache_seconds)
+    return response
+
+
+def _set_cache_headers(response: Response, etag: Optional[str], cache_seconds: Optional[int],
+                       no_store: bool = False) -> None:
+    if etag:
+        response.set_etag(etag)
+    if no_store:
+        response.cache_control.private = True
+        response.cache_control.no_store = True
+    elif cache_seconds is not None:
+        response.cache_control.public = True
+        response.cache_control.max_age = cache_seconds
 
 
 def error_response(message: str, status_code: int = 400, details: str = None) -> tuple:
@@ -69,7 +175,7 @@ def error_response(message: str, status_code: int = 400, details: str = None) ->
     if details:
         response['details'] = details
     
-    return jsonify(response), status_code
+    return _body_response(response), status_code
 
 
 def handle_api_error(error: APIError) -> tuple:
@@ -89,6 +195,10 @@ def handle_api_error(error: APIError) -> tuple:
     )
 
 
+# Campos de cada recomendación en la respuesta, en orden
+_RECOMMENDATION_FIELDS = ('rank', 'similitud', 'cargo', 'descripcion', 'eurace_skills', 'skills')
+
+
 def format_recommendation(rec: Dict[str, Any]) -> Dict[str, Any]:
     """
     Format a single recommendation for response
@@ -128,7 +238,14 @@ def format_recommendations_response(recommendations_df, carrera: str) -> Dict[st
             'mensaje': 'No hay ofertas disponibles para esta carrera'
         }
     
-    recomendaciones = [format_recommendation(row.to_dict()) for _, row in recommendations_df.iterrows()]
+    # Mismo resultado que format_recommendation por fila, pero columna a columna
+    cols = list(_RECOMMENDATION_FIELDS)
+    df = recommendations_df[[c for c in cols if c in recommendations_df.columns]].copy()
+    for col in cols:
+        if col not in df.columns:
+            df[col] = 0 if col == 'similitud' else None
+    df['similitud'] = df['similitud'].astype('float64').round(4)
+    recomendaciones = df[cols].to_dict(orient='records')
     
     return {
         'carrera': carrera,
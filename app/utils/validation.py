@@ -32,13 +32,11 @@ def validate_carrera(carrera: str) -> str:
         return mapped_carrera
     
     # Try case-insensitive matching with available careers
-    available = CarreraMapper.get_available_careers()
-    carrera_lower = carrera.lower()
-    
-    for available_carrera in available:
-        if available_carrera.lower() == carrera_lower:
-            return available_carrera
+    available_carrera = CarreraMapper.find_available_career(carrera)
+    if available_carrera:
+        return available_carrera
     
+    available = CarreraMapper.get_available_careers()
     raise ValidationError(
         f"Carrera '{carrera}' no válida. Carreras disponibles: {', '.join(available[:5])}..."
     )
@@ -11,19 +11,25 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-key-change-in-production'
     DEBUG = False
     TESTING = False
-    JSON_SORT_KEYS = False
     
     # Data paths
     # Nota: aunque el nombre es DATA_DIR, aquí apunta al archivo por compatibilidad
     DATA_DIR = BASE_DIR / 'datos_procesados.pkl'
     # URL opcional para descargar el pickle si no existe o es puntero LFS
     DATA_URL = os.environ.get('DATA_URL')
+    # Servidor Git LFS opcional (por defecto se deriva del remoto 'origin')
+    LFS_URL = os.environ.get('LFS_URL')
     CARRERAS_EPN_CSV = BASE_DIR / 'carreras_epn' / 'carreras_epn.csv'
     OFERTAS_BASE_DIR = BASE_DIR / 'todas_las_plataformas'
     
     # API settings
+    # Tope del cuerpo de las peticiones: una predicción ocupa unos cientos de bytes
+    MAX_CONTENT_LENGTH = 64 * 1024
     MAX_RECOMMENDATIONS = 10
     DEFAULT_RECOMMENDATIONS = 5
+    # Compresión de respuestas (Flask-Compress, si está instalado) según Accept-Encoding;
+    # los eventos de /predict/stream no se comprimen para no retrasar su envío
+    COMPRESS_ALGORITHM = ['br', 'gzip']
     
     # CORS settings
     CORS_ORIGINS = [
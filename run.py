@@ -8,21 +8,33 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from app import create_app
 
+# Get environment
+env = os.environ.get('FLASK_ENV', 'development')
+
+# Create app (a nivel de módulo para servidores WSGI: gunicorn run:app)
+app = create_app(env)
+
 if __name__ == '__main__':
-    # Get environment
-    env = os.environ.get('FLASK_ENV', 'development')
-    
-    # Create app
-    app = create_app(env)
-    
     # Run app
     print(f"Starting Flask app in {env} mode...")
     print(f"Server running on http://localhost:5000")
     print(f"API documentation available at /api/recommendations/info")
-    
-    app.run(
-        host='0.0.0.0',
-        port=5000,
-        debug=(env == 'development'),
-        use_reloader=(env == 'development')
-    )
+
+    if env == 'development':
+        app.run(
+            host='0.0.0.0',
+            port=5000,
+            debug=True,
+            use_reloader=True
+        )
+    else:
+        # Fuera de desarrollo: servidor WSGI con hilos; los datos cargados se
+        # comparten entre todas las peticiones del proceso
+        threads = int(os.environ.get('WSGI_THREADS', '8') or 8)
+        try:
+            from waitress import serve
+        except ImportError:
+            print("waitress not installed; falling back to the threaded Flask server")
+            app.run(host='0.0.0.0', port=5000, debug=False, use_reloader=False, threaded=True)
+        else:
+            serve(app, host='0.0.0.0', port=5000, threads=threads)
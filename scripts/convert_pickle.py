@@ -0,0 +1,68 @@
+"""Convert datos_procesados.pkl to the out-of-band (protocol 5) layout
+
+Uso:
+    python scripts/convert_pickle.py [origen] [destino]
+    python scripts/convert_pickle.py --zstd [origen] [destino]
+
+Por defecto convierte app/datos_procesados.pkl en el mismo lugar. DataManager
+detecta el nuevo formato por su cabecera y mapea los buffers en memoria sin
+copiarlos; el pickle clásico sigue siendo compatible.
+
+Con --zstd escribe en cambio un pickle protocolo 5 comprimido con zstd (nivel 3,
+destino por defecto app/datos_procesados.pkl.zst): ocupa menos en disco y en
+Git LFS, a cambio de descomprimir en streaming al cargar (sin mmap).
+"""
+import os
+import sys
+import pickle
+from pathlib import Path
+
+# Add project root to path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from app.models.data_manager import DataManager, dump_oob_pickle, OOB_MAGIC, ZSTD_MAGIC
+
+
+def dump_zstd_pickle(obj, dest_path: Path, level: int = 3) -> None:
+    import zstandard as zstd
+
+    with open(dest_path, 'wb') as out:
+        with zstd.ZstdCompressor(level=level).stream_writer(out, closefd=False) as writer:
+            pickle.dump(obj, writer, protocol=5)
+
+
+def main(argv: list) -> int:
+    args = [a for a in argv[1:] if a != '--zstd']
+    use_zstd = len(args) != len(argv) - 1
+
+    src = Path(args[0]) if args else ROOT_DIR / 'app' / 'datos_procesados.pkl'
+    if len(args) > 1:
+        dest = Path(args[1])
+    else:
+        dest = src.with_name(src.name + '.zst') if use_zstd else src
+
+    with open(src, 'rb') as f:
+        magic = f.read(len(OOB_MAGIC))
+    if magic == OOB_MAGIC and not use_zstd:
+        print(f"{src} ya está en formato out-of-band")
+        return 0
+    if magic.startswith(ZSTD_MAGIC) and use_zstd:
+        print(f"{src} ya está comprimido con zstd")
+        return 0
+    # DataManager sabe leer cualquiera de los formatos de origen
+    obj = DataManager()._read_pickle(src)
+
+    # Escritura atómica: primero a un temporal junto al destino
+    tmp = dest.with_name(dest.name + '.tmp')
+    if use_zstd:
+        dump_zstd_pickle(obj, tmp)
+    else:
+        dump_oob_pickle(obj, tmp)
+    os.replace(tmp, dest)
+    print(f"✓ {src} -> {dest} ({dest.stat().st_size / 1e6:.1f} MB)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,51 @@
+"""Precompute the 76D job offer matrices of every career
+
+Uso:
+    python scripts/precompute_offers.py [carrera ...]
+
+Vectoriza las ofertas de cada carrera de CARRERA_TO_CSV con el mismo código del
+endpoint (RecommendationEngine.build_offer_vectors) y escribe en app/precomputed/
+un .feather con las ofertas y un .npy con la matriz 76D. DataManager los mapea en
+memoria en lugar de tokenizar los CSV en la primera petición. Junto a ellos se
+guarda un .version con la versión de las ofertas (preprocesado, CSV y
+datos_procesados.pkl); si alguno cambia, DataManager ignora el bundle hasta que se
+vuelva a ejecutar este script.
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from app.models.data_manager import (
+    CarreraMapper, PRECOMPUTED_DIR, offer_bundle_paths, offer_bundle_version_path, write_offer_files
+)
+from app.models.recommender import RecommendationEngine
+
+
+def main(argv: list) -> int:
+    careers = argv[1:] or CarreraMapper.get_available_careers()
+    PRECOMPUTED_DIR.mkdir(parents=True, exist_ok=True)
+    engine = RecommendationEngine()
+
+    failed = 0
+    for carrera in careers:
+        bundle = engine.build_offer_vectors(carrera)
+        if bundle is None:
+            print(f"✗ {carrera}: sin ofertas")
+            failed += 1
+            continue
+        df_ofertas, vectores_76d = bundle
+        feather_path, npy_path = offer_bundle_paths(carrera)
+        write_offer_files(df_ofertas, vectores_76d, feather_path, npy_path)
+        offer_bundle_version_path(carrera).write_text(
+            engine.data_manager.offers_version(carrera), encoding='utf-8'
+        )
+        print(f"✓ {carrera}: {len(df_ofertas)} ofertas -> {feather_path.name}")
+
+    return 1 if failed == len(careers) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,81 @@
+"""Split datos_procesados.pkl into one artifact per field
+
+Uso:
+    python scripts/split_pickle.py [origen.pkl] [directorio_destino]
+
+Genera habilidades.json, grupos_bge_ngram.json, ofertas_por_carrera.json,
+las matrices TF-IDF en Feather sin comprimir (mapeables en memoria) y la
+matriz académica como CSR float32 (.npz). Por defecto escribe en
+app/datos_procesados/, ruta que DataManager prioriza sobre el pickle; cada
+propiedad lee solo su archivo la primera vez que se usa.
+"""
+import sys
+import json
+import mmap
+import pickle
+from pathlib import Path
+
+# Add project root to path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.feather as feather
+from scipy import sparse
+
+from app.models.data_manager import BUNDLE_FILES, OOB_MAGIC, _load_oob_pickle
+
+
+def load_source(src: Path) -> dict:
+    with open(src, 'rb') as f:
+        if f.read(len(OOB_MAGIC)) == OOB_MAGIC:
+            return _load_oob_pickle(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        f.seek(0)
+        return pickle.load(f)
+
+
+def write_field(value, path: Path) -> None:
+    if path.suffix == '.json':
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(value, f, ensure_ascii=False)
+        return
+    if path.suffix == '.npz':
+        sparse.save_npz(path, value)
+        return
+    df = value
+    # Arrow exige nombres de columna tipo str
+    if not all(isinstance(c, str) for c in df.columns):
+        df = df.rename(columns=str)
+    if path.suffix == '.feather':
+        # El índice (carreras / grupos) viaja en los metadatos pandas de la tabla
+        feather.write_feather(pa.Table.from_pandas(df), path, compression='uncompressed')
+        return
+    df.to_parquet(path)
+
+
+def main(argv: list) -> int:
+    src = Path(argv[1]) if len(argv) > 1 else ROOT_DIR / 'app' / 'datos_procesados.pkl'
+    dest = Path(argv[2]) if len(argv) > 2 else ROOT_DIR / 'app' / 'datos_procesados'
+    datos = load_source(src)
+    # Variante CSR float32 de la matriz académica y sus ejes
+    tfidf = datos.get('tfidf_epn_69d')
+    if tfidf is not None:
+        datos['tfidf_epn_69d_sparse'] = sparse.csr_matrix(tfidf.to_numpy(dtype=np.float32))
+        datos['tfidf_epn_69d_labels'] = {
+            'index': [str(i) for i in tfidf.index],
+            'columns': [str(c) for c in tfidf.columns],
+        }
+    dest.mkdir(parents=True, exist_ok=True)
+    for key, filename in BUNDLE_FILES.items():
+        value = datos.get(key)
+        if value is None:
+            print(f"⚠️ Campo '{key}' ausente en {src}; se omite")
+            continue
+        write_field(value, dest / filename)
+        print(f"✓ {key} -> {dest / filename}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
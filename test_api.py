@@ -3,24 +3,146 @@ Test Script - Backend API
 Ejemplos de uso del backend Flask
 """
 
+import atexit
+import functools
+import io
+import sys
+import threading
 import requests
 import json
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional: sin él se usa json de la biblioteca estándar
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack es opcional: sin él se piden respuestas JSON
+    msgpack = None
+
+try:
+    import brotli  # noqa: F401 - urllib3 lo usa para descomprimir respuestas 'br'
+    ACCEPT_ENCODING = "br, gzip"
+except ImportError:
+    ACCEPT_ENCODING = "gzip"
 
 BASE_URL = "http://localhost:5000/api/recommendations"
+URL_HEALTH = f"{BASE_URL}/health"
+URL_CAREERS = f"{BASE_URL}/careers"
+URL_SOFT_SKILLS_LABELS = f"{BASE_URL}/soft-skills-labels"
+URL_INFO = f"{BASE_URL}/info"
+URL_META = f"{BASE_URL}/meta"
+URL_PREDICT = f"{BASE_URL}/predict"
+URL_PREDICT_BATCH = f"{BASE_URL}/predict/batch"
+
+# Una sola sesión para todos los tests: reutiliza conexiones (keep-alive) en vez de
+# abrir una nueva por petición
+SESSION = requests.Session()
+# Con msgpack instalado se piden respuestas binarias (más compactas); el servidor
+# responde JSON si no lo soporta
+SESSION.headers.update({
+    "Accept": "application/msgpack, application/json;q=0.9" if msgpack is not None else "application/json",
+    # Respuestas comprimidas si el servidor usa Flask-Compress (requests las descomprime)
+    "Accept-Encoding": ACCEPT_ENCODING
+})
+SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+atexit.register(SESSION.close)
+
+
+def get_session() -> requests.Session:
+    """Shared HTTP session (mount adapters on it to add retries or timeouts)"""
+    return SESSION
+
+
+def _encode(payload: Dict[str, Any]) -> bytes:
+    """JSON body bytes for a request payload"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+def _json(response: requests.Response) -> Any:
+    """Decode a JSON (or msgpack) response body straight from its bytes"""
+    if msgpack is not None and response.headers.get("Content-Type", "").startswith("application/msgpack"):
+        return msgpack.unpackb(response.content, raw=False)
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
-# Colores para output
-GREEN = '\033[92m'
-BLUE = '\033[94m'
-RED = '\033[91m'
-END = '\033[0m'
+
+# Cuerpos de las peticiones, serializados una sola vez (los dicts quedan para mostrarlos)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+PAYLOAD1_DICT = {
+    "carrera": "Ingenieria En Software",
+    "asignaturas": "Java, Spring Boot, React, REST APIs, Git, Docker",
+    "soft_skills": [3, 4, 2, 4, 4, 3, 5],  # Liderazgo bajo, Aprendizaje alto
+    "top_n": 5
+}
+PAYLOAD2_DICT = {
+    "carrera": "Ciencias De Datos E Inteligencia Artificial",
+    "asignaturas": "Machine Learning, Python, TensorFlow, Deep Learning, Statistics, SQL",
+    "soft_skills": [5, 5, 4, 5, 5, 4, 5],  # All high (Senior level)
+    "top_n": 5
+}
+PAYLOAD3_DICT = {
+    "carrera": "Ingenieria Civil",
+    "asignaturas": "Estructuras, AutoCAD, Hormigón Armado, Topografía",
+    "soft_skills": [4, 3, 3, 4, 4, 4, 3],
+    "top_n": 3
+}
+PAYLOAD1 = _encode(PAYLOAD1_DICT)
+PAYLOAD2 = _encode(PAYLOAD2_DICT)
+PAYLOAD3 = _encode(PAYLOAD3_DICT)
+
+# Los tres ejemplos de predicción en un solo request a /predict/batch
+PREDICT_BATCH_PAYLOAD = _encode({"requests": [PAYLOAD1_DICT, PAYLOAD2_DICT, PAYLOAD3_DICT]})
+
+# Predicción mínima para calentar el servidor antes de los tests
+WARMUP_PAYLOAD = _encode({
+    "carrera": "Ingenieria En Software",
+    "asignaturas": "x",
+    "soft_skills": [3, 3, 3, 3, 3, 3, 3],
+    "top_n": 1
+})
+
+ERROR_PAYLOAD_CAREER = _encode({
+    "carrera": "Carrera Inexistente",
+    "soft_skills": [1, 1, 1, 1, 1, 1, 1]
+})
+ERROR_PAYLOAD_SKILLS_LEN = _encode({
+    "carrera": "Ingenieria En Software",
+    "soft_skills": [1, 1, 1, 1, 1, 1]  # Solo 6
+})
+ERROR_PAYLOAD_SKILLS_RANGE = _encode({
+    "carrera": "Ingenieria En Software",
+    "soft_skills": [1, 2, 3, 4, 5, 6, 1]  # 6 es inválido
+})
+
+# Casos de test_error_handling: (etiqueta, cuerpo, largo máximo del mensaje mostrado o None)
+ERROR_CASES = (
+    ("[8a] Carrera inválida", ERROR_PAYLOAD_CAREER, 60),
+    ("[8b] Soft skills inválidos (6 en lugar de 7)", ERROR_PAYLOAD_SKILLS_LEN, None),
+    ("[8c] Valor de soft skill fuera de rango (6)", ERROR_PAYLOAD_SKILLS_RANGE, None),
+)
+
+# Colores para output (solo en terminal: redirigido a archivo o CI, texto plano)
+_TTY = sys.stdout.isatty()
+GREEN = '\033[92m' if _TTY else ''
+BLUE = '\033[94m' if _TTY else ''
+RED = '\033[91m' if _TTY else ''
+END = '\033[0m' if _TTY else ''
+HEADER_SEP = f"{BLUE}{'='*80}{END}"
 
 
 def print_header(title: str):
     """Print formatted header"""
-    print(f"\n{BLUE}{'='*80}{END}")
-    print(f"{BLUE}{title.center(80)}{END}")
-    print(f"{BLUE}{'='*80}{END}\n")
+    print(f"\n{HEADER_SEP}\n{BLUE}{title.center(80)}{END}\n{HEADER_SEP}\n")
 
 
 def print_success(text: str):
@@ -35,100 +157,162 @@ def print_error(text: str):
 
 def print_json(data: Dict[str, Any], indent: int = 2):
     """Print formatted JSON"""
-    print(json.dumps(data, indent=indent, ensure_ascii=False))
+    # orjson solo sangra con 2 espacios; otros anchos usan json de la biblioteca estándar
+    if orjson is not None and indent == 2:
+        print(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8'))
+    else:
+        print(json.dumps(data, indent=indent, ensure_ascii=False))
+
+
+class _ThreadOutput(io.TextIOBase):
+    """sys.stdout stand-in that sends each thread's output to its own buffer while capturing"""
+
+    def __init__(self, target):
+        self.target = target
+        self._local = threading.local()
 
+    def write(self, s: str) -> int:
+        buf = getattr(self._local, 'buf', None)
+        return (buf if buf is not None else self.target).write(s)
 
-def test_health_check():
-    """Test 1: Health check"""
+    def flush(self):
+        self.target.flush()
+
+    def capture(self, fn) -> str:
+        self._local.buf = io.StringIO()
+        try:
+            fn()
+            return self._local.buf.getvalue()
+        finally:
+            self._local.buf = None
+
+
+def run_tests(tests):
+    """Run independent tests concurrently; each test's output is buffered and written in one go, in order"""
+    out = _ThreadOutput(sys.stdout)
+    sys.stdout = out
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as ex:
+            futures = [ex.submit(out.capture, fn) for fn in tests]
+            texts = [f.result() for f in futures]
+    finally:
+        sys.stdout = out.target
+    for text in texts:
+        sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def _render_recommendations(recs, show_desc: bool = False, show_skills: bool = False):
+    """Print one block per recommendation: rank, cargo, similitud and optionally description/skills"""
+    for rec in recs:
+        print(f"  Rank {rec['rank']}: {rec['cargo']}")
+        print(f"    Similitud: {rec['similitud']:.4f}")
+        if show_desc:
+            print(f"    Descripción: {rec['descripcion'][:60]}...")
+        if show_skills:
+            print(f"    Skills: {rec['skills'][:60]}...")
+        print()
+
+
+def safe_test(fn):
+    """Report any exception raised by a test as a failed check instead of stopping the run"""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            print_error(f"Error: {e}")
+    return wrapper
+
+
+def _get(url: str) -> Dict[str, Any]:
+    """Body of a GET request; a non-200 status counts as a failed response"""
+    response = SESSION.get(url)
+    data = _json(response)
+    if response.status_code != 200:
+        data['success'] = False
+    return data
+
+
+@safe_test
+def test_health_check(data: Dict[str, Any] = None):
+    """Test 1: Health check (data: response body already fetched, e.g. from /meta)"""
     print_header("TEST 1: Health Check")
     
-    try:
-        response = requests.get(f"{BASE_URL}/health")
-        data = response.json()
-        
-        if data['success'] and response.status_code == 200:
-            print_success("API está saludable")
-            print(f"Estado: {data['data']['status']}")
-            print(f"Datos cargados: {data['data']['data_loaded']}")
-        else:
-            print_error("Health check falló")
-    except Exception as e:
-        print_error(f"Error: {e}")
+    if data is None:
+        data = _get(URL_HEALTH)
+    
+    if data['success']:
+        print_success("API está saludable")
+        print(f"Estado: {data['data']['status']}")
+        print(f"Datos cargados: {data['data']['data_loaded']}")
+    else:
+        print_error("Health check falló")
 
 
-def test_get_careers():
-    """Test 2: Get available careers"""
+@safe_test
+def test_get_careers(data: Dict[str, Any] = None):
+    """Test 2: Get available careers (data: response body already fetched, e.g. from /meta)"""
     print_header("TEST 2: Carreras Disponibles")
     
-    try:
-        response = requests.get(f"{BASE_URL}/careers")
-        data = response.json()
-        
-        if data['success']:
-            careers = data['data']['careers']
-            print_success(f"Total de carreras: {len(careers)}")
-            print("\nPrimeras 10 carreras:")
-            for i, career in enumerate(careers[:10], 1):
-                print(f"  {i:2d}. {career}")
-        else:
-            print_error("No se pudieron obtener las carreras")
-    except Exception as e:
-        print_error(f"Error: {e}")
+    if data is None:
+        data = _get(URL_CAREERS)
+    
+    if data['success']:
+        careers = data['data']['careers']
+        print_success(f"Total de carreras: {len(careers)}")
+        print("\nPrimeras 10 carreras:")
+        for i, career in enumerate(careers[:10], 1):
+            print(f"  {i:2d}. {career}")
+    else:
+        print_error("No se pudieron obtener las carreras")
 
 
-def test_get_soft_skills_labels():
-    """Test 3: Get soft skills labels"""
+@safe_test
+def test_get_soft_skills_labels(data: Dict[str, Any] = None):
+    """Test 3: Get soft skills labels (data: response body already fetched, e.g. from /meta)"""
     print_header("TEST 3: Etiquetas de Habilidades Blandas")
     
-    try:
-        response = requests.get(f"{BASE_URL}/soft-skills-labels")
-        data = response.json()
-        
-        if data['success']:
-            labels = data['data']['labels']
-            print_success(f"Total de habilidades blandas: {len(labels)}")
-            print("\nDimensiones de soft skills:")
-            for i, label in enumerate(labels, 69):
-                print(f"  [{i}] {label}")
-        else:
-            print_error("No se pudieron obtener las etiquetas")
-    except Exception as e:
-        print_error(f"Error: {e}")
+    if data is None:
+        data = _get(URL_SOFT_SKILLS_LABELS)
+    
+    if data['success']:
+        labels = data['data']['labels']
+        print_success(f"Total de habilidades blandas: {len(labels)}")
+        print("\nDimensiones de soft skills:")
+        for i, label in enumerate(labels, 69):
+            print(f"  [{i}] {label}")
+    else:
+        print_error("No se pudieron obtener las etiquetas")
 
 
-def test_api_info():
-    """Test 4: Get API info"""
+@safe_test
+def test_api_info(data: Dict[str, Any] = None):
+    """Test 4: Get API info (data: response body already fetched, e.g. from /meta)"""
     print_header("TEST 4: Información de la API")
     
-    try:
-        response = requests.get(f"{BASE_URL}/info")
-        data = response.json()
-        
-        if data['success']:
-            info = data['data']
-            print_success("Información de API obtenida")
-            print(f"Versión: {info['version']}")
-            print(f"Nombre: {info['name']}")
-            print(f"Dimensiones técnicas: {info['technical_skills_dimensions']}")
-            print(f"Dimensiones soft skills: {info['soft_skills_dimensions']}")
-            print(f"Total: {info['total_dimensions']}")
-            print(f"Carreras disponibles: {info['available_careers_count']}")
-        else:
-            print_error("No se pudo obtener información de API")
-    except Exception as e:
-        print_error(f"Error: {e}")
+    if data is None:
+        data = _get(URL_INFO)
+    
+    if data['success']:
+        info = data['data']
+        print_success("Información de API obtenida")
+        print(f"Versión: {info['version']}")
+        print(f"Nombre: {info['name']}")
+        print(f"Dimensiones técnicas: {info['technical_skills_dimensions']}")
+        print(f"Dimensiones soft skills: {info['soft_skills_dimensions']}")
+        print(f"Total: {info['total_dimensions']}")
+        print(f"Carreras disponibles: {info['available_careers_count']}")
+    else:
+        print_error("No se pudo obtener información de API")
 
 
-def test_prediction_example1():
-    """Test 5: Prediction - Ingeniero de Software"""
+@safe_test
+def test_prediction_example1(data: Dict[str, Any] = None):
+    """Test 5: Prediction - Ingeniero de Software (data: response body already fetched, e.g. from the batch endpoint)"""
     print_header("TEST 5: Recomendaciones - Ingeniero de Software")
     
-    payload = {
-        "carrera": "Ingenieria En Software",
-        "asignaturas": "Java, Spring Boot, React, REST APIs, Git, Docker",
-        "soft_skills": [3, 4, 2, 4, 4, 3, 5],  # Liderazgo bajo, Aprendizaje alto
-        "top_n": 5
-    }
+    payload = PAYLOAD1_DICT
     
     print("Request:")
     print(f"  Carrera: {payload['carrera']}")
@@ -136,37 +320,26 @@ def test_prediction_example1():
     print(f"  Soft Skills: {payload['soft_skills']}")
     print(f"  Top N: {payload['top_n']}\n")
     
-    try:
-        response = requests.post(f"{BASE_URL}/predict", json=payload)
-        data = response.json()
+    if data is None:
+        data = _post_prediction(payload, PAYLOAD1)
+    
+    if data['success']:
+        print_success("Recomendaciones obtenidas")
+        resultado = data['data']
+        print(f"\nCarrera: {resultado['carrera']}")
+        print(f"Recomendaciones: {resultado['num_recomendaciones']}\n")
         
-        if data['success']:
-            print_success("Recomendaciones obtenidas")
-            resultado = data['data']
-            print(f"\nCarrera: {resultado['carrera']}")
-            print(f"Recomendaciones: {resultado['num_recomendaciones']}\n")
-            
-            for rec in resultado['recomendaciones']:
-                print(f"  Rank {rec['rank']}: {rec['cargo']}")
-                print(f"    Similitud: {rec['similitud']:.4f}")
-                print(f"    Descripción: {rec['descripcion'][:60]}...")
-                print()
-        else:
-            print_error(f"Error: {data['message']}")
-    except Exception as e:
-        print_error(f"Error: {e}")
+        _render_recommendations(resultado['recomendaciones'], show_desc=True)
+    else:
+        print_error(f"Error: {data['message']}")
 
 
-def test_prediction_example2():
-    """Test 6: Prediction - Científico de Datos"""
+@safe_test
+def test_prediction_example2(data: Dict[str, Any] = None):
+    """Test 6: Prediction - Científico de Datos (data: response body already fetched, e.g. from the batch endpoint)"""
     print_header("TEST 6: Recomendaciones - Científico de Datos")
     
-    payload = {
-        "carrera": "Ciencias De Datos E Inteligencia Artificial",
-        "asignaturas": "Machine Learning, Python, TensorFlow, Deep Learning, Statistics, SQL",
-        "soft_skills": [5, 5, 4, 5, 5, 4, 5],  # All high (Senior level)
-        "top_n": 5
-    }
+    payload = PAYLOAD2_DICT
     
     print("Request:")
     print(f"  Carrera: {payload['carrera']}")
@@ -174,37 +347,26 @@ def test_prediction_example2():
     print(f"  Soft Skills: {payload['soft_skills']}")
     print(f"  Top N: {payload['top_n']}\n")
     
-    try:
-        response = requests.post(f"{BASE_URL}/predict", json=payload)
-        data = response.json()
+    if data is None:
+        data = _post_prediction(payload, PAYLOAD2)
+    
+    if data['success']:
+        print_success("Recomendaciones obtenidas")
+        resultado = data['data']
+        print(f"\nCarrera: {resultado['carrera']}")
+        print(f"Recomendaciones: {resultado['num_recomendaciones']}\n")
         
-        if data['success']:
-            print_success("Recomendaciones obtenidas")
-            resultado = data['data']
-            print(f"\nCarrera: {resultado['carrera']}")
-            print(f"Recomendaciones: {resultado['num_recomendaciones']}\n")
-            
-            for rec in resultado['recomendaciones'][:3]:  # Show top 3
-                print(f"  Rank {rec['rank']}: {rec['cargo']}")
-                print(f"    Similitud: {rec['similitud']:.4f}")
-                print(f"    Skills: {rec['skills'][:60]}...")
-                print()
-        else:
-            print_error(f"Error: {data['message']}")
-    except Exception as e:
-        print_error(f"Error: {e}")
+        _render_recommendations(resultado['recomendaciones'][:3], show_skills=True)  # Show top 3
+    else:
+        print_error(f"Error: {data['message']}")
 
 
-def test_prediction_example3():
-    """Test 7: Prediction - Ingeniero Civil"""
+@safe_test
+def test_prediction_example3(data: Dict[str, Any] = None):
+    """Test 7: Prediction - Ingeniero Civil (data: response body already fetched, e.g. from the batch endpoint)"""
     print_header("TEST 7: Recomendaciones - Ingeniero Civil")
     
-    payload = {
-        "carrera": "Ingenieria Civil",
-        "asignaturas": "Estructuras, AutoCAD, Hormigón Armado, Topografía",
-        "soft_skills": [4, 3, 3, 4, 4, 4, 3],
-        "top_n": 3
-    }
+    payload = PAYLOAD3_DICT
     
     print("Request:")
     print(f"  Carrera: {payload['carrera']}")
@@ -212,74 +374,84 @@ def test_prediction_example3():
     print(f"  Soft Skills: {payload['soft_skills']}")
     print(f"  Top N: {payload['top_n']}\n")
     
-    try:
-        response = requests.post(f"{BASE_URL}/predict", json=payload)
-        data = response.json()
+    if data is None:
+        data = _post_prediction(payload, PAYLOAD3)
+    
+    if data['success']:
+        print_success("Recomendaciones obtenidas")
+        resultado = data['data']
+        print(f"\nCarrera: {resultado['carrera']}")
+        print(f"Recomendaciones: {resultado['num_recomendaciones']}\n")
         
-        if data['success']:
-            print_success("Recomendaciones obtenidas")
-            resultado = data['data']
-            print(f"\nCarrera: {resultado['carrera']}")
-            print(f"Recomendaciones: {resultado['num_recomendaciones']}\n")
-            
-            for rec in resultado['recomendaciones']:
-                print(f"  Rank {rec['rank']}: {rec['cargo']}")
-                print(f"    Similitud: {rec['similitud']:.4f}")
-                print()
-        else:
-            print_error(f"Error: {data['message']}")
-    except Exception as e:
-        print_error(f"Error: {e}")
+        _render_recommendations(resultado['recomendaciones'])
+    else:
+        print_error(f"Error: {data['message']}")
+
+
+def soft_skills_error(soft_skills) -> Optional[str]:
+    """The server's soft_skills check, run locally: the error message, or None if the list is valid"""
+    if not isinstance(soft_skills, list):
+        return "Soft skills must be a list"
+    if len(soft_skills) != 7:
+        return f"Soft skills must have exactly 7 values, got {len(soft_skills)}"
+    for i, rating in enumerate(soft_skills):
+        if not isinstance(rating, (int, float)):
+            return f"Soft skill {i} must be a number, got {type(rating)}"
+        if not 1 <= int(rating) <= 5:
+            return f"Soft skill {i} must be between 1 and 5, got {int(rating)}"
+    return None
+
+
+def _post_prediction(payload: Dict[str, Any], body: bytes) -> Dict[str, Any]:
+    """/predict response body, or a local error body (no request) if soft_skills would be rejected"""
+    error = soft_skills_error(payload.get('soft_skills'))
+    if error is not None:
+        return {'success': False, 'message': error}
+    return _json(SESSION.post(URL_PREDICT, data=body, headers=JSON_HEADERS))
+
+
+def fetch_prediction_batch():
+    """Bodies of the three prediction examples from one /predict/batch call, or None if it is unavailable"""
+    try:
+        response = SESSION.post(URL_PREDICT_BATCH, data=PREDICT_BATCH_PAYLOAD, headers=JSON_HEADERS)
+        if response.status_code == 404:
+            return None
+        results = _json(response)['data']['results']
+        return results if len(results) == 3 else None
+    except Exception:
+        return None
+
+
+def fetch_meta():
+    """Bodies of tests 1-4 from one /meta call (same shape as their own endpoints), or None if it is unavailable"""
+    try:
+        response = SESSION.get(URL_META)
+        if response.status_code != 200:
+            return None
+        meta = _json(response)['data']
+        return [{'success': True, 'data': meta[key]} for key in ('health', 'careers', 'soft_skills_labels', 'info')]
+    except Exception:
+        return None
 
 
 def test_error_handling():
     """Test 8: Error handling"""
     print_header("TEST 8: Manejo de Errores")
     
-    # Test 8a: Invalid career
-    print("\n[8a] Carrera inválida:")
-    try:
-        response = requests.post(f"{BASE_URL}/predict", json={
-            "carrera": "Carrera Inexistente",
-            "soft_skills": [1, 1, 1, 1, 1, 1, 1]
-        })
-        data = response.json()
-        if not data['success']:
-            print_success(f"Error capturado: {data['message'][:60]}...")
-        else:
-            print_error("Se debería haber producido un error")
-    except Exception as e:
-        print_error(f"Error: {e}")
-    
-    # Test 8b: Invalid soft skills
-    print("\n[8b] Soft skills inválidos (6 en lugar de 7):")
-    try:
-        response = requests.post(f"{BASE_URL}/predict", json={
-            "carrera": "Ingenieria En Software",
-            "soft_skills": [1, 1, 1, 1, 1, 1]  # Solo 6
-        })
-        data = response.json()
-        if not data['success']:
-            print_success(f"Error capturado: {data['message']}")
-        else:
-            print_error("Se debería haber producido un error")
-    except Exception as e:
-        print_error(f"Error: {e}")
-    
-    # Test 8c: Invalid soft skill value
-    print("\n[8c] Valor de soft skill fuera de rango (6):")
-    try:
-        response = requests.post(f"{BASE_URL}/predict", json={
-            "carrera": "Ingenieria En Software",
-            "soft_skills": [1, 2, 3, 4, 5, 6, 1]  # 6 es inválido
-        })
-        data = response.json()
-        if not data['success']:
-            print_success(f"Error capturado: {data['message']}")
-        else:
-            print_error("Se debería haber producido un error")
-    except Exception as e:
-        print_error(f"Error: {e}")
+    for label, body, max_len in ERROR_CASES:
+        print(f"\n{label}:")
+        try:
+            response = SESSION.post(URL_PREDICT, data=body, headers=JSON_HEADERS)
+            data = _json(response)
+            if not data['success']:
+                message = data['message']
+                if max_len is not None:
+                    message = f"{message[:max_len]}..."
+                print_success(f"Error capturado: {message}")
+            else:
+                print_error("Se debería haber producido un error")
+        except Exception as e:
+            print_error(f"Error: {e}")
 
 
 def run_all_tests():
@@ -289,7 +461,7 @@ def run_all_tests():
     
     try:
         # Connectivity check
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
+        response = SESSION.get(URL_HEALTH, timeout=5)
         print_success("Servidor conectado")
     except Exception as e:
         print_error(f"No se puede conectar al servidor: {e}")
@@ -297,15 +469,31 @@ def run_all_tests():
         print("  python run.py\n")
         return
     
-    # Run tests
-    test_health_check()
-    test_get_careers()
-    test_get_soft_skills_labels()
-    test_api_info()
-    test_prediction_example1()
-    test_prediction_example2()
-    test_prediction_example3()
-    test_error_handling()
+    # Calentamiento: la primera predicción tras arrancar paga la carga de datos y
+    # modelos del worker; los tests siguientes miden el servidor ya en caliente
+    # (el GET a /health ya se hizo en la comprobación de conexión)
+    try:
+        SESSION.post(URL_PREDICT, data=WARMUP_PAYLOAD, headers=JSON_HEADERS)
+    except Exception:
+        pass
+    
+    # Run tests: los GET y las predicciones son independientes entre sí y se lanzan
+    # en paralelo (la salida se imprime en el orden de siempre, una escritura por test)
+    meta_tests = [test_health_check, test_get_careers, test_get_soft_skills_labels, test_api_info]
+    # Los metadatos de los tests 1-4 en un solo request; si el servidor no tiene /meta
+    # (o se pide --full), cada test consulta su propio endpoint
+    meta = None if '--full' in sys.argv[1:] else fetch_meta()
+    if meta is not None:
+        meta_tests = [functools.partial(fn, result) for fn, result in zip(meta_tests, meta)]
+    run_tests(meta_tests)
+    prediction_tests = [test_prediction_example1, test_prediction_example2, test_prediction_example3]
+    # Las tres predicciones en un solo request; si el servidor no tiene /predict/batch,
+    # cada test hace su propia petición
+    batch = fetch_prediction_batch()
+    if batch is not None:
+        prediction_tests = [functools.partial(fn, result) for fn, result in zip(prediction_tests, batch)]
+    run_tests(prediction_tests)
+    run_tests([test_error_handling])
     
     print_header("RESUMEN")
     print_success("Todos los tests completados")